@@ -0,0 +1,137 @@
+import copy
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+
+class AsyncLearner:
+    """
+    actor / learner 분리를 위한 백그라운드 학습 스레드
+    - 환경 루프는 remember()로 transition을 thread-safe 큐에 넣기만 함
+    - 학습 스레드가 큐를 replay memory로 옮기고, update-to-data 비율에 맞춰 gradient step을 계속 수행
+    - 정책 가중치는 게시할 때마다 새 복사본을 만들어 참조만 교체 (copy-on-publish):
+      게시된 복사본은 이후 수정되지 않으므로 actor는 잠금 없이 agent.actor_net으로 행동을 선택
+    - 학습 스레드에서 예외가 나면 보관했다가 remember / paused / stop에서 다시 발생
+    DQNAgent와 같은 remember / update / update_target 형태로 train.py에서 그대로 사용 가능
+    """
+    def __init__(self, agent, update_to_data_ratio=1.0, publish_interval=10):
+        """
+        :param agent: DQNAgent (replay memory, q_net, target_net은 학습 스레드만 사용)
+        :param update_to_data_ratio: 수집한 transition 1개당 gradient step 수
+        :param publish_interval: 정책 가중치를 actor에 게시하는 주기 (gradient step 기준)
+        """
+        self.agent = agent
+        self.update_to_data_ratio = update_to_data_ratio
+        self.publish_interval = publish_interval
+
+        self.transitions = 0
+        self.steps = 0
+        self._queue = queue.Queue()
+        self._stop_event = threading.Event()
+        self._target_requested = False
+        self._step_lock = threading.Lock()  # 학습 스레드의 한 반복 / paused() 구간을 상호 배제
+        self._pause_requested = threading.Event()
+        self._error = None
+        self.published_version = 0  # 게시 횟수 (actor_net이 바뀔 때마다 증가)
+
+        self._publish()
+
+        self._thread = threading.Thread(target=self._run, name="AsyncLearner", daemon=True)
+        self._thread.start()
+
+    # ─── Actor-side API ───
+
+    def remember(self, state, action, reward, next_state):
+        """transition을 학습 큐에 추가 (즉시 반환)"""
+        self._raise_learner_error()
+        self._queue.put((state, action, reward, next_state))
+
+    def update(self):
+        """학습은 백그라운드 스레드에서 진행되므로 호출 시점에는 아무 것도 하지 않음"""
+        pass
+
+    def update_target(self):
+        """타겟 네트워크 동기화를 학습 스레드에 요청"""
+        self._target_requested = True
+
+    def stop(self):
+        """남은 transition을 memory로 옮기고 학습 스레드 종료. 이후 actor는 q_net을 직접 사용"""
+        self._stop_event.set()
+        self._thread.join()
+        self.agent.actor_net = self.agent.q_net
+        self._raise_learner_error()
+        self._drain(block=False)
+        if self._target_requested:
+            self.agent.update_target()
+            self._target_requested = False
+
+    @contextmanager
+    def paused(self):
+        """학습 스레드를 멈추고 큐에 남은 transition을 memory로 옮긴 상태의 agent 제공 (체크포인트용)"""
+        self._raise_learner_error()
+        self._pause_requested.set()
+        try:
+            with self._step_lock:
+                self._raise_learner_error()
+                self._drain(block=False)
+                if self._target_requested:
+                    self._target_requested = False
+                    self.agent.update_target()
+                yield self.agent
+        finally:
+            self._pause_requested.clear()
+
+    # ─── Learner Thread ───
+
+    def _has_work(self):
+        return (len(self.agent.memory) >= self.agent.batch_size
+                and self.steps < self.update_to_data_ratio * self.transitions)
+
+    def _drain(self, block):
+        try:
+            item = self._queue.get(timeout=0.05) if block else self._queue.get_nowait()
+        except queue.Empty:
+            return
+        while True:
+            self.agent.remember(*item)
+            self.transitions += 1
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+    def _raise_learner_error(self):
+        if self._error is not None:
+            raise RuntimeError("AsyncLearner thread failed; the policy is no longer being trained.") from self._error
+
+    def _publish(self):
+        """최신 가중치의 새 복사본을 만들어 참조만 교체 (actor가 쓰고 있을 수 있는 이전 복사본은 건드리지 않음)"""
+        net = copy.deepcopy(self.agent.q_net).eval()
+        for param in net.parameters():
+            param.grad = None
+            param.requires_grad_(False)
+        self.agent.actor_net = net
+        self.published_version += 1
+
+    def _run(self):
+        try:
+            self._learn()
+        except Exception as e:
+            self._error = e
+
+    def _learn(self):
+        while not self._stop_event.is_set():
+            if self._pause_requested.is_set():
+                time.sleep(0.001)  # paused()가 lock을 잡을 수 있도록 양보
+                continue
+            with self._step_lock:
+                self._drain(block=not self._has_work())
+                if self._target_requested:
+                    self._target_requested = False
+                    self.agent.update_target()
+                if self._has_work():
+                    self.agent.update()
+                    self.steps += 1
+                    if self.steps % self.publish_interval == 0:
+                        self._publish()
@@ -4,8 +4,12 @@ import torch.nn as nn
 import torch.nn.functional as F
 import torch.optim as optim
 import random
+import numpy as np
 from buffer.replay_buffer import ReplayBuffer
+from buffer.prioritized_replay_buffer import PrioritizedReplayBuffer
+from buffer.segment_store import SegmentReplayStore
 from agent.base_agent import BaseAgent
+from utils.profiler import profiled
 
 # QNetwork: Q값을 추정하는 심층 신경망
 class QNetwork(nn.Module):
@@ -26,8 +30,9 @@ class DQNAgent(BaseAgent):
                  gamma=DEFAULT_HYPERPARAMS["Gamma"],
                  epsilon=DEFAULT_HYPERPARAMS["Epsilon"],
                  lr=DEFAULT_HYPERPARAMS["LearningRate"],
-                 memory_capacity=10000, batch_size=DEFAULT_HYPERPARAMS["BatchSize"],
-                 target_update_freq=1000):
+                 memory_capacity=DEFAULT_HYPERPARAMS["MemoryCapacity"], batch_size=DEFAULT_HYPERPARAMS["BatchSize"],
+                 target_update_freq=1000, prioritized=bool(DEFAULT_HYPERPARAMS["PrioritizedReplay"]),
+                 per_alpha=0.6, per_beta=0.4, seed=None, replay_store=None):
         """
         :param state_dim: 상태 벡터 차원
         :param action_dim: 행동 공간 크기
@@ -37,15 +42,31 @@ class DQNAgent(BaseAgent):
         :param memory_capacity: replay buffer 용량
         :param batch_size: 배치 학습 크기
         :param target_update_freq: 타겟 네트워크 업데이트 주기 (스텝 기준)
+        :param prioritized: True이면 우선순위 경험 재생(PER) 사용
+        :param per_alpha: PER 우선순위 지수
+        :param per_beta: PER importance-sampling 보정 초기값
+        :param seed: (선택적) replay buffer 샘플링 난수 시드
+        :param replay_store: (선택적) 디스크 replay 저장소 폴더. 지정하면 memory_capacity 대신
+                             SegmentReplayStore에 모든 transition을 누적 (실행 간 공유)
         """
         # 네트워크 및 옵티마이저 초기화
         self.q_net = QNetwork(state_dim, action_dim)
         self.target_net = QNetwork(state_dim, action_dim)
         self.target_net.load_state_dict(self.q_net.state_dict())
         self.optimizer = optim.Adam(self.q_net.parameters(), lr=lr)
+        # 행동 선택에 사용하는 네트워크 (AsyncLearner가 학습 중인 q_net 대신 게시된 복사본으로 교체)
+        self.actor_net = self.q_net
 
         # Replay Buffer
-        self.memory = ReplayBuffer(memory_capacity)
+        self.prioritized = prioritized
+        if replay_store is not None:
+            if prioritized:
+                raise ValueError("Prioritized replay keeps its sum tree in memory; it cannot use replay_store.")
+            self.memory = SegmentReplayStore(replay_store, state_dim, seed=seed)
+        elif prioritized:
+            self.memory = PrioritizedReplayBuffer(memory_capacity, state_dim, alpha=per_alpha, beta=per_beta, seed=seed)
+        else:
+            self.memory = ReplayBuffer(memory_capacity, state_dim, seed=seed)
         self.batch_size = batch_size
         self.target_update_freq = target_update_freq
         self.learn_step_counter = 0
@@ -65,32 +86,49 @@ class DQNAgent(BaseAgent):
         if lr is not None:
             self.optimizer = optim.Adam(self.q_net.parameters(), lr=lr)
 
+    @profiled("agent.select_action")
     def select_action(self, state):
         """
         ε-greedy로 행동 선택
-        :param state: 상태 벡터 (list or np.array)
-        :return: 선택된 행동 인덱스
+        :param state: 상태 벡터 (list or np.array) 또는 [N, state_dim] 배치
+        :return: 선택된 행동 인덱스 (배치 입력이면 길이 N의 np.ndarray)
         """
+        if np.ndim(state) == 2:
+            return self._select_actions(state)
         if random.random() < self.epsilon:
             return random.randint(0, self.action_dim - 1)
         state_tensor = torch.FloatTensor(state).unsqueeze(0)
         with torch.no_grad():
-            q_values = self.q_net(state_tensor)
+            q_values = self.actor_net(state_tensor)
         return q_values.argmax().item()
 
+    def _select_actions(self, states):
+        """배치 상태에 대해 한 번의 forward pass로 ε-greedy 행동 선택"""
+        states_tensor = torch.as_tensor(np.asarray(states, dtype=np.float32))
+        with torch.no_grad():
+            actions = self.actor_net(states_tensor).argmax(1).numpy()
+        explore = np.random.random(len(actions)) < self.epsilon
+        actions[explore] = np.random.randint(0, self.action_dim, explore.sum())
+        return actions
+
     def remember(self, state, action, reward, next_state):
         """replay buffer에 transition 저장"""
         self.memory.push(state, action, reward, next_state)
 
+    @profiled("agent.update")
     def update(self):
         """batch 학습: replay buffer에서 샘플링 후 네트워크 업데이트"""
         if len(self.memory) < self.batch_size:
             return
-        states, actions, rewards, next_states = self.memory.sample(self.batch_size)
-        states = torch.FloatTensor(states)
-        actions = torch.LongTensor(actions).unsqueeze(1)
-        rewards = torch.FloatTensor(rewards)
-        next_states = torch.FloatTensor(next_states)
+        if self.prioritized:
+            states, actions, rewards, next_states, indices, weights = self.memory.sample(self.batch_size)
+        else:
+            states, actions, rewards, next_states = self.memory.sample(self.batch_size)
+        # 샘플은 contiguous NumPy 배열이므로 복사 없이 텐서로 변환
+        states = torch.from_numpy(states)
+        actions = torch.from_numpy(actions).unsqueeze(1)
+        rewards = torch.from_numpy(rewards)
+        next_states = torch.from_numpy(next_states)
 
         # 현재 Q값
         q_values = self.q_net(states).gather(1, actions).squeeze()
@@ -99,7 +137,13 @@ class DQNAgent(BaseAgent):
             max_next_q = self.target_net(next_states).max(1)[0]
             target_q = rewards + self.gamma * max_next_q
 
-        loss = F.mse_loss(q_values, target_q)
+        if self.prioritized:
+            # importance-sampling 가중치로 보정한 손실, TD error로 우선순위 갱신
+            td_errors = target_q - q_values
+            loss = (torch.from_numpy(weights) * td_errors.pow(2)).mean()
+            self.memory.update_priorities(indices, td_errors.detach().numpy())
+        else:
+            loss = F.mse_loss(q_values, target_q)
         self.optimizer.zero_grad()
         loss.backward()
         self.optimizer.step()
@@ -115,3 +159,27 @@ class DQNAgent(BaseAgent):
 
     def save_model(self, filepath):
         torch.save(self.q_net.state_dict(), filepath)
+
+    def close(self):
+        """(replay_store 사용 시) 남은 기록을 저장소 인덱스에 반영"""
+        if isinstance(self.memory, SegmentReplayStore):
+            self.memory.flush()
+
+    def state_dict(self):
+        """체크포인트용 학습 상태 (replay memory는 memory.dump로 따로 저장)"""
+        return {
+            "q_net": self.q_net.state_dict(),
+            "target_net": self.target_net.state_dict(),
+            "optimizer": self.optimizer.state_dict(),
+            "learn_step_counter": self.learn_step_counter,
+            "epsilon": self.epsilon,
+            "gamma": self.gamma,
+        }
+
+    def load_state_dict(self, state):
+        self.q_net.load_state_dict(state["q_net"])
+        self.target_net.load_state_dict(state["target_net"])
+        self.optimizer.load_state_dict(state["optimizer"])
+        self.learn_step_counter = state["learn_step_counter"]
+        self.epsilon = state["epsilon"]
+        self.gamma = state["gamma"]
@@ -0,0 +1,121 @@
+import os
+
+import numpy as np
+
+from buffer.replay_buffer import ReplayBuffer
+
+
+class SumTree:
+    """
+    배열 기반 segment(sum) tree
+    - tree[1]이 루트, 리프는 tree[leaf_start : leaf_start + capacity]
+    - 우선순위 갱신과 누적합 탐색 모두 O(log n)이며 배치 단위로 벡터화
+    """
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._leaf_start = 1 << max(capacity - 1, 1).bit_length()
+        self.tree = np.zeros(2 * self._leaf_start, dtype=np.float64)
+
+    def total(self) -> float:
+        return float(self.tree[1])
+
+    def get(self, indices):
+        return self.tree[np.asarray(indices) + self._leaf_start]
+
+    def update(self, indices, priorities):
+        """리프 우선순위 갱신 후 변경된 경로만 루트까지 다시 합산"""
+        idx = np.asarray(indices, dtype=np.int64) + self._leaf_start
+        self.tree[idx] = priorities
+        idx = np.unique(idx // 2)
+        while idx[0] >= 1:
+            self.tree[idx] = self.tree[2 * idx] + self.tree[2 * idx + 1]
+            idx = np.unique(idx // 2)
+
+    def find(self, values):
+        """
+        누적합이 values에 도달하는 리프 인덱스 탐색 (비례 샘플링)
+        :param values: [0, total) 범위의 값 배열
+        :return: 데이터 인덱스 배열
+        """
+        values = np.array(values, dtype=np.float64)
+        idx = np.ones(len(values), dtype=np.int64)
+        while idx[0] < self._leaf_start:
+            left = 2 * idx
+            left_sum = self.tree[left]
+            go_right = values > left_sum
+            values = np.where(go_right, values - left_sum, values)
+            idx = np.where(go_right, left + 1, left)
+        return idx - self._leaf_start
+
+
+class PrioritizedReplayBuffer(ReplayBuffer):
+    """
+    비례(proportional) 우선순위 경험 재생 버퍼
+    - 저장소는 ReplayBuffer의 NumPy ring buffer를 그대로 사용
+    - 우선순위는 (|TD error| + eps) ** alpha로 SumTree에 저장
+    - 샘플 시 importance-sampling 가중치 (N * P(i)) ** -beta 를 함께 반환
+    """
+    def __init__(self, capacity: int, state_dim: int, alpha=0.6, beta=0.4, beta_increment=1e-4,
+                 eps=1e-6, seed=None):
+        """
+        :param capacity: 최대 저장 transition 수
+        :param state_dim: 상태 벡터 차원
+        :param alpha: 우선순위 반영 정도 (0이면 균등 샘플링)
+        :param beta: importance-sampling 보정 초기값 (샘플마다 1까지 증가)
+        :param beta_increment: 샘플 호출당 beta 증가량
+        :param eps: 우선순위가 0이 되지 않도록 더하는 값
+        :param seed: (선택적) 샘플링 난수 시드
+        """
+        super().__init__(capacity, state_dim, seed=seed)
+        self.alpha = alpha
+        self.beta = beta
+        self.beta_increment = beta_increment
+        self.eps = eps
+        self.tree = SumTree(capacity)
+        self._max_priority = 1.0
+
+    def push(self, state, action, reward, next_state):
+        """새 transition은 현재 최대 우선순위로 저장하여 최소 한 번은 학습되도록 함"""
+        index = self._pos
+        super().push(state, action, reward, next_state)
+        self.tree.update([index], self._max_priority ** self.alpha)
+
+    def sample(self, batch_size: int):
+        """
+        우선순위에 비례하여 구간별(stratified) 샘플링
+        :return: (states, actions, rewards, next_states, indices, weights)
+        """
+        total = self.tree.total()
+        segment = total / batch_size
+        values = (np.arange(batch_size) + self._rng.random(batch_size)) * segment
+        idx = np.minimum(self.tree.find(values), self._size - 1)
+
+        probs = self.tree.get(idx) / total
+        weights = (self._size * probs) ** (-self.beta)
+        weights = (weights / weights.max()).astype(np.float32)
+        self.beta = min(1.0, self.beta + self.beta_increment)
+
+        return self.states[idx], self.actions[idx], self.rewards[idx], self.next_states[idx], idx, weights
+
+    def update_priorities(self, indices, td_errors):
+        """
+        학습 후 TD error로 샘플들의 우선순위를 일괄 갱신
+        :param indices: sample에서 반환된 인덱스 배열
+        :param td_errors: 인덱스별 TD error 배열
+        """
+        priorities = np.abs(np.asarray(td_errors, dtype=np.float64)) + self.eps
+        self._max_priority = max(self._max_priority, float(priorities.max()))
+        self.tree.update(indices, priorities ** self.alpha)
+
+    def dump(self, dirpath):
+        """ring buffer 배열과 함께 우선순위 트리 전체 저장 (학습 중 임의 위치가 갱신되므로 증분 없이 덮어씀)"""
+        meta = super().dump(dirpath)
+        np.save(os.path.join(dirpath, "priorities.npy"), self.tree.tree)
+        meta.update(beta=self.beta, max_priority=self._max_priority)
+        return meta
+
+    def restore(self, dirpath, meta):
+        super().restore(dirpath, meta)
+        self.tree.tree[:] = np.load(os.path.join(dirpath, "priorities.npy"))
+        self.beta = meta["beta"]
+        self._max_priority = meta["max_priority"]
@@ -1,29 +1,117 @@
-import random
+import os
+
 import numpy as np
-from collections import deque
+
+# 체크포인트에 .npy 파일로 저장하는 ring buffer 배열
+MEMORY_ARRAYS = ("states", "actions", "rewards", "next_states")
+
 
 class ReplayBuffer:
-    def __init__(self, capacity: int):
-        self.buffer = deque(maxlen=capacity)
+    """
+    미리 할당한 연속 NumPy 배열 기반 ring buffer
+    - states / next_states: float32 [capacity, state_dim]
+    - actions: int64, rewards: float32 [capacity]
+    - 샘플 결과는 contiguous 배열이므로 torch.from_numpy로 복사 없이 텐서 변환 가능
+    - dump / restore: 배열마다 .npy 파일 하나에 저장. 같은 폴더에 다시 dump하면 그 폴더의 직전 dump 이후
+      바뀐 행만 메모리 맵으로 덮어씀 (처음 쓰는 폴더는 전체 기록)
+    """
+    def __init__(self, capacity: int, state_dim: int, seed=None):
+        """
+        :param capacity: 최대 저장 transition 수
+        :param state_dim: 상태 벡터 차원
+        :param seed: (선택적) 샘플링 난수 시드
+        """
+        self.capacity = capacity
+        self.state_dim = state_dim
+        self.states = np.zeros((capacity, state_dim), dtype=np.float32)
+        self.actions = np.zeros(capacity, dtype=np.int64)
+        self.rewards = np.zeros(capacity, dtype=np.float32)
+        self.next_states = np.zeros((capacity, state_dim), dtype=np.float32)
+        self._pos = 0
+        self._size = 0
+        self._total = 0         # 지금까지 push된 transition 수
+        self._dumped = {}       # dump 폴더 → 그 폴더에 마지막으로 dump한 시점의 _total
+        self.last_dump_dir = None
+        self._rng = np.random.default_rng(seed)
 
     def push(self, state, action, reward, next_state):
         """
-        buffer에 transition 저장
+        buffer에 transition 저장 (가득 차면 가장 오래된 항목을 덮어씀)
         :param state: 현재 상태
         :param action: 수행한 행동
         :param reward: 보상
         :param next_state: 다음 상태
         """
-        self.buffer.append((state, action, reward, next_state))
+        i = self._pos
+        self.states[i] = state
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_states[i] = next_state
+        self._pos = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        self._total += 1
 
     def sample(self, batch_size: int):
         """
-        무작위로 batch_size 만큼 샘플링
-        :return: (states, actions, rewards, next_states)
+        무작위로 batch_size 만큼 중복 없이 샘플링
+        :return: (states, actions, rewards, next_states) NumPy 배열
         """
-        batch = random.sample(self.buffer, batch_size)
-        states, actions, rewards, next_states = zip(*batch)
-        return states, actions, rewards, next_states
+        idx = self._rng.choice(self._size, batch_size, replace=False)
+        return self.states[idx], self.actions[idx], self.rewards[idx], self.next_states[idx]
 
     def __len__(self):
-        return len(self.buffer)
\ No newline at end of file
+        return self._size
+
+    # ─── Checkpoint ───
+
+    def _dirty_rows(self, start):
+        """_total이 start였던 시점 이후 덮어쓴 ring 위치 (slice 리스트, start가 None이면 전체)"""
+        end = self._total
+        if start is None or end - start >= self.capacity:
+            return [slice(0, self.capacity)]
+        first, last = start % self.capacity, end % self.capacity
+        if first <= last:
+            return [slice(first, last)]
+        return [slice(first, self.capacity), slice(0, last)]
+
+    def dump(self, dirpath):
+        """
+        배열을 dirpath/<이름>.npy에 저장 (기존 파일은 메모리 맵으로 열어 바뀐 행만 기록)
+        :return: restore에 넘길 메타데이터 dict
+        """
+        dirpath = os.path.abspath(dirpath)
+        os.makedirs(dirpath, exist_ok=True)
+        dirty = self._dirty_rows(self._dumped.get(dirpath))
+        for name in MEMORY_ARRAYS:
+            array = getattr(self, name)
+            path = os.path.join(dirpath, f"{name}.npy")
+            rows = dirty
+            target = np.load(path, mmap_mode="r+") if os.path.exists(path) else None
+            if target is None or target.shape != array.shape or target.dtype != array.dtype:
+                target = np.lib.format.open_memmap(path, mode="w+", dtype=array.dtype, shape=array.shape)
+                rows = [slice(0, self.capacity)]
+            for row in rows:
+                target[row] = array[row]
+            target.flush()
+            del target
+        self._dumped[dirpath] = self._total
+        self.last_dump_dir = dirpath
+        return {"capacity": self.capacity, "state_dim": self.state_dim, "pos": self._pos, "size": self._size,
+                "total": self._total, "rng": self._rng.bit_generator.state}
+
+    def restore(self, dirpath, meta):
+        """dump로 저장한 배열과 메타데이터로 buffer 복원 (저장된 행만 메모리 맵에서 복사)"""
+        if (meta["capacity"], meta["state_dim"]) != (self.capacity, self.state_dim):
+            raise ValueError(f"Checkpoint memory has capacity={meta['capacity']}, state_dim={meta['state_dim']}; "
+                             f"expected capacity={self.capacity}, state_dim={self.state_dim}.")
+        size = meta["size"]
+        for name in MEMORY_ARRAYS:
+            source = np.load(os.path.join(dirpath, f"{name}.npy"), mmap_mode="r")
+            getattr(self, name)[:size] = source[:size]
+            del source
+        self._pos = meta["pos"]
+        self._size = size
+        self._total = meta["total"]
+        self.last_dump_dir = os.path.abspath(dirpath)
+        self._dumped = {self.last_dump_dir: self._total}
+        self._rng.bit_generator.state = meta["rng"]
@@ -0,0 +1,151 @@
+import json
+import os
+
+import numpy as np
+
+INDEX_FILE = "index.json"
+
+
+def record_dtype(state_dim):
+    """transition 한 건의 고정 폭 레코드 형식 (state, action, reward, next_state)"""
+    return np.dtype([("state", np.float32, (state_dim,)), ("action", np.int64),
+                     ("reward", np.float32), ("next_state", np.float32, (state_dim,))])
+
+
+class SegmentReplayStore:
+    """
+    디스크 기반 추가 전용(append-only) replay 저장소
+    - transition은 고정 폭 레코드로 segment 파일(seg-NNNNN.bin, segment_rows개씩)에 이어서 기록
+    - segment는 메모리 맵으로 열므로 전체를 RAM에 올리지 않고, i번째 레코드는 (i // segment_rows, i % segment_rows)로 O(1) 접근
+    - 샘플은 segment별로 묶어 행 순서대로 읽으므로 페이지 캐시 / read-ahead를 잘 활용
+    - 기록된 레코드 수는 index.json에 저장: 실행이 끝나도 유지되어 다음 학습에서 이어서 사용하고,
+      다른 프로세스는 read_only=True로 열어 refresh()로 새 기록을 반영
+    - 쓰기는 한 프로세스만 수행 (동시 쓰기는 지원하지 않음)
+    ReplayBuffer와 같은 push / sample / __len__ / dump / restore 제공 (가득 차도 덮어쓰지 않음)
+    """
+    def __init__(self, root, state_dim, segment_rows=1 << 20, flush_every=4096, read_only=False, seed=None):
+        """
+        :param root: 저장소 폴더 (없으면 생성)
+        :param state_dim: 상태 벡터 차원 (기존 저장소와 다르면 오류)
+        :param segment_rows: segment 파일 하나의 레코드 수 (기존 저장소는 저장된 값 사용)
+        :param flush_every: 인덱스를 기록하는 push 간격
+        :param read_only: True이면 샘플만 가능 (다른 프로세스가 쓰는 저장소 공유용)
+        :param seed: (선택적) 샘플링 난수 시드
+        """
+        self.root = root
+        self.state_dim = state_dim
+        self.read_only = read_only
+        self.flush_every = flush_every
+        self.dtype = record_dtype(state_dim)
+        self._segments = []
+        self._rng = np.random.default_rng(seed)
+        self.last_dump_dir = None
+
+        index = self._read_index()
+        if index is None:
+            if read_only:
+                raise FileNotFoundError(f"No replay store in '{root}' ({INDEX_FILE} is missing).")
+            os.makedirs(root, exist_ok=True)
+            self.segment_rows = segment_rows
+            self._count = 0
+            self._write_index()
+        else:
+            if index["state_dim"] != state_dim:
+                raise ValueError(f"Replay store '{root}' holds state_dim={index['state_dim']}; "
+                                 f"expected {state_dim}.")
+            self.segment_rows = index["segment_rows"]
+            self._count = index["count"]
+        self._flushed = self._count
+
+    # ─── Index ───
+
+    def _read_index(self):
+        path = os.path.join(self.root, INDEX_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def _write_index(self):
+        path = os.path.join(self.root, INDEX_FILE)
+        with open(path + ".tmp", "w") as f:
+            json.dump({"state_dim": self.state_dim, "segment_rows": self.segment_rows, "count": self._count}, f)
+        os.replace(path + ".tmp", path)
+
+    def flush(self):
+        """기록한 레코드를 디스크에 내보낸 뒤 인덱스의 레코드 수 갱신 (읽는 쪽은 인덱스에 있는 레코드만 사용)"""
+        if self.read_only or self._flushed == self._count:
+            return
+        for segment in self._segments[self._flushed // self.segment_rows:]:
+            segment.flush()
+        self._write_index()
+        self._flushed = self._count
+
+    def refresh(self):
+        """(read_only) 쓰는 프로세스가 인덱스에 반영한 새 레코드까지 샘플 대상에 포함"""
+        self._count = self._read_index()["count"]
+
+    # ─── Segments ───
+
+    def _segment(self, k):
+        """k번째 segment 메모리 맵 (처음 쓸 때 segment_rows 크기로 생성)"""
+        while len(self._segments) <= k:
+            path = os.path.join(self.root, f"seg-{len(self._segments):05d}.bin")
+            if self.read_only:
+                mode = "r"
+            else:
+                mode = "r+" if os.path.exists(path) else "w+"
+            self._segments.append(np.memmap(path, dtype=self.dtype, mode=mode, shape=(self.segment_rows,)))
+        return self._segments[k]
+
+    def push(self, state, action, reward, next_state):
+        if self.read_only:
+            raise RuntimeError("Replay store was opened read-only.")
+        k, row = divmod(self._count, self.segment_rows)
+        self._segment(k)[row] = (state, action, reward, next_state)
+        self._count += 1
+        if self._count - self._flushed >= self.flush_every:
+            self.flush()
+
+    def read(self, indices):
+        """
+        레코드 일괄 읽기: 인덱스를 정렬해 segment별로 한 번씩 fancy indexing
+        :return: 정렬된 인덱스 순서의 레코드 배열
+        """
+        indices = np.sort(np.asarray(indices, dtype=np.int64))
+        segment_ids = indices // self.segment_rows
+        bounds = np.flatnonzero(np.diff(segment_ids)) + 1
+        parts = [self._segment(int(group[0] // self.segment_rows))[group % self.segment_rows]
+                 for group in np.split(indices, bounds)]
+        return np.concatenate(parts) if len(parts) > 1 else parts[0]
+
+    def sample(self, batch_size: int):
+        """
+        저장된 전체 레코드에서 batch_size 만큼 중복 없이 샘플링
+        :return: (states, actions, rewards, next_states) contiguous NumPy 배열
+        """
+        records = self.read(self._rng.choice(self._count, batch_size, replace=False))
+        return (np.ascontiguousarray(records["state"]), np.ascontiguousarray(records["action"]),
+                np.ascontiguousarray(records["reward"]), np.ascontiguousarray(records["next_state"]))
+
+    def __len__(self):
+        return self._count
+
+    # ─── Checkpoint ───
+
+    def dump(self, dirpath):
+        """
+        레코드는 저장소에 이미 있으므로 인덱스만 갱신 (dirpath에는 쓰지 않음)
+        :return: restore에 넘길 메타데이터 dict
+        """
+        self.flush()
+        self.last_dump_dir = os.path.abspath(dirpath)
+        return {"store": os.path.abspath(self.root), "count": self._count, "rng": self._rng.bit_generator.state}
+
+    def restore(self, dirpath, meta):
+        """
+        샘플링 난수 상태만 복원
+        추가 전용 저장소이므로 체크포인트 이후에 쌓인 레코드도 지우지 않고 그대로 사용
+        """
+        self._rng.bit_generator.state = meta["rng"]
+        self.last_dump_dir = os.path.abspath(dirpath)
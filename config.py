@@ -3,10 +3,28 @@ DEFAULT_HYPERPARAMS = {
     "Epsilon": 0.1,
     "Gamma": 0.99,
     "BatchSize": 64,
-    "LearningRate": 0.001
+    "LearningRate": 0.001,
+    "MemoryCapacity": 100000,
+    "PrioritizedReplay": 0,     # 1이면 우선순위 경험 재생(PER) 사용
+    "AsyncLearner": 0,          # 1이면 백그라운드 학습 스레드에서 gradient step 수행
+    "UpdateToDataRatio": 1.0    # AsyncLearner 사용 시 transition 1개당 gradient step 수
 }
 
 DEFAULT_SIM_PARAMS = {
     "OrderInterval": 200,
-    "RealtimeScale": 10
-}
\ No newline at end of file
+    "RealtimeScale": 10,
+    "Backend": "plantsim",  # "plantsim" 또는 "des" (Plant Simulation 없이 실행하는 대체 시뮬레이터)
+    "NumEnvs": 1,           # 병렬 시뮬레이터 개수 (1보다 크면 VecSimulationEnvironment 사용)
+    "DistanceFeatures": 0,  # 1이면 AMS별 픽업 / out까지의 ETA를 상태에 추가 (env/routing.py)
+    "ArrivalProcess": None,  # None(고정 주기), "poisson" 또는 "bursty" (utils/order_generator.py)
+    "SimServer": None,      # "host:port"이면 상주 시뮬레이터 서버에 접속 (interface/sim_server.py)
+    "WarmStart": 1,         # 1이면 에피소드 시작 상태를 모델 사본으로 저장 / 복원 (plantsim 백엔드)
+    "Headless": 0,          # 1이면 창 / 애니메이션 / 실시간 연동 없이 최대 속도로 실행 (RealtimeScale 무시)
+    "Profile": 0,           # 1이면 COM 호출 / 단계별 지연 시간 계측 후 결과 폴더에 저장 (utils/profiler.py)
+    "RecordTrace": 0,       # 1이면 시뮬레이터 호출 / 결과를 결과 폴더의 sim_trace.pkl에 기록 (interface/trace.py)
+    "ReplayTrace": None,    # Backend "replay"에서 재생할 트레이스 파일 경로
+    "Seed": None,           # 난수 시드 (None이면 매 실행 무작위)
+    "CheckpointInterval": 1,  # N 에피소드마다 결과 폴더에 전체 학습 상태 저장 (0이면 저장 안 함, utils/checkpoint.py)
+    "Resume": None,         # 체크포인트가 있는 결과 폴더 경로. 지정하면 그 상태에서 이어서 학습
+    "ReplayStore": None     # 디스크 replay 저장소 폴더. 지정하면 모든 transition을 실행 간 누적 (buffer/segment_store.py)
+}
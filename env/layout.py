@@ -0,0 +1,36 @@
+"""
+물류 설비 레이아웃 정의
+- Plant Simulation 모델(tp_v11.spp)의 rack / via / home / out 배치를 격자로 표현
+- SimulationEnvironment 상태 인코딩과 DES 백엔드가 같은 배치를 공유
+"""
+
+NODE_GRID = [
+    [None, None, None, "rack1_0", "rack1_1", "rack1_2", "rack1_3", "rack1_4", "rack1_5", "rack1_6", "rack1_7", "rack1_8", "rack1_9", None],
+    [None, "home1", "Via13", "via_10", "via_11", "via_12", "via_13", "via_14", "via_15", "via_16", "via_17", "via_18", "via_19", "via_1_12"],
+    [None, None, None, "rack2_0", "rack2_1", "rack2_2", "rack2_3", "rack2_4", "rack2_5", "rack2_6", "rack2_7", "rack2_8", "rack2_9",  None],
+    ["out", "via15", "via", "rack3_0", "rack3_1", "rack3_2", "rack3_3", "rack3_4", "rack3_5", "rack3_6", "rack3_7", "rack3_8", "rack3_9", "via1"],
+    [None, "home2", "via17", "via_20", "via_21", "via_22", "via_23", "via_24", "via_25", "via_26", "via_27", "via_28", "via_29", "via_2_12"],
+    [None, None, None, "rack4_0", "rack4_1", "rack4_2", "rack4_3", "rack4_4", "rack4_5", "rack4_6", "rack4_7", "rack4_8", "rack4_9", None]
+]
+
+# 격자상 인접하지 않지만 모델에서 연결된 통로 (빈 칸을 건너는 연결)
+EXTRA_LINKS = [
+    ("Via13", "via"),
+    ("via_1_12", "via1"),
+]
+
+HOME_NODES = ["home1", "home2"]
+OUT_NODE = "out"
+
+# 격자 한 칸 이동 시간 (초). DES 백엔드와 거리 기반 상태 특징의 ETA 환산에 사용
+CELL_TRAVEL_TIME = 1.5
+
+
+def is_rack(node_name):
+    """rack 노드 여부 (rack은 통로가 아니라 인접 via에서만 접근 가능)"""
+    return node_name is not None and node_name.startswith("rack")
+
+
+def order_node_name(order):
+    """오더의 픽업 위치를 노드 이름으로 변환 (예: rack2, 134 → rack2_4)"""
+    return f"{order['order_rack']}_{order['order_pos'] % 10}"
@@ -0,0 +1,133 @@
+import os
+import json
+import heapq
+import hashlib
+
+import numpy as np
+
+from env.layout import NODE_GRID, EXTRA_LINKS, CELL_TRAVEL_TIME, is_rack
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "routing")
+
+
+class GridRouter:
+    """
+    레이아웃 기반 경로 탐색 엔진
+    - rack / via / home / out 배치에서 이동 가능한 그래프 구성 (rack은 경유지가 될 수 없음)
+    - 모든 노드 쌍의 최단 거리와 다음 이동 노드(next hop)를 Dijkstra로 미리 계산
+    - 계산 결과는 레이아웃 해시를 키로 디스크에 저장하여 재사용
+    - distance / eta 조회는 O(1)
+    """
+    def __init__(self, node_grid=NODE_GRID, extra_links=EXTRA_LINKS, travel_time=CELL_TRAVEL_TIME,
+                 cache_dir=DEFAULT_CACHE_DIR):
+        """
+        :param node_grid: 노드 이름 격자 (None은 빈 칸)
+        :param extra_links: 격자상 인접하지 않은 연결 [(a, b), ...]
+        :param travel_time: 격자 한 칸 이동 시간 (초)
+        :param cache_dir: 거리 행렬 저장 디렉터리 (None이면 저장하지 않음)
+        """
+        self.travel_time = travel_time
+        self.positions = {}
+        for r, row in enumerate(node_grid):
+            for c, name in enumerate(row):
+                if name is not None:
+                    self.positions[name] = (r, c)
+        self.nodes = list(self.positions)
+        self.node_index = {name: i for i, name in enumerate(self.nodes)}
+        self.graph = self._build_graph(node_grid, extra_links)
+
+        self.layout_hash = hashlib.sha1(
+            json.dumps([node_grid, [list(link) for link in extra_links]]).encode("utf-8")
+        ).hexdigest()[:16]
+        self.dist, self.next_hop = self._load_or_compute(cache_dir)
+
+    # ─── Graph ───
+
+    def _build_graph(self, node_grid, extra_links):
+        """격자 인접 관계와 extra_links로 이동 가능한 그래프 구성 (rack끼리는 연결하지 않음)"""
+        graph = {name: {} for name in self.nodes}
+
+        def link(a, b):
+            if is_rack(a) and is_rack(b):
+                return
+            (ra, ca), (rb, cb) = self.positions[a], self.positions[b]
+            weight = abs(ra - rb) + abs(ca - cb)
+            graph[a][b] = weight
+            graph[b][a] = weight
+
+        for name, (r, c) in self.positions.items():
+            for dr, dc in ((0, 1), (1, 0)):
+                nr, nc = r + dr, c + dc
+                if nr < len(node_grid) and nc < len(node_grid[nr]) and node_grid[nr][nc] is not None:
+                    link(name, node_grid[nr][nc])
+        for a, b in extra_links:
+            link(a, b)
+        return graph
+
+    def _dijkstra(self, src):
+        """src에서 모든 노드까지의 거리와 첫 이동 노드 계산"""
+        n = len(self.nodes)
+        dist = np.full(n, np.inf, dtype=np.float32)
+        first = np.full(n, -1, dtype=np.int32)
+        s = self.node_index[src]
+        dist[s] = 0
+        first[s] = s
+        heap = [(0, src)]
+        while heap:
+            d, node = heapq.heappop(heap)
+            i = self.node_index[node]
+            # rack은 경유지가 될 수 없음
+            if d > dist[i] or (is_rack(node) and node != src):
+                continue
+            for nxt, w in self.graph[node].items():
+                j = self.node_index[nxt]
+                nd = d + w
+                if nd < dist[j]:
+                    dist[j] = nd
+                    first[j] = j if node == src else first[i]
+                    heapq.heappush(heap, (nd, nxt))
+        return dist, first
+
+    def _load_or_compute(self, cache_dir):
+        path = os.path.join(cache_dir, f"routing_{self.layout_hash}.npz") if cache_dir else None
+        if path and os.path.exists(path):
+            with np.load(path) as cached:
+                return cached["dist"], cached["next_hop"]
+
+        rows = [self._dijkstra(src) for src in self.nodes]
+        dist = np.stack([row[0] for row in rows])
+        next_hop = np.stack([row[1] for row in rows])
+
+        if path:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+                np.savez(tmp_path, dist=dist, next_hop=next_hop)
+                os.replace(tmp_path, path)  # 여러 프로세스가 동시에 써도 완성된 파일만 보이도록 교체
+            except OSError:
+                pass
+        return dist, next_hop
+
+    # ─── Lookup ───
+
+    def distance(self, src, dst) -> float:
+        """두 노드 사이 최단 거리 (격자 칸 수, 도달 불가능하면 inf)"""
+        return float(self.dist[self.node_index[src], self.node_index[dst]])
+
+    def eta(self, src, dst) -> float:
+        """두 노드 사이 예상 이동 시간 (초)"""
+        return self.distance(src, dst) * self.travel_time
+
+    def edge_weight(self, a, b) -> int:
+        return self.graph[a][b]
+
+    def path(self, src, dst) -> list:
+        """src → dst 최단 경로 (src 제외, dst 포함)"""
+        s, d = self.node_index[src], self.node_index[dst]
+        if not np.isfinite(self.dist[s, d]):
+            raise ValueError(f"No route from '{src}' to '{dst}'.")
+        path = []
+        while s != d:
+            s = int(self.next_hop[s, d])
+            path.append(self.nodes[s])
+        return path
@@ -1,5 +1,11 @@
 import time
 
+from utils.wait import wait_until, DEFAULT_WAIT_TIMEOUT
+from env.layout import NODE_GRID
+from env.state_encoder import StateEncoder
+from env.routing import GridRouter
+from utils.profiler import profiled
+
 class SimulationEnvironment:
     """
     Plant Simulation 연동 환경 클래스
@@ -7,65 +13,71 @@ class SimulationEnvironment:
     - 시뮬레이터 실행 제어
     - 완료된 작업 보상 계산 등 내부 후처리 포함
     """
-    def __init__(self, plsimInterface):
+    def __init__(self, plsimInterface, distance_features=False):
+        """
+        :param plsimInterface: PlantsimInterface 또는 동일한 메서드를 가진 백엔드
+        :param distance_features: True이면 AMS별 픽업 / out까지의 ETA를 상태에 추가
+        """
         self.plsim = plsimInterface
+        # 대기 설정: PlantsimInterface의 wait_timeout과 COM 이벤트 처리 (원격 / DES / 재생 백엔드는 기본 timeout만)
+        timeout = getattr(plsimInterface, "wait_timeout", None)
+        self.wait_timeout = timeout if isinstance(timeout, (int, float)) else DEFAULT_WAIT_TIMEOUT
+        self._pump = getattr(getattr(plsimInterface, "plantsim", None), "pump_events", None)
         self.node_grid = self._create_node_grid()
+        router = GridRouter(self.node_grid) if distance_features else None
+        self.encoder = StateEncoder(self.node_grid, self.plsim.get_action_dimension(), router=router)
 
     def _create_node_grid(self):
-        return [
-            [None, None, None, "rack1_0", "rack1_1", "rack1_2", "rack1_3", "rack1_4", "rack1_5", "rack1_6", "rack1_7", "rack1_8", "rack1_9", None],
-            [None, "home1", "Via13", "via_10", "via_11", "via_12", "via_13", "via_14", "via_15", "via_16", "via_17", "via_18", "via_19", "via_1_12"],
-            [None, None, None, "rack2_0", "rack2_1", "rack2_2", "rack2_3", "rack2_4", "rack2_5", "rack2_6", "rack2_7", "rack2_8", "rack2_9",  None],
-            ["out", "via15", "via", "rack3_0", "rack3_1", "rack3_2", "rack3_3", "rack3_4", "rack3_5", "rack3_6", "rack3_7", "rack3_8", "rack3_9", "via1"],
-            [None, "home2", "via17", "via_20", "via_21", "via_22", "via_23", "via_24", "via_25", "via_26", "via_27", "via_28", "via_29", "via_2_12"],
-            [None, None, None, "rack4_0", "rack4_1", "rack4_2", "rack4_3", "rack4_4", "rack4_5", "rack4_6", "rack4_7", "rack4_8", "rack4_9", None]
-        ]
+        return [list(row) for row in NODE_GRID]
     
     def find_node_position_by_name(self, node_name):
-        for row in range(len(self.node_grid)):
-            for col in range(len(self.node_grid[row])):
-                if self.node_grid[row][col] == node_name:
-                    return row, col
-        return None
+        return self.encoder.index.get(node_name)
     
     def ams_table_to_vector(self, ams_table):
         """AMS 테이블을 벡터 형태로 변환"""
         vector = []
         for (pos, dest, order_num) in ams_table:
-            row, col = self.find_node_position_by_name(pos) if pos else (-1, -1)
-            dest_row, dest_col = self.find_node_position_by_name(dest) if dest else (-1, -1)
+            row, col = self.encoder.position(pos)
+            dest_row, dest_col = self.encoder.position(dest)
             vector.extend([row, col, dest_row, dest_col, order_num])
         return vector
     
     def order_to_vector(self, order):
         """오더를 벡터로 변환"""
-        vector = []
-        position_name = f"{order['order_rack']}_{order['order_pos'] % 10}"
+        return list(self.encoder.order_position(order))
 
-        try:
-            result = self.find_node_position_by_name(position_name)
-            if result is None:
-                raise ValueError(f"Position name '{position_name}' not found in map.")
-            pos_row, pos_col = result
-        except Exception as e:
-            raise ValueError(f"Failed to convert order position '{position_name}' to vector: {e}")
+    def preencode_orders(self, rack_names, rack_codes, positions):
+        """오더 테이블 로드 시 픽업 위치를 미리 인코딩 (StateEncoder.preencode_orders 참고)"""
+        self.encoder.preencode_orders(rack_names, rack_codes, positions)
 
-        vector.extend([pos_row, pos_col])
-        return vector
+    def _call_all(self, *calls):
+        """
+        여러 인터페이스 호출을 순서대로 실행 (원격 인터페이스면 batch로 한 번의 왕복에 묶음)
+        :param calls: (메서드 이름, 인자...) 튜플들
+        """
+        if hasattr(self.plsim, "batch"):
+            return self.plsim.batch(calls)
+        return [getattr(self.plsim, name)(*args) for name, *args in calls]
 
+    def _wait(self, predicate, name):
+        """wait_timeout 안에 조건이 충족되지 않으면 TimeoutError (대기 중 COM 이벤트 처리)"""
+        if not wait_until(predicate, timeout=self.wait_timeout, name=name, pump=self._pump):
+            raise TimeoutError(f"Timed out after {self.wait_timeout}s waiting for '{name}'.")
 
+    @profiled("env.reset_and_initialize")
     def reset_and_initialize(self, T=200):
-        """시뮬레이터 초기화"""
-        self.plsim.reset_simulation()
-        self.plsim.set_T(T)
-        self.plsim.start_simulation()
-        while not self.plsim.check_simulation_ready():
-            time.sleep(1)  # 시뮬레이터가 준비될 때까지 대기
-        time.sleep(1)
+        """
+        시뮬레이터 초기화 (warm-start 스냅샷이 있으면 인터페이스가 복원)
+        :return: (초기화 소요 시간(초), "warm" 또는 "cold")
+        """
+        start = time.perf_counter()
+        mode = self.plsim.reset_to_ready(T)
+        self._wait(self.plsim.check_simulation_ready, "simul_ready")  # 시뮬레이터가 준비될 때까지 대기
+        return time.perf_counter() - start, mode
 
     def get_state_dim(self):
         """상태 벡터 차원 반환"""
-        return self.plsim.get_ams_state_dimension() + 2  # AMS 상태 + 오더 정보 (3개 추가)  
+        return self.encoder.state_dim  # AMS 상태 + 오더 정보 (+ 선택적 ETA 특징)
 
     def get_action_dim(self):
         """행동 공간 크기 반환"""
@@ -78,18 +90,31 @@ class SimulationEnvironment:
         """
         self.current_order = order
 
-    def get_state(self, order):
+    @profiled("env.get_state")
+    def get_state(self, order, out=None):
         """
         AMS 상태와 현재 오더를 모두 벡터 형태로 반환
+        :param order: 오더 dict (None이면 register_order로 등록한 오더)
+        :param out: (선택적) 결과를 쓸 길이 get_state_dim()의 float32 배열
+        :return: float32 상태 벡터
         """
-        ams_table = self.plsim.read_ams_table()
-        ams_vec = self.ams_table_to_vector(ams_table)
         if order is None:
-            order_vec = self.order_to_vector(self.current_order)
-        else:
-            order_vec = self.order_to_vector(order)
-        return ams_vec + order_vec
+            order = self.current_order
+        return self.encoder.encode(self.plsim.read_ams_snapshot().records, order, out)
 
+    @profiled("env.get_states")
+    def get_states(self, orders):
+        """
+        같은 AMS 상태에 대해 여러 오더의 상태 벡터를 한 번에 생성
+        :return: [len(orders), state_dim] float32 배열
+        """
+        return self.encoder.encode_batch(self.plsim.read_ams_snapshot().records, orders)
+
+    def get_sim_time(self) -> float:
+        """현재 AMS 스냅샷의 시뮬레이션 시각 (시계가 멈춰 있으면 다음 상태 조회와 같은 스냅샷을 공유)"""
+        return self.plsim.read_ams_snapshot().sim_time
+
+    @profiled("env.is_terminal")
     def is_terminal(self) -> bool:
         """시뮬레이션 종료 여부"""
         return self.plsim.check_simulation_ended()
@@ -102,14 +127,28 @@ class SimulationEnvironment:
         """시뮬레이션 종료"""
         self.plsim.stop_simulation()
 
+    @profiled("env.run_simulation_for_T")
     def run_simulation_for_T(self, T: float):
         """T초 동안 시뮬레이션 실행"""
         self.plsim.run_simulation_for_T(T)
 
+    @profiled("env.has_idle_ams")
     def has_idle_ams(self) -> bool:
         """대기 중인 AMS 존재 여부"""
         return self.plsim.check_idle_ams()
 
+    @profiled("env.wait_for_idle_ams")
+    def wait_for_idle_ams(self):
+        """유휴 AMS가 생기거나 시뮬레이션이 끝날 때까지 시뮬레이션 실행"""
+        self.plsim.start_simulation()
+        self._wait(lambda: self.has_idle_ams() or self.is_terminal(), "idle_ams")
+        self.plsim.stop_simulation()
+
+    def get_idle_mask(self) -> list:
+        """AMS별 유휴 여부 (True = 새 오더 할당 가능)"""
+        return self.plsim.get_idle_mask()
+
+    @profiled("env.assign_order")
     def assign_order(self, ams_index: int):
         """
         저장된 current_order를 AMS에 할당
@@ -117,17 +156,17 @@ class SimulationEnvironment:
         """
         if self.current_order is None:
             raise ValueError("먼저 register_order로 주문을 설정하세요.")
-        self.plsim.assign_order(self.current_order, ams_index)
-        self.plsim.start_simulation()
+        self._call_all(("assign_order", self.current_order, ams_index), ("start_simulation",))
         # 할당했으므로 current_order 초기화
         self.current_order = None
 
+    @profiled("env.get_completed_rewards")
     def get_completed_rewards(self, pending_ids) -> list:
         """
         완료된 오더들의 보상 계산 및 반환
         :return: list of tuples (order_id, reward)
         """
-        completed = self.plsim.get_completed_orders(pending_ids)  # [(order_id, leadtime), ...]
+        completed = self.plsim.get_completed_orders(list(pending_ids))  # [(order_id, leadtime), ...]
         rewards = []
         for order_id, leadtime in completed:
             # leadtime이 짧을수록 높은 보상
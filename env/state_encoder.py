@@ -0,0 +1,137 @@
+import numpy as np
+
+from env.layout import OUT_NODE, order_node_name
+from utils.profiler import profiled
+
+AMS_FEATURES = 5    # pos_row, pos_col, dest_row, dest_col, order_num
+ORDER_FEATURES = 2  # pos_row, pos_col
+ETA_FEATURES = 2    # AMS별 eta_pickup, eta_out
+
+
+class StateEncoder:
+    """
+    AMS 스냅샷과 오더를 float32 상태 벡터로 변환하는 인코더
+    - 노드 이름 → (row, col) 인덱스를 한 번만 구성
+    - 오더 픽업 위치는 preencode_orders로 미리 변환한 노드 코드 배열(오더 테이블 행 순서)에서 order["row"]로 조회
+    - AMS 부분은 같은 스냅샷에 대해 재사용 버퍼에 한 번만 인코딩
+    - router가 주어지면 AMS별 픽업 rack까지 / 픽업 후 out까지의 ETA를 상태 끝에 추가
+    """
+    def __init__(self, node_grid, num_ams, router=None):
+        """
+        :param node_grid: SimulationEnvironment.node_grid
+        :param num_ams: AMS 대수
+        :param router: (선택적) GridRouter. 주어지면 거리 기반 ETA 특징 사용
+        """
+        self.num_ams = num_ams
+        self.router = router
+        self.ams_dim = num_ams * AMS_FEATURES
+        self.order_end = self.ams_dim + ORDER_FEATURES
+        self.state_dim = self.order_end + (num_ams * ETA_FEATURES if router is not None else 0)
+
+        self.index = {}
+        for r, row in enumerate(node_grid):
+            for c, name in enumerate(row):
+                if name is not None and name not in self.index:
+                    self.index[name] = (r, c)
+        self.node_names = list(self.index)
+        self._node_codes = {name: code for code, name in enumerate(self.node_names)}
+
+        self._order_codes = None    # 오더 테이블 행별 픽업 노드 코드 (int32, 지도에 없으면 -1)
+        self._ams_buffer = np.zeros(self.ams_dim, dtype=np.float32)
+        self._ams_records = None
+
+    # ─── Lookup ───
+
+    def position(self, node_name):
+        """노드 이름 → (row, col), 없거나 비어 있으면 (-1, -1)"""
+        if not node_name:
+            return -1, -1
+        return self.index.get(node_name, (-1, -1))
+
+    def order_node(self, order):
+        """오더 픽업 노드 이름. 미리 인코딩된 오더는 오더 테이블 행 번호(order["row"])로 바로 조회"""
+        row = order.get("row")
+        if row is not None and self._order_codes is not None:
+            code = self._order_codes[row]
+            if code >= 0:
+                return self.node_names[code]
+        node = order_node_name(order)
+        if node not in self.index:
+            raise ValueError(f"Failed to convert order position '{node}' to vector: "
+                             f"Position name '{node}' not found in map.")
+        return node
+
+    def order_position(self, order):
+        """오더 픽업 위치 (row, col)"""
+        return self.index[self.order_node(order)]
+
+    def preencode_orders(self, rack_names, rack_codes, positions):
+        """
+        오더 테이블 전체의 픽업 위치를 행 순서의 노드 코드 배열로 미리 변환 (OrderGenerator.pickup_columns)
+        :param rack_names: rack 이름 목록
+        :param rack_codes: 행별 rack 코드 배열
+        :param positions: 행별 order_pos 배열
+        """
+        # (rack, pos % 10) 조합은 몇 개뿐이므로 조회표를 만든 뒤 한 번에 인덱싱
+        lookup = np.array([[self._node_codes.get(f"{rack}_{slot}", -1) for slot in range(10)]
+                           for rack in rack_names], dtype=np.int32).reshape(len(rack_names), 10)
+        self._order_codes = lookup[np.asarray(rack_codes), np.asarray(positions) % 10]
+
+    # ─── Encoding ───
+
+    def _encode_ams(self, ams_records):
+        """AMS 부분 인코딩 (같은 스냅샷이면 재사용 버퍼를 그대로 사용)"""
+        if ams_records is self._ams_records:
+            return self._ams_buffer
+        buf = self._ams_buffer
+        for i, (pos, dest, order_num) in enumerate(ams_records):
+            base = i * AMS_FEATURES
+            buf[base], buf[base + 1] = self.position(pos)
+            buf[base + 2], buf[base + 3] = self.position(dest)
+            buf[base + 4] = order_num
+        self._ams_records = ams_records
+        return buf
+
+    @profiled("encoder.encode")
+    def encode(self, ams_records, order, out=None):
+        """
+        :param ams_records: AMS 레코드 시퀀스 [(pos, dest, order_num), ...]
+        :param order: 오더 dict
+        :param out: (선택적) 결과를 쓸 길이 state_dim의 float32 배열
+        :return: 상태 벡터 (float32, 길이 state_dim)
+        """
+        if out is None:
+            out = np.empty(self.state_dim, dtype=np.float32)
+        out[:self.ams_dim] = self._encode_ams(ams_records)
+        node = self.order_node(order)
+        out[self.ams_dim:self.order_end] = self.index[node]
+        if self.router is not None:
+            self._encode_eta(ams_records, node, out[self.order_end:])
+        return out
+
+    def _encode_eta(self, ams_records, pickup, out):
+        """AMS별 (현재 위치 → 픽업 rack ETA, 픽업 후 out 도착 ETA). 위치를 모르거나 도달 불가면 -1"""
+        pickup_to_out = self.router.eta(pickup, OUT_NODE)
+        for i, (pos, _, _) in enumerate(ams_records):
+            eta_pickup = self.router.eta(pos, pickup) if pos in self.router.node_index else np.inf
+            if np.isfinite(eta_pickup):
+                out[i * ETA_FEATURES] = eta_pickup
+                out[i * ETA_FEATURES + 1] = eta_pickup + pickup_to_out
+            else:
+                out[i * ETA_FEATURES:(i + 1) * ETA_FEATURES] = -1
+
+    @profiled("encoder.encode_batch")
+    def encode_batch(self, ams_records, orders, out=None):
+        """
+        같은 AMS 상태에 대해 여러 오더의 상태 벡터를 한 번에 생성
+        :return: [len(orders), state_dim] float32 배열
+        """
+        if out is None:
+            out = np.empty((len(orders), self.state_dim), dtype=np.float32)
+        out[:, :self.ams_dim] = self._encode_ams(ams_records)
+        for row, order in zip(out, orders):
+            node = self.order_node(order)
+            row[self.ams_dim:self.order_end] = self.index[node]
+            if self.router is not None:
+                self._encode_eta(ams_records, node, row[self.order_end:])
+        return out
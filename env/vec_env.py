@@ -0,0 +1,205 @@
+import multiprocessing as mp
+
+import numpy as np
+
+from env.simulation_env import SimulationEnvironment
+from interface.backend import create_interface
+from utils import profiler
+
+
+def _worker(remote, backend, model_path, env_kwargs, interface_kwargs, profile):
+    """
+    환경 워커 프로세스
+    - 프로세스마다 자체 COM 아파트(plantsim) 또는 DES 백엔드를 소유
+    - 부모가 보낸 (메서드 이름, 인자)를 SimulationEnvironment에서 실행하고 결과를 반환
+    """
+    profiler.enable(profile)
+    if backend == "plantsim":
+        import pythoncom
+        pythoncom.CoInitialize()
+
+    plsim = create_interface(backend, **interface_kwargs)
+    try:
+        plsim.initialize_model(model_path)
+        env = SimulationEnvironment(plsim, **env_kwargs)
+        remote.send((True, (env.get_state_dim(), env.get_action_dim())))
+
+        while True:
+            name, args = remote.recv()
+            if name is None:
+                break
+            if name == "get_profile":
+                remote.send((True, profiler.get_stats()))  # 워커 프로세스에서 수집한 계측 결과
+                continue
+            try:
+                remote.send((True, getattr(env, name)(*args)))
+            except Exception as e:
+                remote.send((False, e))
+    finally:
+        plsim.quit()
+        remote.close()
+
+
+class VecSimulationEnvironment:
+    """
+    N개의 SimulationEnvironment를 별도 프로세스에서 병렬 실행하는 벡터화 환경
+    - 모든 메서드는 워커 전체(또는 mask로 선택된 워커)에 동시에 명령을 보내고 결과를 모아서 반환
+    - 상태는 [N, state_dim] ndarray로 묶어 DQNAgent.select_action에서 한 번에 추론
+    """
+    def __init__(self, num_envs, backend="plantsim", model_path=None, interface_kwargs=None, profile=False,
+                 **env_kwargs):
+        """
+        :param num_envs: 워커(시뮬레이터) 개수
+        :param backend: interface.backend.create_interface에 전달할 백엔드 이름
+        :param model_path: 각 워커가 로드할 모델 파일 경로
+        :param interface_kwargs: 각 워커의 인터페이스 생성 인자
+        :param profile: True이면 워커에서도 utils.profiler 계측 (collect_profiles로 수집)
+        :param env_kwargs: 각 워커의 SimulationEnvironment 생성 인자 (예: distance_features)
+        """
+        self.num_envs = num_envs
+        # COM 아파트와 torch 상태를 공유하지 않도록 spawn으로 워커 생성
+        ctx = mp.get_context("spawn")
+        self._remotes = []
+        self._processes = []
+        for _ in range(num_envs):
+            remote, worker_remote = ctx.Pipe()
+            process = ctx.Process(target=_worker, args=(worker_remote, backend, model_path, env_kwargs,
+                                                                interface_kwargs or {}, profile),
+                                  daemon=True)
+            process.start()
+            worker_remote.close()
+            self._remotes.append(remote)
+            self._processes.append(process)
+
+        dims = self._gather(range(num_envs))
+        self.state_dim, self.action_dim = dims[0]
+
+    # ─── Worker Communication ───
+
+    def _indices(self, mask):
+        if mask is None:
+            return list(range(self.num_envs))
+        return [i for i in range(self.num_envs) if mask[i]]
+
+    def _gather(self, indices):
+        """
+        선택된 워커의 응답을 모두 받은 뒤 반환
+        (일부 워커가 실패해도 나머지 응답을 파이프에서 비워야 다음 호출이 이전 응답을 읽지 않으므로, 첫 오류는 마지막에 발생)
+        """
+        results = []
+        failure = None
+        for i in indices:
+            try:
+                ok, result = self._remotes[i].recv()
+            except (EOFError, ConnectionError) as e:
+                ok, result = False, e  # 워커 프로세스 종료
+            if not ok and failure is None:
+                failure = (i, result)
+            results.append(result)
+        if failure is not None:
+            i, error = failure
+            raise RuntimeError(f"Environment worker {i} failed: {error!r}") from error
+        return results
+
+    def _call(self, name, args_per_env=None, mask=None):
+        """
+        선택된 워커에 메서드 호출을 동시에 보내고 결과를 워커 순서대로 반환
+        :param name: SimulationEnvironment 메서드 이름
+        :param args_per_env: 워커별 인자 튜플 리스트 (길이 num_envs, None이면 인자 없음)
+        :param mask: 호출할 워커 선택 (bool 배열, None이면 전체)
+        :return: 길이 num_envs 리스트 (선택되지 않은 워커는 None)
+        """
+        indices = self._indices(mask)
+        for i in indices:
+            args = args_per_env[i] if args_per_env is not None else ()
+            self._remotes[i].send((name, args))
+        results = [None] * self.num_envs
+        for i, result in zip(indices, self._gather(indices)):
+            results[i] = result
+        return results
+
+    # ─── Batched Environment API ───
+
+    def reset_all(self, T=200):
+        """
+        :return: 워커별 (초기화 소요 시간(초), "warm" 또는 "cold") 리스트
+        """
+        return self._call("reset_and_initialize", [(T,)] * self.num_envs)
+
+    def register_orders(self, orders, mask=None):
+        self._call("register_order", [(order,) for order in orders], mask)
+
+    def get_states(self, orders, mask=None):
+        """
+        :param orders: 워커별 오더 리스트 (길이 num_envs)
+        :return: [num_envs, state_dim] float32 배열 (선택되지 않은 워커 행은 0)
+        """
+        states = np.zeros((self.num_envs, self.state_dim), dtype=np.float32)
+        for i, state in enumerate(self._call("get_state", [(order,) for order in orders], mask)):
+            if state is not None:
+                states[i] = state
+        return states
+
+    def get_state_pairs(self, current_orders, next_orders, mask=None):
+        """
+        워커별 (현재 오더, 다음 오더) 상태를 한 번의 왕복으로 생성
+        :return: (states, next_states) 각각 [num_envs, state_dim] float32 배열
+        """
+        states = np.zeros((2, self.num_envs, self.state_dim), dtype=np.float32)
+        args = [([current, following],) for current, following in zip(current_orders, next_orders)]
+        for i, pair in enumerate(self._call("get_states", args, mask)):
+            if pair is not None:
+                states[:, i] = pair
+        return states[0], states[1]
+
+    def preencode_orders(self, columns):
+        """
+        워커별 오더 테이블 픽업 위치 미리 인코딩 (합성 오더북은 워커마다 다르므로 워커별로 전달)
+        :param columns: 워커별 OrderGenerator.pickup_columns() 결과 리스트
+        """
+        self._call("preencode_orders", [tuple(worker_columns) for worker_columns in columns])
+
+    def has_idle_ams(self, mask=None):
+        return np.array([bool(r) for r in self._call("has_idle_ams", mask=mask)])
+
+    def wait_for_idle_ams(self, mask=None):
+        self._call("wait_for_idle_ams", mask=mask)
+
+    def assign_orders(self, actions, mask=None):
+        """
+        :param actions: 워커별 행동 인덱스 (0 ~ action_dim-1, AMS 인덱스는 +1)
+        """
+        self._call("assign_order", [(int(action) + 1,) for action in actions], mask)
+
+    def run_simulation_for_T(self, T, mask=None):
+        """
+        :param T: 실행 시간 (모든 워커 공통 값 또는 워커별 리스트)
+        """
+        intervals = T if np.ndim(T) else [T] * self.num_envs
+        self._call("run_simulation_for_T", [(t,) for t in intervals], mask)
+
+    def get_completed_rewards(self, pending_ids_per_env, mask=None):
+        """
+        :param pending_ids_per_env: 워커별 대기 중인 order_id 리스트
+        :return: 워커별 [(order_id, reward), ...] 리스트
+        """
+        results = self._call("get_completed_rewards", [(list(ids),) for ids in pending_ids_per_env], mask)
+        return [r if r is not None else [] for r in results]
+
+    def is_terminal(self, mask=None):
+        return np.array([bool(r) for r in self._call("is_terminal", mask=mask)])
+
+    def collect_profiles(self):
+        """워커별 utils.profiler.get_stats() 결과 리스트"""
+        return self._call("get_profile")
+
+    def close(self):
+        for remote in self._remotes:
+            try:
+                remote.send((None, ()))
+            except (BrokenPipeError, EOFError):
+                pass
+        for process in self._processes:
+            process.join(timeout=30)
+        for remote in self._remotes:
+            remote.close()
@@ -0,0 +1,46 @@
+import queue
+
+
+class UIChannel:
+    """
+    학습 스레드 → Tk 메인 루프 이벤트 채널
+    - 학습 스레드는 log / progress / metric 이벤트를 큐에 넣기만 하고 바로 반환 (Tk 위젯을 직접 건드리지 않음)
+    - Tk 쪽은 root.after 주기마다 drain으로 쌓인 이벤트를 한 번에 꺼내 반영
+    """
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+
+    # ─── Producer (학습 스레드) ───
+
+    def log(self, message):
+        self._queue.put(("log", message))
+
+    def progress(self, fraction):
+        """:param fraction: 전체 학습 진행률 (0.0 ~ 1.0)"""
+        self._queue.put(("progress", fraction))
+
+    def metric(self, name, value):
+        self._queue.put(("metric", (name, value)))
+
+    # ─── Consumer (Tk 스레드) ───
+
+    def drain(self, max_events=1000):
+        """
+        쌓인 이벤트를 최대 max_events개 꺼내 종류별로 묶어 반환
+        (progress / metric은 마지막 값만 의미가 있으므로 합쳐서 반환)
+        :return: (로그 메시지 리스트, 마지막 진행률 또는 None, {metric 이름: 마지막 값})
+        """
+        logs, progress, metrics = [], None, {}
+        for _ in range(max_events):
+            try:
+                kind, payload = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "log":
+                logs.append(payload)
+            elif kind == "progress":
+                progress = payload
+            else:
+                name, value = payload
+                metrics[name] = value
+        return logs, progress, metrics
@@ -7,9 +7,23 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from threading import Thread
 from PIL import Image, ImageTk
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from train import run_training
+from gui.channel import UIChannel
+from utils.reward_curve import RewardCurve
+from interface.backend import BACKENDS
 from config import DEFAULT_HYPERPARAMS, DEFAULT_SIM_PARAMS
 
+# 실시간 보상 그래프 갱신 주기 (ms). 그리는 점 수는 RewardCurve.max_buckets로 고정
+LIVE_CHART_INTERVAL_MS = 500
+# 학습 스레드 이벤트 반영 주기 (ms)와 한 번에 처리할 최대 이벤트 수
+UI_POLL_INTERVAL_MS = 100
+MAX_EVENTS_PER_POLL = 2000
+# 로그 창에 유지할 최근 줄 수
+MAX_LOG_LINES = 1000
+
+
 class TrainingDashboard:
     def __init__(self, root, csv_path=None):
         self.root = root
@@ -17,22 +31,30 @@ class TrainingDashboard:
         self.root.geometry("780x700")
 
         self.csv_path = csv_path
+        self.reward_curve = None
+        self.live_canvas = None
+        self._live_chart_job = None  # 예약된 refresh_live_chart의 after id
+        self._drawn_version = -1
+        self.channel = UIChannel()
+        self.metrics = {}
         self.build_hyperparam_section()
         self.build_simulation_section()  # 여기 수정됨
         self.build_log_section()
         self.build_button_section()
+        self.root.after(UI_POLL_INTERVAL_MS, self.poll_channel)
 
     def build_hyperparam_section(self):
         frame = tk.LabelFrame(self.root, text="Hyperparameter 설정")
         frame.pack(padx=10, pady=5, fill="x")
 
         self.param_entries = {}
-        # 모든 하이퍼파라미터를 한 줄(row=0)에 배치
+        # 하이퍼파라미터를 한 줄에 5개씩 배치
         for i, (key, default) in enumerate(DEFAULT_HYPERPARAMS.items()):
-            tk.Label(frame, text=key).grid(row=0, column=i*2, padx=5, pady=5)
+            row, col = divmod(i, 5)
+            tk.Label(frame, text=key).grid(row=row, column=col*2, padx=5, pady=5)
             entry = tk.Entry(frame, width=10)
             entry.insert(0, str(default))
-            entry.grid(row=0, column=i*2 + 1, padx=5, pady=5)
+            entry.grid(row=row, column=col*2 + 1, padx=5, pady=5)
             self.param_entries[key] = entry
 
     def build_simulation_section(self):
@@ -44,7 +66,21 @@ class TrainingDashboard:
         entry = tk.Entry(frame, width=10)
         entry.insert(0, str(default_interval))
         entry.grid(row=0, column=1, padx=5, pady=5)
-        self.sim_entries = {"OrderInterval": entry}
+
+        tk.Label(frame, text="Backend:").grid(row=0, column=2, padx=5, pady=5)
+        backend = ttk.Combobox(frame, values=BACKENDS, width=10, state="readonly")
+        backend.set(DEFAULT_SIM_PARAMS["Backend"])
+        backend.grid(row=0, column=3, padx=5, pady=5)
+
+        tk.Label(frame, text="SimServer:").grid(row=0, column=4, padx=5, pady=5)
+        server = tk.Entry(frame, width=18)
+        server.insert(0, DEFAULT_SIM_PARAMS["SimServer"] or "")
+        server.grid(row=0, column=5, padx=5, pady=5)
+
+        self.headless_var = tk.BooleanVar(value=bool(DEFAULT_SIM_PARAMS["Headless"]))
+        tk.Checkbutton(frame, text="Headless (최대 속도)", variable=self.headless_var)\
+            .grid(row=1, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        self.sim_entries = {"OrderInterval": entry, "Backend": backend, "SimServer": server}
 
     def build_log_section(self):
         frame = tk.LabelFrame(self.root, text="Training Logs")
@@ -57,6 +93,9 @@ class TrainingDashboard:
         self.progress_bar = ttk.Progressbar(frame, maximum=100, variable=self.progress_var)
         self.progress_bar.pack(fill="x", pady=5)
 
+        self.status_var = tk.StringVar()
+        tk.Label(frame, textvariable=self.status_var, anchor="w").pack(fill="x")
+
     def build_button_section(self):
         frame = tk.Frame(self.root)
         frame.pack(pady=5)
@@ -64,39 +103,114 @@ class TrainingDashboard:
         tk.Button(frame, text="학습 시작", bg="green", fg="white",
                   font=("Helvetica", 12, "bold"), command=self.start_training)\
             .grid(row=0, column=0, padx=10)
-        tk.Button(frame, text="보상 그래프 보기", command=self.show_graph)\
+        tk.Button(frame, text="이어서 학습", command=self.resume_training)\
             .grid(row=0, column=1, padx=10)
-        tk.Button(frame, text="로그 다운로드", command=lambda: self.download_file("log.txt"))\
+        tk.Button(frame, text="보상 그래프 보기", command=self.show_graph)\
             .grid(row=0, column=2, padx=10)
-        tk.Button(frame, text="모델 다운로드", command=lambda: self.download_file("model.pth"))\
+        tk.Button(frame, text="로그 다운로드", command=lambda: self.download_file("log.txt"))\
             .grid(row=0, column=3, padx=10)
+        tk.Button(frame, text="모델 다운로드", command=lambda: self.download_file("model.pth"))\
+            .grid(row=0, column=4, padx=10)
 
         self.graph_frame = tk.LabelFrame(self.root, text="Reward Graph", height=400)
         self.graph_frame.pack(padx=10, pady=5, fill="both", expand=True)
 
     def append_log(self, msg):
-        self.log_text.insert(tk.END, msg + "\n")
+        """Tk 스레드 전용. 학습 스레드는 self.channel.log 사용"""
+        self.append_logs([msg])
+
+    def append_logs(self, messages):
+        """여러 줄을 한 번에 추가하고 최근 MAX_LOG_LINES줄만 유지"""
+        self.log_text.insert(tk.END, "".join(msg + "\n" for msg in messages))
+        line_count = int(self.log_text.index("end-1c").split(".")[0])
+        if line_count > MAX_LOG_LINES:
+            self.log_text.delete("1.0", f"{line_count - MAX_LOG_LINES + 1}.0")
         self.log_text.see(tk.END)
 
-    def start_training(self):
+    def poll_channel(self):
+        """학습 스레드가 보낸 이벤트를 주기적으로 모아서 반영"""
+        logs, progress, metrics = self.channel.drain(MAX_EVENTS_PER_POLL)
+        if logs:
+            self.append_logs(logs)
+        if progress is not None:
+            self.progress_var.set(int(progress * 100))
+        if metrics:
+            self.metrics.update(metrics)
+            self.status_var.set("   ".join(f"{name}: {value:.2f}" if isinstance(value, float) else f"{name}: {value}"
+                                           for name, value in self.metrics.items()))
+        self.root.after(UI_POLL_INTERVAL_MS, self.poll_channel)
+
+    def resume_training(self):
+        """결과 폴더를 골라 그 체크포인트에서 이어서 학습 (Episode는 전체 목표 에피소드 수)"""
+        resume_dir = filedialog.askdirectory(title="체크포인트가 있는 결과 폴더 선택", initialdir="results")
+        if resume_dir:
+            self.start_training(resume_dir=resume_dir)
+
+    def start_training(self, resume_dir=None):
         params = {**DEFAULT_HYPERPARAMS, **DEFAULT_SIM_PARAMS}
         # 하이퍼파라미터 덮어쓰기
         for key, entry in self.param_entries.items():
             v = entry.get()
             params[key] = float(v) if "." in v else int(v)
-        # 시뮬레이션 파라미터 덮어쓰기 (OrderInterval만)
+        # 시뮬레이션 파라미터 덮어쓰기
         params["OrderInterval"] = int(self.sim_entries["OrderInterval"].get())
+        params["Backend"] = self.sim_entries["Backend"].get()
+        params["SimServer"] = self.sim_entries["SimServer"].get().strip() or None  # 비어 있으면 직접 실행
+        params["Headless"] = int(self.headless_var.get())
+        params["Resume"] = resume_dir
 
-        self.append_log("학습을 시작합니다...\n")
-        self.progress_var.set(0)
         self.log_text.delete("1.0", tk.END)
+        self.append_log(f"{resume_dir}에서 이어서 학습합니다...\n" if resume_dir else "학습을 시작합니다...\n")
+        self.progress_var.set(0)
+        self.metrics = {}
+        self.status_var.set("")
+
+        self.reward_curve = RewardCurve()
+        self.build_live_chart()
 
         Thread(
-            target=lambda: run_training(params, log_callback=self.append_log, csv_path=self.csv_path),
+            target=lambda: run_training(params, log_callback=self.channel.log, csv_path=self.csv_path,
+                                        reward_curve=self.reward_curve, progress_callback=self.channel.progress,
+                                        metric_callback=self.channel.metric),
             daemon=True
         ).start()
 
+    def build_live_chart(self):
+        """학습 중 보상 곡선을 graph_frame에 실시간으로 표시"""
+        for w in self.graph_frame.winfo_children():
+            w.destroy()
+        fig = Figure(figsize=(6, 3))
+        self.live_ax = fig.add_subplot()
+        self.live_canvas = FigureCanvasTkAgg(fig, master=self.graph_frame)
+        self.live_canvas.get_tk_widget().pack(fill="both", expand=True)
+        self._drawn_version = -1
+        self.schedule_live_chart()
+
+    def schedule_live_chart(self):
+        """다음 refresh_live_chart 예약 (이전 예약은 취소하여 학습을 다시 시작해도 갱신 주기는 하나만 유지)"""
+        self.cancel_live_chart()
+        self._live_chart_job = self.root.after(LIVE_CHART_INTERVAL_MS, self.refresh_live_chart)
+
+    def cancel_live_chart(self):
+        if self._live_chart_job is not None:
+            self.root.after_cancel(self._live_chart_job)
+            self._live_chart_job = None
+
+    def refresh_live_chart(self):
+        """고정 주기로 집계 곡선을 다시 그림 (새 값이 없으면 생략)"""
+        self._live_chart_job = None
+        if self.live_canvas is None:
+            return
+        if self.reward_curve.version != self._drawn_version:
+            self._drawn_version = self.reward_curve.version
+            self.reward_curve.plot(self.live_ax)
+            self.live_ax.figure.tight_layout()
+            self.live_canvas.draw_idle()
+        self.schedule_live_chart()
+
     def show_graph(self):
+        self.live_canvas = None  # 실시간 그래프 갱신 중단
+        self.cancel_live_chart()
         for w in self.graph_frame.winfo_children():
             w.destroy()
         try:
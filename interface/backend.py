@@ -0,0 +1,21 @@
+BACKENDS = ("plantsim", "des", "replay")
+
+
+def create_interface(backend="plantsim", **kwargs):
+    """
+    시뮬레이션 백엔드 생성
+    :param backend: "plantsim" (Tecnomatix COM), "des" (순수 Python 이산 사건 시뮬레이터)
+                    또는 "replay" (기록된 트레이스 재생, trace_path 필요)
+    :param kwargs: 각 인터페이스 생성자에 전달할 인자
+    """
+    if backend == "plantsim":
+        # win32com은 Windows에서만 사용 가능하므로 필요할 때만 import
+        from interface.plantsim_interface import PlantsimInterface
+        return PlantsimInterface(**kwargs)
+    if backend == "des":
+        from interface.des_interface import DESInterface
+        return DESInterface(**kwargs)
+    if backend == "replay":
+        from interface.trace import ReplayInterface
+        return ReplayInterface(**kwargs)
+    raise ValueError(f"Unknown simulation backend '{backend}'. Choose one of {BACKENDS}.")
@@ -0,0 +1,220 @@
+import heapq
+from collections import deque
+
+from interface.snapshot import AMSRecord, AMSSnapshot
+from env.layout import HOME_NODES, OUT_NODE, CELL_TRAVEL_TIME, order_node_name
+from env.routing import GridRouter
+
+
+class _AMS:
+    """DES 백엔드 내부의 AMS 한 대 상태"""
+    __slots__ = ("index", "home", "pos", "destination", "phase", "path", "job", "orders")
+
+    def __init__(self, index, home):
+        self.index = index
+        self.home = home
+        self.pos = home
+        self.destination = None
+        self.phase = "idle"         # idle / to_pick / picking / to_out / dropping / homing
+        self.path = deque()
+        self.job = None             # (order, assign_time)
+        self.orders = deque()       # 대기 중인 (order, assign_time)
+
+    @property
+    def order_num(self):
+        return len(self.orders) + (1 if self.job is not None else 0)
+
+
+class DESInterface:
+    """
+    Plant Simulation 모델을 대체하는 순수 Python 이산 사건 시뮬레이터 (discrete-event stand-in)
+    - PlantsimInterface와 동일한 메서드를 제공하여 SimulationEnvironment에서 그대로 사용
+    - env.layout의 rack / via 배치 위를 AMS가 GridRouter 최단 경로로 한 칸씩 이동하며, 사건은 heap 기반 큐로 처리
+    - 벽시계 대기 없이 시뮬레이션 시간만 진행하므로 라이선스 없는 Linux / CI 환경에서 학습 가능
+    """
+    def __init__(self, num_ams=2, travel_time=CELL_TRAVEL_TIME, pick_time=5.0, drop_time=5.0, end_time=86400.0):
+        """
+        :param num_ams: AMS 대수 (Plant Simulation의 AGVPool.Amount에 해당)
+        :param travel_time: 격자 한 칸 이동 시간 (초)
+        :param pick_time: rack에서 픽업하는 시간 (초)
+        :param drop_time: out에서 하역하는 시간 (초)
+        :param end_time: 시뮬레이션 종료 시각 (초, isDone에 해당)
+        """
+        self.num_ams = num_ams
+        self.travel_time = travel_time
+        self.pick_time = pick_time
+        self.drop_time = drop_time
+        self.end_time = end_time
+        self.T = None
+
+        self._router = GridRouter(travel_time=travel_time)
+        self.reset_simulation()
+
+    # ─── Initialization ───
+
+    def initialize_model(self, model_path=None):
+        # 모델 파일은 사용하지 않음 (PlantsimInterface와 호출 형태만 맞춤)
+        self.reset_simulation()
+
+    def set_T(self, T):
+        self.T = T
+
+    # ─── Simulation Control ───
+
+    def check_simulation_ready(self):
+        return self._ready
+
+    def reset_simulation(self):
+        self.now = 0.0
+        self._events = []
+        self._seq = 0
+        self._running = False
+        self._ready = False
+        self._completions = []     # 모델의 결과 테이블에 해당 (order_id, leadtime) 추가 기록
+        self._result_cursor = 0
+        self._unclaimed = {}
+        self._ams = [_AMS(i, HOME_NODES[(i - 1) % len(HOME_NODES)]) for i in range(1, self.num_ams + 1)]
+
+    def start_simulation(self):
+        self._running = True
+        self._ready = True
+
+    def stop_simulation(self):
+        self._running = False
+
+    def reset_to_ready(self, T=200):
+        """에피소드 시작 상태까지 초기화 (준비 과정이 없으므로 항상 바로 준비됨)"""
+        self.reset_simulation()
+        self.set_T(T)
+        self.start_simulation()
+        return "cold"
+
+    def run_simulation_for_T(self, T=200):
+        """다음 오더 요청 시점(T초 후)까지 시뮬레이션 시간 진행"""
+        self._running = True
+        self._advance_to(self.now + T)
+
+    def quit(self):
+        self._events = []
+
+    # ─── Event Queue ───
+
+    def _schedule(self, delay, kind, ams):
+        self._seq += 1
+        heapq.heappush(self._events, (self.now + delay, self._seq, kind, ams.index))
+
+    def _advance_to(self, t):
+        t = min(t, self.end_time)
+        while self._events and self._events[0][0] <= t:
+            self._step()
+        self.now = max(self.now, t)
+
+    def _advance_until_idle(self):
+        while not self._has_idle() and self._events and self._events[0][0] <= self.end_time:
+            self._step()
+        if not self._has_idle():
+            # 더 이상 사건이 없으면 종료 시각까지 진행
+            self.now = max(self.now, self.end_time)
+
+    def _step(self):
+        time, _, kind, index = heapq.heappop(self._events)
+        self.now = time
+        ams = self._ams[index - 1]
+        if kind == "hop":
+            self._on_hop(ams)
+        elif kind == "picked":
+            ams.phase = "to_out"
+            self._move(ams, OUT_NODE)
+        elif kind == "dropped":
+            order, assign_time = ams.job
+            self._completions.append((order["order_id"], self.now - assign_time))
+            ams.job = None
+            if ams.orders:
+                self._dispatch(ams)
+            else:
+                ams.phase = "homing"
+                self._move(ams, ams.home)
+
+    # ─── AMS Behaviour ───
+
+    def _dispatch(self, ams):
+        ams.job = ams.orders.popleft()
+        ams.phase = "to_pick"
+        self._move(ams, order_node_name(ams.job[0]))
+
+    def _move(self, ams, target):
+        ams.destination = target
+        ams.path = deque(self._router.path(ams.pos, target))
+        if ams.path:
+            self._schedule(self.travel_time * self._router.edge_weight(ams.pos, ams.path[0]), "hop", ams)
+        else:
+            self._on_arrival(ams)
+
+    def _on_hop(self, ams):
+        ams.pos = ams.path.popleft()
+        if ams.phase == "homing" and ams.orders:
+            # 복귀 중 새 오더가 배정되면 현재 위치에서 바로 출발
+            self._dispatch(ams)
+        elif ams.path:
+            self._schedule(self.travel_time * self._router.edge_weight(ams.pos, ams.path[0]), "hop", ams)
+        else:
+            self._on_arrival(ams)
+
+    def _on_arrival(self, ams):
+        if ams.phase == "to_pick":
+            ams.phase = "picking"
+            self._schedule(self.pick_time, "picked", ams)
+        elif ams.phase == "to_out":
+            ams.phase = "dropping"
+            self._schedule(self.drop_time, "dropped", ams)
+        elif ams.phase == "homing":
+            ams.phase = "idle"
+            ams.destination = None
+
+    def _has_idle(self):
+        return any(ams.order_num < 1 for ams in self._ams)
+
+    # ─── State & Action Interface ───
+
+    def get_ams_state_dimension(self):
+        return self.num_ams * 5  # pos_row, pos_col, order_num, dest_row, dest_col
+
+    def get_action_dimension(self):
+        return self.num_ams
+
+    def read_ams_snapshot(self) -> AMSSnapshot:
+        return AMSSnapshot(self.now, tuple(AMSRecord(ams.pos, ams.destination, ams.order_num) for ams in self._ams))
+
+    def read_ams_table(self):
+        return list(self.read_ams_snapshot().records)
+
+    def assign_order(self, order, ams_index):
+        ams = self._ams[ams_index - 1]
+        ams.orders.append((order, self.now))
+        if ams.phase == "idle":
+            self._dispatch(ams)
+
+    def check_idle_ams(self):
+        if self._running:
+            # 실행 중인 시뮬레이션은 유휴 AMS가 생길 때까지 시간이 흐른 것으로 처리
+            self._advance_until_idle()
+        return self._has_idle()
+
+    def get_idle_mask(self):
+        return self.read_ams_snapshot().idle_mask()
+
+    def get_cache_stats(self):
+        # 원격 호출 계층이 없으므로 값 캐시도 없음
+        return {}
+
+    def check_simulation_ended(self):
+        return self.now >= self.end_time
+
+    def read_new_completions(self) -> list:
+        completions = self._completions[self._result_cursor:]
+        self._result_cursor = len(self._completions)
+        return completions
+
+    def get_completed_orders(self, pending_ids: list) -> list:
+        self._unclaimed.update(self.read_new_completions())
+        return [(order_id, self._unclaimed.pop(order_id)) for order_id in pending_ids if order_id in self._unclaimed]
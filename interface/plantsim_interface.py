@@ -1,52 +1,294 @@
-from plantsim.plantsim import Plantsim
+import os
+import glob
+import hashlib
 import time
+import warnings
+
+from plantsim.plantsim import Plantsim
 from config import DEFAULT_SIM_PARAMS
+from utils.wait import wait_until, DEFAULT_WAIT_TIMEOUT
+from interface.snapshot import AMSSnapshot, decode_completions, FIELD_SEP, RECORD_SEP, TIME_SEP
+from utils.profiler import profiled
+
+DEFAULT_WARM_START_DIR = os.path.join(".cache", "warm_start")
+
+# headless 모드에서 적용할 Eventcontroller 속성
+HEADLESS_SETTINGS = (
+    ("Eventcontroller.RealTime", False),    # 실시간 연동 해제
+    ("Eventcontroller.Speed", 100000),      # 애니메이션 지연 없는 최대 속도
+)
+
 
 class PlantsimInterface:
-    def __init__(self, version='24.4', visible=True, trust_model=True, license_type='Educational'):
-        self.plantsim = Plantsim(version=version, visible=True, license_type=license_type)
+    def __init__(self, version='24.4', visible=True, trust_model=False, license_type='Educational', wait_timeout=DEFAULT_WAIT_TIMEOUT,
+                 result_table="Result_tbl", warm_start=True, warm_start_dir=DEFAULT_WARM_START_DIR, headless=False,
+                 realtime_scale=None):
+        """
+        :param trust_model: True이면 모델의 호스트 접근(파일 / 외부 프로그램 등)을 허용 (명시적으로 지정할 때만)
+        :param wait_timeout: 시뮬레이터 대기 최대 시간 (초)
+        :param result_table: 모델이 완료 오더를 (order_id, leadtime) 행으로 추가하는 테이블 이름.
+                             모델에 없으면 오더별 get_result 조회로 동작
+        :param warm_start: True이면 에피소드 시작(simul_ready) 상태를 모델 사본으로 저장하여 reset_to_ready에서 재사용
+        :param warm_start_dir: warm-start 스냅샷 저장 디렉터리
+        :param headless: True이면 창을 숨기고 실시간 연동 / 애니메이션을 끈 채 최대 속도로 실행
+        :param realtime_scale: headless가 아닐 때의 Eventcontroller.RealtimeScale (None이면 config 값)
+        """
+        self.headless = headless
+        self.realtime_scale = realtime_scale if realtime_scale is not None else DEFAULT_SIM_PARAMS.get("RealtimeScale")
+        self.plantsim = Plantsim(version=version, visible=visible and not headless, trust_models=trust_model,
+                                 license_type=license_type)
+        self.plantsim.enable_events()
+        self.wait_timeout = wait_timeout
+        self.result_table = result_table
+        self._snapshot = None
+        self._result_cursor = 0
+        self._unclaimed = {}
+        self.warm_start_dir = warm_start_dir if warm_start else None
+        self.model_path = None
+        self._T = None  # 모델에 마지막으로 적용한 오더 간격
+        self._cold_reset_time = None  # 마지막 cold 초기화 소요 시간 (warm start가 더 빠른지 비교용)
 
     # ─── Initialization ───
 
     def initialize_model(self, model_path):
-        self.plantsim.load_model(model_path)
-        self.plantsim.set_path_context(".Models.Model")
-        self.plantsim.set_event_controller()
-        self.plantsim.set_value("Eventcontroller.RealtimeScale", DEFAULT_SIM_PARAMS.get("RealtimeScale"))
+        self.model_path = os.path.abspath(model_path)
+        self.plantsim.load_model(self.model_path)
+        self._configure_model()
         self.plantsim.reset_simulation()
+        self.plantsim.pin_static("AGVPool.Amount")
         self.num_ams = self.plantsim.get_value("AGVPool.Amount")
+        self._snapshot_source = self._build_snapshot_source()
+        self._completion_source = self._build_completion_source() if self._has_result_table() else None
+
+    def _configure_model(self):
+        self.plantsim.set_path_context(".Models.Model")
+        self.plantsim.set_event_controller()
+        if self.headless:
+            self._configure_headless()
+        else:
+            self.plantsim.set_value("Eventcontroller.RealtimeScale", self.realtime_scale)
+
+    def _configure_headless(self):
+        """
+        실시간 연동과 애니메이션을 끄고 Eventcontroller를 최대 속도로 설정
+        (Python 쪽은 request_order / simul_ready 같은 시뮬레이션 시간상의 결정 시점만 기다림)
+        """
+        for name, value in HEADLESS_SETTINGS:
+            try:
+                self.plantsim.set_value(name, value)
+            except Exception as e:
+                # 버전에 따라 없는 속성은 건너뜀
+                warnings.warn(f"Headless setting '{name}' not applied: {e!r}", RuntimeWarning)
 
     def set_T(self, T):
+        self._invalidate_snapshot()
         self.plantsim.set_value("T", T)
         self.plantsim.execute_simtalk("set_T")
+        self._T = T
+
+    def _build_snapshot_source(self):
+        """get_state 실행 후 AMS_tbl 전체를 하나의 문자열로 직렬화하는 SimTalk 코드 생성"""
+        ctx = self.plantsim.path_context
+        fields = f' + "{FIELD_SEP}" + '.join(
+            f'to_str({ctx}.AMS_tbl["{col}", i])' for col in ("current_pos", "destination", "order_num")
+        )
+        return "\n".join([
+            "->string",
+            "var t: real",
+            'var s: string := ""',
+            f"{ctx}.get_state",
+            f"t := {ctx}.Eventcontroller.SimTime",
+            f"for var i := 1 to {self.num_ams}",
+            f'    s := s + {fields} + "{RECORD_SEP}"',
+            "next",
+            f'return to_str(t) + "{TIME_SEP}" + s',
+        ])
+
+    def _has_result_table(self):
+        try:
+            self.plantsim.get_value(f"{self.result_table}.YDim")
+            return True
+        except Exception:
+            return False
+
+    def _build_completion_source(self):
+        """start 행부터 결과 테이블 끝까지의 (order_id, leadtime)을 하나의 문자열로 직렬화하는 SimTalk 코드 생성"""
+        table = f"{self.plantsim.path_context}.{self.result_table}"
+        return "\n".join([
+            "param start: integer -> string",
+            "var leadtime: real",
+            'var s: string := ""',
+            f"for var i := start to {table}.YDim",
+            f"    leadtime := {table}[2, i]",
+            f'    s := s + to_str({table}[1, i]) + "{FIELD_SEP}" + to_str(leadtime) + "{RECORD_SEP}"',
+            "next",
+            "return s",
+        ])
+
+    def _invalidate_snapshot(self):
+        self._snapshot = None
+
+    def _wait(self, predicate, name, message=None):
+        """
+        시뮬레이터 조건 대기
+        - message가 주어지면 모델이 fireSimTalkMessage로 보낸 이벤트를 먼저 확인
+        - 이벤트가 없으면 백오프 폴링으로 predicate 확인
+        """
+        if message is not None:
+            check = lambda: self.plantsim.pop_message(message) or predicate()
+        else:
+            check = predicate
+        if not wait_until(check, timeout=self.wait_timeout, name=name, pump=self.plantsim.pump_events):
+            raise TimeoutError(f"Timed out after {self.wait_timeout}s waiting for '{name}'.")
 
     # ─── Simulation Control ───
     def check_simulation_ready(self):
         return self.plantsim.get_value("simul_ready") == True
 
+    def _reset_bookkeeping(self):
+        self._invalidate_snapshot()
+        self._result_cursor = 0
+        self._unclaimed.clear()
+
     def reset_simulation(self):
         if not self.plantsim.event_controller:
             raise Exception('Event controller not set.')
+        self._reset_bookkeeping()
         self.plantsim.reset_simulation()
 
+    @profiled("plsim.start_simulation")
     def start_simulation(self):
         if not self.plantsim.event_controller:
             raise Exception('Event controller not set.')
+        self._invalidate_snapshot()
         self.plantsim.start_simulation()
 
+    @profiled("plsim.run_simulation_for_T")
     def run_simulation_for_T(self, T=200):
+        """
+        다음 오더 요청(request_order)까지 시뮬레이션 진행
+        :param T: 다음 오더까지의 간격. 모델에 적용된 값과 다르면 (도착 과정 사용 시) set_T로 먼저 적용
+        """
         if not self.plantsim.event_controller:
             raise Exception('Event controller not set.')
+        if T != self._T:
+            self.set_T(T)
+        self._invalidate_snapshot()
+        # 직전 대기가 폴링으로 먼저 끝나 request_order 이벤트가 남아 있으면, 모델이 다음 request_order에
+        # 도달하기 전에 이번 대기가 끝나므로 plsim_ready 설정 전에 버림
+        self.plantsim.pump_events()
+        self.plantsim.discard_messages("request_order")
+        self.plantsim.clock_running = True
         self.plantsim.set_value("plsim_ready", True)
-        while self.plantsim.get_value("request_order") != True:
-            time.sleep(1)  # 잠시 대기하여 값이 반영되도록 함        
-        time.sleep(1)  # 시뮬레이션이 시작되기 전에 잠시 대기
+        self._wait(lambda: self.plantsim.get_value("request_order") == True, "request_order", message="request_order")
+        # 오더 요청 시점에서 모델이 다음 결정을 기다리므로 시계가 멈춘 상태 (이후 값은 캐시 가능)
+        self.plantsim.clock_running = False
+        self.plantsim.invalidate_cache()
 
     def quit(self):
         self.plantsim.quit()
 
+    # ─── Warm Start ───
+
+    def _warm_snapshot_prefix(self):
+        """이 모델 파일(전체 경로)의 스냅샷 파일 이름 접두사. 이름이 같은 다른 경로의 모델과 구분"""
+        stem = os.path.splitext(os.path.basename(self.model_path))[0]
+        model_key = hashlib.blake2b(self.model_path.encode("utf-8"), digest_size=6).hexdigest()
+        return f"{stem}_{model_key}_"
+
+    def _warm_snapshot_path(self, T):
+        """모델 파일(경로, 크기, 수정 시각)과 T로 결정되는 스냅샷 경로. 둘 중 하나가 바뀌면 다른 파일이 됨"""
+        stat = os.stat(self.model_path)
+        key = hashlib.blake2b(f"{self.model_path}|{stat.st_size}|{stat.st_mtime_ns}|{T}".encode("utf-8"),
+                              digest_size=8).hexdigest()
+        return os.path.abspath(os.path.join(self.warm_start_dir, f"{self._warm_snapshot_prefix()}{key}.spp"))
+
+    def _remove_stale_snapshots(self, keep):
+        """
+        같은 모델의 이전 스냅샷 삭제
+        다른 워커가 저장 중인 임시 파일(*.tmp.spp)은 건드리지 않고, 이미 지워졌거나 사용 중인 파일은 건너뜀
+        """
+        for stale in glob.glob(os.path.join(self.warm_start_dir, f"{self._warm_snapshot_prefix()}*.spp")):
+            if stale.endswith(".tmp.spp") or os.path.abspath(stale) == keep:
+                continue
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+
+    def _save_warm_snapshot(self, path):
+        """준비 완료 상태를 모델 사본으로 저장하고 같은 모델의 이전 스냅샷 삭제"""
+        self.stop_simulation()
+        try:
+            os.makedirs(self.warm_start_dir, exist_ok=True)
+            self._remove_stale_snapshots(keep=path)
+            tmp_path = f"{path[:-len('.spp')]}.{os.getpid()}.tmp.spp"
+            self.plantsim.save_model(tmp_path)
+            os.replace(tmp_path, path)  # 다른 프로세스가 저장 중인 사본을 로드하지 않도록 완성 후 교체
+        except Exception as e:
+            # 저장이 불가능한 환경(라이선스 / 권한)에서는 warm start 없이 계속 진행
+            warnings.warn(f"Warm-start snapshot disabled: {e!r}", RuntimeWarning)
+            self.warm_start_dir = None
+        self.start_simulation()
+
+    def _warm_reset(self, path, T):
+        """
+        warm-start 스냅샷 사본을 로드하여 초기화
+        - 로드에 실패하면 원래 모델을 다시 열고 warm start를 끈 뒤 False 반환 (호출한 쪽에서 cold 초기화)
+        - 로드가 cold 초기화보다 느리면 이번 결과는 사용하고 이후 에피소드부터 warm start를 끔
+        :return: 초기화에 성공하면 True
+        """
+        start = time.perf_counter()
+        self._reset_bookkeeping()
+        try:
+            self.plantsim.load_model(path, strict=True)
+        except Exception as e:
+            warnings.warn(f"Warm-start snapshot load failed, using cold resets: {e!r}", RuntimeWarning)
+            self.warm_start_dir = None
+            self.plantsim.load_model(self.model_path)
+            self._configure_model()
+            self._T = None
+            return False
+        self.plantsim.clear_events()
+        self._configure_model()
+        self._T = T  # 스냅샷은 이 T로 준비된 상태
+        self.start_simulation()
+        elapsed = time.perf_counter() - start
+        if elapsed > self._cold_reset_time:
+            warnings.warn(f"Warm-start load took {elapsed:.1f}s, slower than a cold reset "
+                          f"({self._cold_reset_time:.1f}s); using cold resets.", RuntimeWarning)
+            self.warm_start_dir = None
+        return True
+
+    @profiled("plsim.reset_to_ready")
+    def reset_to_ready(self, T=200):
+        """
+        에피소드 시작(simul_ready) 상태까지 초기화
+        - 현재 모델 파일과 T에 해당하는 warm-start 스냅샷이 있으면 그 사본을 로드하여 reset / 준비 과정을 생략
+          (모델 로드는 수십 초가 걸릴 수 있으므로, 이 프로세스에서 cold 초기화 시간을 측정한 뒤에만 사용하고
+          로드가 더 느리거나 실패하면 cold 초기화로 전환)
+        - 없으면 reset → set_T → start → simul_ready 대기 후 그 상태를 스냅샷으로 저장
+        :return: "warm" (스냅샷 복원) 또는 "cold"
+        """
+        path = self._warm_snapshot_path(T) if self.warm_start_dir and self.model_path else None
+        if path and os.path.exists(path) and self._cold_reset_time is not None and self._warm_reset(path, T):
+            return "warm"
+
+        start = time.perf_counter()
+        self.reset_simulation()
+        self.set_T(T)
+        self.start_simulation()
+        self._wait(self.check_simulation_ready, "simul_ready")
+        self._cold_reset_time = time.perf_counter() - start
+        if path and self.warm_start_dir and not os.path.exists(path):
+            self._save_warm_snapshot(path)
+        return "cold"
+
+    @profiled("plsim.stop_simulation")
     def stop_simulation(self):
-        self.plantsim.execute_simtalk("eventcontroller.stop")
+        # 시계가 멈춘 동안에는 스냅샷을 재사용하므로, 실행 중에 읽은 스냅샷은 여기서 버림
+        self._invalidate_snapshot()
+        self.plantsim.stop_simulation()
 
     # ─── State & Action Interface ───
 
@@ -56,42 +298,70 @@ class PlantsimInterface:
     def get_action_dimension(self):
         return self.num_ams
 
+    @profiled("plsim.read_ams_snapshot")
+    def read_ams_snapshot(self) -> AMSSnapshot:
+        """
+        AMS_tbl 전체를 한 번의 SimTalk 호출로 읽어 AMSSnapshot으로 반환
+        시뮬레이션 시계가 멈춰 있는 동안에는 직전 스냅샷을 재사용
+        """
+        if self._snapshot is None or self.plantsim.clock_running:
+            payload = self.plantsim.run_simtalk(self._snapshot_source, read_only=True, label="ams_snapshot")
+            self._snapshot = AMSSnapshot.decode(payload)
+        return self._snapshot
+
     def read_ams_table(self):
-        result = []
-        self.plantsim.execute_simtalk("get_state")
-        for i in range(1, self.num_ams + 1):
-            pos = self.plantsim.get_value(f'AMS_tbl["current_pos", {i}]')
-            dest = self.plantsim.get_value(f'AMS_tbl["destination", {i}]')
-            order_num = self.plantsim.get_value(f'AMS_tbl["order_num", {i}]')
-            result.append((pos, dest, order_num))
-        return result
+        return list(self.read_ams_snapshot().records)
 
+    @profiled("plsim.assign_order")
     def assign_order(self, order, ams_index):
-        rack = order["order_rack"]
-        pos = order["order_pos"]
-        self.plantsim.set_value("OrderRack", rack)
-        self.plantsim.set_value("OrderPos", pos)
-        self.plantsim.set_value("AMSID", ams_index)
-        self.plantsim.execute_simtalk("assign_order")
+        # 세 값 설정과 assign_order 호출을 한 번의 SimTalk 호출로 실행
+        self._invalidate_snapshot()
+        self.plantsim.set_values({"OrderRack": str(order["order_rack"]), "OrderPos": int(order["order_pos"]),
+                                  "AMSID": int(ams_index)}, call="assign_order")
 
+    @profiled("plsim.check_idle_ams")
     def check_idle_ams(self):
-        self.plantsim.execute_simtalk("get_state")
-        for i in range(1, self.num_ams + 1):
-            order_num = self.plantsim.get_value(f'AMS_tbl["order_num", {i}]')
-            if order_num < 1:
-                return True
-        return False
+        return self.read_ams_snapshot().has_idle()
+
+    def get_idle_mask(self):
+        return self.read_ams_snapshot().idle_mask()
 
+    def get_cache_stats(self):
+        """COM 값 캐시 적중 / 실패 횟수"""
+        return self.plantsim.cache_stats()
+
+    @profiled("plsim.check_simulation_ended")
     def check_simulation_ended(self):
+        if self.plantsim.simulation_finished():
+            return True
         return self.plantsim.get_value("isDone") == True
 
+    @profiled("plsim.read_new_completions")
+    def read_new_completions(self) -> list:
+        """
+        직전 호출 이후 결과 테이블에 추가된 완료 오더를 한 번의 호출로 읽음
+        :return: [(order_id, leadtime), ...]
+        """
+        payload = self.plantsim.run_simtalk(self._completion_source, self._result_cursor + 1, read_only=True,
+                                         label="completions")
+        completions = decode_completions(payload)
+        self._result_cursor += len(completions)
+        return completions
+
+    @profiled("plsim.get_completed_orders")
     def get_completed_orders(self, pending_ids: list) -> list:
+        if self._completion_source is None:
+            return self._query_completed_orders(pending_ids)
+        # 아직 대기 버퍼에 없는 완료 오더는 다음 호출을 위해 보관
+        self._unclaimed.update(self.read_new_completions())
+        return [(order_id, self._unclaimed.pop(order_id)) for order_id in pending_ids if order_id in self._unclaimed]
+
+    def _query_completed_orders(self, pending_ids: list) -> list:
+        """결과 테이블이 없는 모델용: 오더별 get_result 조회"""
         completed = []
         for order_id in pending_ids:
-            self.plantsim.set_value("orderID_B", order_id)
-            leadtime = self.plantsim.execute_simtalk("get_result")
-            while self.plantsim.get_value("leadtime") == 0:
-                time.sleep(1)
+            self.plantsim.set_values({"orderID_B": str(order_id)}, call="get_result")
+            self._wait(lambda: self.plantsim.get_value("leadtime", cached=False) != 0, "leadtime")
             leadtime = self.plantsim.get_value("leadtime")
             if leadtime != -1:
                 completed.append((order_id, leadtime))
@@ -0,0 +1,268 @@
+"""
+상주 시뮬레이터 서버
+- 시뮬레이터(Plant Simulation COM 또는 DES)를 한 프로세스에 띄워 모델을 한 번만 로드하고 계속 유지
+- train.py / 대시보드는 RemoteInterface로 접속하여 매 학습 실행마다의 기동 / 라이선스 / 모델 로드 비용을 생략
+
+실행 예:
+    python -m interface.sim_server --backend plantsim --model tp_v11.spp --address 127.0.0.1:47800
+
+인증: multiprocessing.connection은 요청을 unpickle하므로, 키를 아는 쪽은 서버 권한으로 코드를 실행할 수 있음
+- 서버는 시작할 때마다 무작위 키를 만들어 소유자만 읽을 수 있는 키 파일(0600)에 기록
+  (환경 변수 PLANTSIM_SERVER_KEY에 16진수 키가 있으면 그 키 사용)
+- 클라이언트는 같은 환경 변수 또는 키 파일에서 키를 읽음
+- loopback이 아닌 주소에는 --allow-remote를 지정해야 바인드
+"""
+
+import os
+import pickle
+import inspect
+import argparse
+import ipaddress
+import secrets
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, Client
+
+from interface.backend import BACKENDS, create_interface
+from interface.trace import picklable_error
+
+DEFAULT_ADDRESS = "127.0.0.1:47800"
+AUTHKEY_ENV = "PLANTSIM_SERVER_KEY"
+DEFAULT_KEY_FILE = os.path.join(os.path.expanduser("~"), ".plantsim_rl", "sim_server.key")
+
+
+def parse_address(address):
+    """'host:port' 문자열 → (host, port)"""
+    if isinstance(address, tuple):
+        return address
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def is_loopback(host):
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def create_authkey(key_file=DEFAULT_KEY_FILE):
+    """
+    서버용 인증 키 준비: 환경 변수에 키가 있으면 사용, 없으면 무작위 키를 만들어 key_file에 0600 권한으로 기록
+    :return: 인증 키 bytes
+    """
+    if os.environ.get(AUTHKEY_ENV):
+        return bytes.fromhex(os.environ[AUTHKEY_ENV])
+    authkey = secrets.token_bytes(32)
+    os.makedirs(os.path.dirname(key_file), exist_ok=True)
+    if os.path.exists(key_file):
+        os.remove(key_file)  # 다른 권한으로 만들어진 기존 파일을 재사용하지 않음
+    fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(authkey.hex())
+    return authkey
+
+
+def load_authkey(key_file=DEFAULT_KEY_FILE):
+    """클라이언트용 인증 키: 환경 변수, 없으면 서버가 기록한 key_file"""
+    if os.environ.get(AUTHKEY_ENV):
+        return bytes.fromhex(os.environ[AUTHKEY_ENV])
+    if not os.path.exists(key_file):
+        raise FileNotFoundError(f"Simulator server key not found: set {AUTHKEY_ENV} or start the server "
+                                f"(it writes {key_file}).")
+    with open(key_file) as f:
+        return bytes.fromhex(f.read().strip())
+
+
+def interface_methods(interface):
+    """서버가 실행을 허용하는 메서드: 인터페이스 클래스에 정의된 공개 메서드만 (속성 / 내부 객체 제외)"""
+    return frozenset(name for name, _ in inspect.getmembers(type(interface), inspect.isfunction)
+                     if not name.startswith("_"))
+
+
+class SimulatorServer:
+    """
+    시뮬레이터를 소유하는 로컬 서버
+    - 백엔드 인스턴스와 (plantsim이면) COM 아파트를 서버 프로세스가 소유
+    - 요청은 [(메서드 이름, args, kwargs), ...] 배치 단위로 받아 순서대로 실행하고 [(성공 여부, 결과), ...]로 응답
+    - 클라이언트는 한 번에 하나씩 접속하며, 연결이 끊겨도 시뮬레이터와 로드된 모델은 유지
+    - 인증 실패 / 응답 전송 오류는 해당 연결에서만 처리하고 시뮬레이터는 계속 유지
+    """
+    def __init__(self, backend="plantsim", model_path=None, address=DEFAULT_ADDRESS, authkey=None,
+                 key_file=DEFAULT_KEY_FILE, allow_remote=False, **interface_kwargs):
+        """
+        :param backend: interface.backend.create_interface에 전달할 백엔드 이름
+        :param model_path: (선택적) 서버 시작 시 미리 로드할 모델 파일 경로
+        :param address: 'host:port' 또는 (host, port)
+        :param authkey: (선택적) 연결 인증 키. None이면 create_authkey로 생성
+        :param key_file: authkey를 생성할 때 기록할 키 파일
+        :param allow_remote: True이면 loopback이 아닌 주소에도 바인드
+        :param interface_kwargs: 인터페이스 생성 인자
+        """
+        self.backend = backend
+        self.address = parse_address(address)
+        if not allow_remote and not is_loopback(self.address[0]):
+            raise ValueError(f"Refusing to bind {self.address[0]}: the server executes pickled requests. "
+                             f"Use a loopback address or pass allow_remote=True (--allow-remote).")
+        self.key_file = key_file
+        self.authkey = authkey if authkey is not None else create_authkey(key_file)
+        self.interface_kwargs = interface_kwargs
+        self.model_path = None
+        self._initial_model = model_path
+        self._shutdown = False
+        self._methods = frozenset()
+        self.plsim = None
+
+    def serve_forever(self):
+        if self.backend == "plantsim":
+            import pythoncom
+            pythoncom.CoInitialize()
+
+        self.plsim = create_interface(self.backend, **self.interface_kwargs)
+        self._methods = interface_methods(self.plsim)
+        try:
+            if self._initial_model:
+                self._load_model(self._initial_model)
+            with Listener(self.address, authkey=self.authkey) as listener:
+                print(f"Simulator server ({self.backend}) listening on {self.address[0]}:{self.address[1]} "
+                      f"(key: {AUTHKEY_ENV if os.environ.get(AUTHKEY_ENV) else self.key_file})")
+                while not self._shutdown:
+                    try:
+                        conn = listener.accept()
+                    except (AuthenticationError, OSError, EOFError) as e:
+                        print(f"Rejected connection: {e!r}")
+                        continue
+                    with conn:
+                        try:
+                            self._serve_client(conn)
+                        except Exception as e:
+                            print(f"Client connection failed: {e!r}")
+        finally:
+            self.plsim.quit()
+
+    def _serve_client(self, conn):
+        while not self._shutdown:
+            try:
+                calls = conn.recv()
+            except (EOFError, OSError):
+                break
+            replies = [self._dispatch(name, args, kwargs) for name, args, kwargs in calls]
+            try:
+                conn.send(replies)
+            except (OSError, EOFError):
+                break
+            except Exception:
+                # 피클링할 수 없는 결과 (COM 객체 등)는 그 호출만 오류로 응답 (send는 피클링 후 전송하므로 스트림은 정상)
+                conn.send([(ok, result) if _is_picklable(result) else
+                           (False, RuntimeError(f"Result of '{name}' cannot be sent to the client: {result!r}"))
+                           for (name, _, _), (ok, result) in zip(calls, replies)])
+
+        # 다음 클라이언트가 멈춘 상태에서 시작하도록 정리
+        try:
+            self.plsim.stop_simulation()
+        except Exception:
+            pass
+
+    def _load_model(self, model_path):
+        """같은 모델이 이미 로드되어 있으면 건너뜀"""
+        model_path = os.path.abspath(model_path)
+        if model_path != self.model_path:
+            self.plsim.initialize_model(model_path)
+            self.model_path = model_path
+
+    def _dispatch(self, name, args, kwargs):
+        try:
+            if name == "initialize_model":
+                return True, self._load_model(*args, **kwargs)
+            if name == "quit":
+                return True, None  # 클라이언트의 종료 요청은 연결 해제만 의미, 시뮬레이터는 유지
+            if name == "shutdown":
+                self._shutdown = True
+                return True, None
+            if name not in self._methods:
+                raise AttributeError(f"'{name}' is not a public interface method.")
+            return True, getattr(self.plsim, name)(*args, **kwargs)
+        except Exception as e:
+            return False, picklable_error(e)
+
+
+def _is_picklable(value):
+    try:
+        pickle.dumps(value)
+        return True
+    except Exception:
+        return False
+
+
+class RemoteInterface:
+    """
+    SimulatorServer 접속 프록시 (PlantsimInterface / DESInterface와 같은 메서드 제공)
+    - 메서드 호출은 서버의 상주 시뮬레이터에서 실행
+    - batch()로 여러 호출을 한 번의 왕복으로 묶음
+    - quit()은 연결만 끊고 서버의 시뮬레이터는 유지 (서버 종료는 shutdown())
+    """
+    def __init__(self, address=DEFAULT_ADDRESS, authkey=None, key_file=DEFAULT_KEY_FILE):
+        """
+        :param address: 'host:port' 또는 (host, port)
+        :param authkey: (선택적) 연결 인증 키. None이면 load_authkey로 읽음
+        :param key_file: 서버가 기록한 키 파일
+        """
+        self._conn = Client(parse_address(address), authkey=authkey if authkey is not None else load_authkey(key_file))
+
+    def _request(self, calls):
+        self._conn.send(calls)
+        results = []
+        for ok, result in self._conn.recv():
+            if not ok:
+                raise result
+            results.append(result)
+        return results
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def call(*args, **kwargs):
+            return self._request([(name, args, kwargs)])[0]
+        return call
+
+    def batch(self, calls):
+        """
+        :param calls: [(메서드 이름, 인자...), ...]
+        :return: 호출 순서대로의 결과 리스트
+        """
+        return self._request([(name, tuple(args), {}) for name, *args in calls])
+
+    def quit(self):
+        """서버와의 연결 해제 (시뮬레이터는 종료하지 않음)"""
+        try:
+            self._request([("quit", (), {})])
+        finally:
+            self._conn.close()
+
+    def shutdown(self):
+        """서버와 시뮬레이터 종료"""
+        try:
+            self._request([("shutdown", (), {})])
+        finally:
+            self._conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="상주 시뮬레이터 서버 실행")
+    parser.add_argument("--backend", choices=BACKENDS, default="plantsim")
+    parser.add_argument("--model", default="tp_v11.spp", help="서버 시작 시 로드할 모델 파일")
+    parser.add_argument("--address", default=DEFAULT_ADDRESS, help="host:port")
+    parser.add_argument("--headless", action="store_true", help="창 / 애니메이션 / 실시간 연동 없이 최대 속도로 실행 (plantsim 백엔드)")
+    parser.add_argument("--key-file", default=DEFAULT_KEY_FILE,
+                        help=f"생성한 인증 키를 기록할 파일 (환경 변수 {AUTHKEY_ENV}가 있으면 그 키 사용)")
+    parser.add_argument("--allow-remote", action="store_true",
+                        help="loopback이 아닌 주소에도 바인드 (키를 가진 쪽은 서버에서 코드를 실행할 수 있음)")
+    args = parser.parse_args()
+    if args.headless and args.backend != "plantsim":
+        parser.error("--headless applies to the plantsim backend only.")
+
+    kwargs = {"headless": True} if args.headless else {}
+    SimulatorServer(args.backend, args.model, args.address, key_file=args.key_file, allow_remote=args.allow_remote,
+                    **kwargs).serve_forever()
@@ -0,0 +1,59 @@
+from typing import NamedTuple, Optional, Tuple, List
+
+FIELD_SEP = "|"
+RECORD_SEP = ";"
+TIME_SEP = "#"
+
+
+class AMSRecord(NamedTuple):
+    """AMS_tbl 한 행 (current_pos, destination, order_num)"""
+    pos: Optional[str]
+    destination: Optional[str]
+    order_num: int
+
+
+class AMSSnapshot(NamedTuple):
+    """
+    특정 시뮬레이션 시각의 AMS_tbl 전체 스냅샷
+    - 모델에서 한 번의 호출로 받은 구분자 문자열을 decode하여 생성
+    - 시뮬레이션 시계가 진행되기 전까지 get_state / has_idle_ams / idle mask에서 재사용
+    """
+    sim_time: float
+    records: Tuple[AMSRecord, ...]
+
+    @classmethod
+    def decode(cls, payload: str) -> "AMSSnapshot":
+        """
+        "sim_time#pos|dest|order_num;pos|dest|order_num;..." 형식의 문자열을 해석
+        :param payload: SimTalk에서 반환한 직렬화 문자열
+        """
+        sim_time, _, body = payload.partition(TIME_SEP)
+        records = []
+        for chunk in body.split(RECORD_SEP):
+            if not chunk:
+                continue
+            pos, dest, order_num = chunk.split(FIELD_SEP)
+            records.append(AMSRecord(pos or None, dest or None, int(float(order_num))))
+        return cls(float(sim_time), tuple(records))
+
+    def idle_mask(self) -> List[bool]:
+        """AMS별 유휴 여부 (order_num < 1)"""
+        return [record.order_num < 1 for record in self.records]
+
+    def has_idle(self) -> bool:
+        return any(record.order_num < 1 for record in self.records)
+
+
+def decode_completions(payload: str) -> List[Tuple[str, float]]:
+    """
+    완료 오더 피드 문자열 "order_id|leadtime;order_id|leadtime;..." 해석
+    :param payload: SimTalk에서 반환한 직렬화 문자열
+    :return: [(order_id, leadtime), ...]
+    """
+    completions = []
+    for chunk in payload.split(RECORD_SEP):
+        if not chunk:
+            continue
+        order_id, leadtime = chunk.split(FIELD_SEP)
+        completions.append((order_id, float(leadtime)))
+    return completions
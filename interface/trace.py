@@ -0,0 +1,152 @@
+"""
+시뮬레이터 호출 기록 / 재생
+- RecordingInterface: 인터페이스(PlantsimInterface 등)의 모든 메서드 호출과 결과를 트레이스 파일에 기록
+- ReplayInterface: 기록된 결과를 시뮬레이터 없이 순서대로 돌려주는 백엔드 (Backend: "replay")
+  → Windows / Plant Simulation 없이 SimulationEnvironment, train.run_training, 에이전트를 재현 / 벤치마크
+
+트레이스 형식: 호출마다 (메서드 이름, args, kwargs, 성공 여부, 결과 또는 예외)를 pickle 프레임으로 이어 붙임
+"""
+
+import pickle
+
+# 시뮬레이터 상태를 바꾸지 않는 조회 메서드.
+# 대기 루프의 폴링 횟수는 벽시계에 따라 달라지므로, 재생 시 조회 호출은 기록보다 많거나 적어도 허용
+QUERY_METHODS = frozenset({
+    "check_simulation_ready", "check_idle_ams", "check_simulation_ended", "get_idle_mask",
+    "read_ams_snapshot", "read_ams_table", "get_action_dimension", "get_ams_state_dimension", "get_cache_stats",
+})
+
+
+class TraceMismatchError(RuntimeError):
+    """재생 중 호출 순서가 트레이스와 맞지 않음"""
+
+
+def picklable_error(error):
+    """예외가 피클링되지 않으면 (예: COM 오류) 메시지만 담은 RuntimeError로 변환"""
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return RuntimeError(repr(error))
+
+
+class RecordingInterface:
+    """
+    인터페이스 호출 기록 래퍼
+    - 감싼 인터페이스와 같은 메서드를 제공하고, 호출과 결과(또는 예외)를 트레이스 파일에 추가
+    - 트레이스 하나는 실행 하나만 담음: 같은 경로의 기존 파일은 새로 씀 (두 실행이 이어 붙으면 재생 불가)
+    - 파일은 버퍼링하여 flush_every 호출마다 / quit()에서 기록
+    """
+    def __init__(self, inner, trace_path, flush_every=256):
+        """
+        :param inner: 기록할 인터페이스 (PlantsimInterface, DESInterface, RemoteInterface 등)
+        :param trace_path: 트레이스 파일 경로 (결과 폴더의 sim_trace.pkl 등)
+        :param flush_every: 디스크에 내보낼 호출 간격
+        """
+        self._inner = inner
+        self._file = open(trace_path, "wb")
+        self._flush_every = flush_every
+        self._pending = 0
+        self.trace_path = trace_path
+
+    def _write(self, record):
+        pickle.dump(record, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._pending += 1
+        if self._pending >= self._flush_every:
+            self._file.flush()
+            self._pending = 0
+
+    def __getattr__(self, name):
+        attr = getattr(self._inner, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            try:
+                result = attr(*args, **kwargs)
+            except Exception as e:
+                self._write((name, args, kwargs, False, picklable_error(e)))
+                raise
+            self._write((name, args, kwargs, True, result))
+            return result
+        return call
+
+    def quit(self):
+        try:
+            self._inner.quit()
+            self._write(("quit", (), {}, True, None))
+        finally:
+            self._file.close()
+
+
+def read_trace(trace_path):
+    """트레이스 파일의 모든 기록을 리스트로 반환"""
+    records = []
+    with open(trace_path, "rb") as f:
+        while True:
+            try:
+                records.append(pickle.load(f))
+            except EOFError:
+                break
+    return records
+
+
+class ReplayInterface:
+    """
+    트레이스 재생 백엔드
+    - 기록된 순서대로 결과를 반환 (예외였던 호출은 같은 예외 발생)
+    - 조회 메서드(QUERY_METHODS)는 폴링 횟수 차이를 흡수: 기록보다 적게 부르면 남은 조회 기록을 건너뛰고,
+      더 많이 부르면 같은 메서드의 직전 결과를 다시 반환
+    - 인자는 기본적으로 비교하지 않음 (탐험 행동 등으로 달라질 수 있음). strict=True이면 불일치 시 오류
+    """
+    def __init__(self, trace_path=None, strict=False):
+        """
+        :param trace_path: RecordingInterface가 기록한 트레이스 파일
+        :param strict: True이면 기록과 인자가 다른 호출에서 TraceMismatchError
+        """
+        if trace_path is None:
+            raise ValueError("The replay backend needs trace_path (e.g. results/<timestamp>/sim_trace.pkl).")
+        self._records = read_trace(trace_path)
+        self._names = {record[0] for record in self._records}
+        self._cursor = 0
+        self._last = {}
+        self.strict = strict
+
+    def _replay(self, name, args, kwargs):
+        while self._cursor < len(self._records):
+            record = self._records[self._cursor]
+            if record[0] == name:
+                self._cursor += 1
+                if self.strict and (record[1], record[2]) != (args, kwargs):
+                    raise TraceMismatchError(f"Call #{self._cursor} '{name}' was recorded with different arguments.")
+                self._last[name] = record
+                return record
+            if record[0] in QUERY_METHODS:
+                self._cursor += 1  # 재생 쪽에서 덜 폴링한 조회
+                self._last[record[0]] = record
+                continue
+            break
+
+        if name in QUERY_METHODS and name in self._last:
+            return self._last[name]  # 재생 쪽에서 더 폴링한 조회
+        expected = self._records[self._cursor][0] if self._cursor < len(self._records) else "<end of trace>"
+        raise TraceMismatchError(f"Replay expected '{expected}' but got '{name}' (call #{self._cursor + 1}).")
+
+    def __getattr__(self, name):
+        if name.startswith("_") or name not in self._names:
+            raise AttributeError(name)
+
+        def call(*args, **kwargs):
+            _, _, _, ok, result = self._replay(name, args, kwargs)
+            if not ok:
+                raise result
+            return result
+        return call
+
+    def initialize_model(self, model_path=None):
+        # 모델 파일 없이 기록된 초기화 결과만 소비
+        if "initialize_model" in self._names:
+            self._replay("initialize_model", (model_path,), {})
+
+    def quit(self):
+        pass
@@ -1,25 +1,63 @@
+import io
 import os
+import hashlib
+import tempfile
 import pandas as pd
 
+
+def ram_buffer_root():
+    """
+    Returns a RAM-backed directory for table buffers:
+    PLANTSIM_RAM_BUFFER if set (e.g. a RAM disk on Windows), /dev/shm on Linux, else the system temp folder
+    """
+    if os.environ.get('PLANTSIM_RAM_BUFFER'):
+        return os.environ['PLANTSIM_RAM_BUFFER']
+    if os.path.isdir('/dev/shm'):
+        return '/dev/shm'
+    return tempfile.gettempdir()
+
+
 class PandasTable():
 
-    def __init__(self, plantsim, object_name, table_buffer_path=''):
+    def __init__(self, plantsim, object_name, table_buffer_path='', append_only=False, ram_buffer=False,
+                 dtype=None, engine=None):
         """
         Pandas Table mapping for PlantSim Tables (e.g., DataTable, ExplorerTable)
         - stores table in a .txt file in the python script directory
         - returns that table as a pandas Dataframe
+        - skips reparsing if the exported file did not change (size / mtime / hash)
         :param plantsim: Plantsim instance (with loaded model) that is queried
         :param table_name: The object name within Plantsim relative to the current path context
         :param table_buffer_path: manually set path of the table_buffer relative to the current path context
+        :param append_only: if True, the table is treated as append-only (e.g. result logs) and only new rows are parsed
+        :param ram_buffer: if True and no table_buffer_path is given, the buffer is placed on a RAM-backed path
+        :param dtype: explicit column dtypes passed to pandas.read_csv
+        :param engine: pandas.read_csv parser engine (e.g. 'c' or 'pyarrow')
         """
         self.plantsim = plantsim
         self._table = None
         self._table_name = object_name
+        if ram_buffer and not table_buffer_path:
+            table_buffer_path = ram_buffer_root()
         self._table_buffer_path = os.path.join(table_buffer_path, 'table_buffer')
+        self._append_only = append_only
+        self._read_kwargs = {'delimiter': '\t'}
+        if dtype is not None:
+            self._read_kwargs['dtype'] = dtype
+        if engine is not None:
+            self._read_kwargs['engine'] = engine
+
+        self._signature = None      # (size, mtime_ns) of the last seen buffer file
+        self._digest = None         # hash of the last parsed content
+        self._parsed_size = 0       # number of bytes represented by self._table
 
         self.update()
 
     def update(self):
+        """
+        Exports the table from Plant Simulation and refreshes the DataFrame if the content changed
+        :return: True if the table was (re)parsed, False if it was unchanged
+        """
         # create table buffer directory
         if not os.path.exists(self._table_buffer_path):
             os.makedirs(self._table_buffer_path)
@@ -33,8 +71,41 @@ class PandasTable():
         command = f'{self._table_name}.schreibeDatei("{abs_buffer_file_path}")'
         self.plantsim.execute_simtalk(command)
 
-        # readout table from buffer
-        self._table = pd.read_csv(f'{abs_buffer_file_path}', delimiter='\t')
+        # skip if file metadata is unchanged
+        stat = os.stat(abs_buffer_file_path)
+        signature = (stat.st_size, stat.st_mtime_ns)
+        if self._table is not None and signature == self._signature:
+            return False
+        self._signature = signature
+
+        with open(abs_buffer_file_path, 'rb') as f:
+            data = f.read()
+
+        # skip if the file was rewritten with identical content
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if self._table is not None and digest == self._digest:
+            return False
+
+        if self._can_append(data):
+            new_rows = pd.read_csv(io.BytesIO(data[self._parsed_size:]), header=None,
+                                   names=list(self._table.columns), **self._read_kwargs)
+            self._table = pd.concat([self._table, new_rows], ignore_index=True)
+        else:
+            # readout table from buffer
+            self._table = pd.read_csv(io.BytesIO(data), **self._read_kwargs)
+
+        self._digest = digest
+        self._parsed_size = len(data)
+        return True
+
+    def _can_append(self, data):
+        """Previously parsed content is an unchanged, line-terminated prefix of the new content"""
+        if not self._append_only or self._table is None or len(data) <= self._parsed_size:
+            return False
+        prefix = data[:self._parsed_size]
+        if not prefix.endswith(b'\n'):
+            return False
+        return hashlib.blake2b(prefix, digest_size=16).digest() == self._digest
 
     @property
     def table(self):
@@ -4,9 +4,35 @@ Distributed under the MIT license, see the accompanying
 file LICENSE or https://opensource.org/licenses/MIT
 """
 
+from collections import deque
+
+import pythoncom
 import win32com.client as win32
 from .error_code import ErrorCode
 from .attribute_explorer import AttributeExplorer
+from utils import profiler
+
+VALUE_SEP = chr(31)  # separator of the serialized values in get_values / set_values
+MAX_PENDING_MESSAGES = 256  # unconsumed SimTalk messages kept by PlantsimEvents (oldest are dropped)
+
+
+class PlantsimEvents:
+    """
+    COM event sink for the RemoteControl object.
+    SimulationFinished is fired when the event controller reaches its end time,
+    SimTalkMessage is fired by fireSimTalkMessage("...") calls inside the model.
+    Only the last MAX_PENDING_MESSAGES messages are kept, so messages nobody consumes do not pile up.
+    """
+
+    def __init__(self):
+        self.simulation_finished = False
+        self.messages = deque(maxlen=MAX_PENDING_MESSAGES)
+
+    def OnSimulationFinished(self):
+        self.simulation_finished = True
+
+    def OnSimTalkMessage(self, msg):
+        self.messages.append(msg)
 
 
 class Plantsim:
@@ -41,10 +67,28 @@ class Plantsim:
 
         self.path_context = ''
         self.event_controller = ''
-
-    def load_model(self, filepath):
+        self.events = None
+        self._get_values_sources = {}
+        self._set_values_sources = {}
+
+        # Read-through value cache (see get_value)
+        self.clock_running = False
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._generation = 0
+        self._value_cache = {}
+        self._static_names = set()
+        self._static_values = {}
+
+    def load_model(self, filepath, strict=False):
+        """
+        :param strict: if True, every failed load is raised (by default only the license error is)
+        """
 
         print(f'Loading model "{filepath}"...\n')
+        self.clock_running = False
+        self._static_values.clear()
+        self.invalidate_cache()
         try:
             self.plantsim.LoadModel(filepath)
         except BaseException as e:
@@ -52,6 +96,13 @@ class Plantsim:
                 raise Exception(f'The license server or the selected license type "{self.license_type}" is not available.\n'
                                 + f'Make sure that the license server is up and running and you can connect to it (VPN etc.).\n'
                                 + f'Make sure that a valid license of type "{self.license_type}" is available in the license server.')
+            if strict:
+                raise
+
+    def save_model(self, filepath):
+
+        print(f'Saving model "{filepath}"...\n')
+        self.plantsim.SaveModel(filepath)
 
     def set_event_controller(self):
         self.event_controller = f'{self.path_context}.Eventcontroller'
@@ -65,6 +116,9 @@ class Plantsim:
         if not self.event_controller:
             raise Exception('You need to set an event controller first!')
 
+        self.clear_events()
+        self.clock_running = False
+        self.invalidate_cache()
         self.plantsim.ResetSimulation(self.event_controller)
 
     def start_simulation(self):
@@ -72,11 +126,83 @@ class Plantsim:
         if not self.event_controller:
             raise Exception('You need to set an event controller first!')
 
+        self.clock_running = True
+        self.invalidate_cache()
         self.plantsim.StartSimulation(self.event_controller)
 
+    def stop_simulation(self):
+
+        if not self.event_controller:
+            raise Exception('You need to set an event controller first!')
+
+        self.plantsim.ExecuteSimTalk(f'{self.event_controller}.stop')
+        self.clock_running = False
+        self.invalidate_cache()
+
+    def enable_events(self):
+        """
+        Subscribe to the COM events of Plant Simulation (see PlantsimEvents).
+        Events are only delivered while messages are pumped, e.g. via pump_events().
+        :return: True if the subscription succeeded
+        """
+        try:
+            self.events = win32.WithEvents(self.plantsim, PlantsimEvents)
+        except Exception:
+            self.events = None
+        return self.events is not None
+
+    def clear_events(self):
+        """Forget received events, e.g. after a reset or after loading a model"""
+        if self.events is not None:
+            self.events.simulation_finished = False
+            self.events.messages.clear()
+
+    def pump_events(self):
+        if self.events is not None:
+            pythoncom.PumpWaitingMessages()
+
+    def pop_message(self, message):
+        """
+        Consume a SimTalk message fired by the model
+        :return: True if the message was received since the last call
+        """
+        if self.events is None or message not in self.events.messages:
+            return False
+        self.events.messages.remove(message)
+        return True
+
+    def discard_messages(self, message):
+        """Drop every pending copy of a SimTalk message (e.g. one left over from an earlier wait)"""
+        if self.events is not None:
+            while message in self.events.messages:
+                self.events.messages.remove(message)
+
+    def simulation_finished(self):
+        return self.events is not None and self.events.simulation_finished
+
+    # Value cache
+    #
+    # get_value is read-through: while the simulation clock is stopped, a value read once is reused until the
+    # generation counter advances. The counter advances on start/stop/reset, set_value(s), execute_simtalk and
+    # non read-only run_simtalk calls. Names pinned with pin_static are kept until another model is loaded.
+
+    def invalidate_cache(self):
+        self._generation += 1
+
+    def pin_static(self, *object_names):
+        """Mark values that never change during the lifetime of the loaded model (e.g. 'AGVPool.Amount')"""
+        self._static_names.update(object_names)
+
+    def cache_stats(self):
+        """:return: dict with hits, misses and hit_rate of get_value"""
+        total = self.cache_hits + self.cache_misses
+        return {'hits': self.cache_hits, 'misses': self.cache_misses,
+                'hit_rate': self.cache_hits / total if total else 0.0}
+
     def get_object(self, object_name):
         # "Smart" getter that has some limited ability to decide which kind of object to return
 
+        self.pin_static(f'{object_name}.internalClassName')
         internal_class_name = self.get_value(f'{object_name}.internalClassName')
 
         if internal_class_name == 'AttributeExplorer':
@@ -91,13 +217,126 @@ class Plantsim:
         else:
             return self.get_value(object_name)
 
-    def get_value(self, object_name):
+    @staticmethod
+    def _com_call(key, func, *args):
+        """Calls a COM method and records its latency under key while profiling is enabled (utils.profiler)"""
+        if not profiler.enabled:
+            return func(*args)
+        with profiler.span(key):
+            return func(*args)
 
-        return self.plantsim.GetValue(object_name)
+    def get_value(self, object_name, cached=True):
+        """
+        :param cached: if False, always read through COM (the result still refreshes the cache)
+        """
+        if object_name in self._static_names:
+            if cached and object_name in self._static_values:
+                self.cache_hits += 1
+                return self._static_values[object_name]
+            self.cache_misses += 1
+            value = self._static_values[object_name] = self._com_call(f'com.get_value:{object_name}',
+                                                                      self.plantsim.GetValue, object_name)
+            return value
+
+        if cached and not self.clock_running:
+            entry = self._value_cache.get(object_name)
+            if entry is not None and entry[0] == self._generation:
+                self.cache_hits += 1
+                return entry[1]
+
+        self.cache_misses += 1
+        value = self._com_call(f'com.get_value:{object_name}', self.plantsim.GetValue, object_name)
+        if not self.clock_running:
+            self._value_cache[object_name] = (self._generation, value)
+        return value
 
     def set_value(self, object_name, value):
 
-        self.plantsim.SetValue(object_name, value)
+        self.invalidate_cache()
+        self._com_call(f'com.set_value:{object_name}', self.plantsim.SetValue, object_name, value)
+
+    def _absolute_name(self, object_name):
+        """Object name as seen from the root (names are relative to the path context unless they start with '.')"""
+        if object_name.startswith('.'):
+            return object_name
+        return f'{self.path_context}.{object_name}'
+
+    @staticmethod
+    def _parse_value(text):
+        """Converts a value serialized with to_str back into bool / int / float / str"""
+        if text in ('true', 'false'):
+            return text == 'true'
+        try:
+            return int(text)
+        except ValueError:
+            pass
+        try:
+            return float(text)
+        except ValueError:
+            return text
+
+    def get_values(self, object_names):
+        """
+        Read several values with a single generated SimTalk call
+        (the generated source is cached per name sequence and per path context)
+        :param object_names: sequence of object / attribute names, as for get_value
+        :return: list of values in the same order. Values are transferred as strings and converted
+                 back to bool / int / float where possible, so numeric-looking strings come back as numbers
+        """
+        key = (self.path_context, tuple(object_names))
+        source = self._get_values_sources.get(key)
+        if source is None:
+            fields = ' + chr(31) + '.join(f'to_str({self._absolute_name(name)})' for name in object_names)
+            source = f'->string\nreturn {fields}'
+            self._get_values_sources[key] = source
+        payload = self.run_simtalk(source, read_only=True, label='get_values')
+        return [self._parse_value(text) for text in payload.split(VALUE_SEP)]
+
+    def set_values(self, mapping, call=None):
+        """
+        Write several values with a single generated SimTalk call
+        The values are passed as one separator-joined string parameter and converted inside SimTalk,
+        so the generated source is cached per (names, value types, call) and reused for new values.
+        :param mapping: dict of object / attribute name -> value (bool, int, float or str)
+        :param call: (optional) method name (relative to the path context) to call after the assignments
+                     within the same SimTalk call
+        """
+        names = tuple(mapping)
+        values = [mapping[name] for name in names]
+        types = tuple(type(value).__name__ for value in values)
+        key = (self.path_context, names, types, call)
+        source = self._set_values_sources.get(key)
+        if source is None:
+            source = self._build_set_values_source(names, types, call)
+            self._set_values_sources[key] = source
+
+        texts = []
+        for value in values:
+            text = ('true' if value else 'false') if isinstance(value, bool) else str(value)
+            if VALUE_SEP in text:
+                raise ValueError(f'Value {value!r} contains the reserved separator chr(31).')
+            texts.append(text)
+        # Every field is terminated by the separator so that the SimTalk side can split uniformly
+        self.run_simtalk(source, ''.join(text + VALUE_SEP for text in texts), label=f'set_values:{call or ""}')
+
+    def _build_set_values_source(self, names, types, call):
+        converters = {'bool': 'str_to_bool({})', 'int': 'str_to_num({})', 'float': 'str_to_num({})', 'str': '{}'}
+        lines = [
+            'param s: string',
+            'var rest: string := s',
+            'var i: integer',
+        ]
+        for name, type_name in zip(names, types):
+            if type_name not in converters:
+                raise TypeError(f'Unsupported value type {type_name} for "{name}".')
+            lines += [
+                'i := pos(chr(31), rest)',
+                f'{self._absolute_name(name)} := {converters[type_name].format("copy(rest, 1, i - 1)")}',
+                'rest := copy(rest, i + 1, strLen(rest) - i)',
+            ]
+        if call:
+            lines.append(self._absolute_name(call))
+        return '\n'.join(lines)
 
     def execute_simtalk(self, command_string, parameter=None, from_path_context=True):
         """
@@ -114,10 +353,30 @@ class Plantsim:
         else:
             command_string = f'.{command_string}'
 
+        self.invalidate_cache()
+
+        key = f'com.execute_simtalk:{command_string}'
         if parameter:
-            self.plantsim.ExecuteSimTalk(command_string, parameter)
+            return self._com_call(key, self.plantsim.ExecuteSimTalk, command_string, parameter)
         else:
-            self.plantsim.ExecuteSimTalk(command_string)
+            return self._com_call(key, self.plantsim.ExecuteSimTalk, command_string)
+
+    def run_simtalk(self, source, parameter=None, read_only=False, label='program'):
+        """
+        Execute a complete SimTalk program (e.g. "->string; return ...") without any path prefix
+        and return its result. Object names inside the source have to be absolute.
+        :param source: SimTalk source code including the method signature
+        :param parameter: (optional); parameter passed to the program
+        :param read_only: True if the program does not change the model (keeps the value cache valid)
+        :param label: name under which the call is profiled (com.run_simtalk:<label>)
+        :return: return value of the SimTalk program
+        """
+        if not read_only:
+            self.invalidate_cache()
+        key = f'com.run_simtalk:{label}'
+        if parameter is not None:
+            return self._com_call(key, self.plantsim.ExecuteSimTalk, source, parameter)
+        return self._com_call(key, self.plantsim.ExecuteSimTalk, source)
 
 
     def quit(self):
@@ -4,35 +4,145 @@ Distributed under the MIT license, see the accompanying
 file LICENSE or https://opensource.org/licenses/MIT
 """
 
+import re
 from typing import List, Union, Dict
 
+import numpy as np
+
+CELL_SEP = chr(31)  # ASCII unit separator
+ROW_SEP = chr(30)   # ASCII record separator
+# Plain integer / decimal cells (no leading zeros as in IDs like "007", no "nan", "inf" or exponents)
+_INTEGER = re.compile(r'[+-]?(0|[1-9][0-9]*)')
+_DECIMAL = re.compile(r'[+-]?(0|[1-9][0-9]*)\.[0-9]+')
+
+
+def _typed_column(values: List[str]) -> np.ndarray:
+    """
+    Converts serialized cell strings of one column into a typed NumPy array
+    (int64, float64 or bool if all cells allow it, object otherwise)
+    Only plain integer / decimal cells count as numbers, so string columns that merely look numeric
+    (e.g. "007", "nan", "1e5") keep their strings.
+    """
+    if values and all(v in ('true', 'false') for v in values):
+        return np.array([v == 'true' for v in values], dtype=bool)
+    if all(_INTEGER.fullmatch(v) for v in values):
+        try:
+            return np.array([int(v) for v in values], dtype=np.int64)
+        except OverflowError:
+            return np.array(values, dtype=object)
+    if all(_INTEGER.fullmatch(v) or _DECIMAL.fullmatch(v) for v in values):
+        return np.array(values, dtype=np.float64)
+    return np.array(values, dtype=object)
+
+
+def _native_column(values: List) -> np.ndarray:
+    """
+    Converts already typed cell values (from GetValue) of one column into a NumPy array
+    (bool, int64 or float64 only if all cells have that Python type, object otherwise - no coercion)
+    """
+    types = {type(v) for v in values}
+    if len(types) == 1 and types <= {bool, int, float}:
+        return np.array(values)
+    return np.array(values, dtype=object)
+
 
 class Table:
 
-    def __init__(self, plantsim, table_name):
+    def __init__(self, plantsim, table_name, bulk=True):
         """
         Table mapping for PlantSim Tables (e.g., DataTable, ExplorerTable)
+        - the whole table is transferred with a single SimTalk call and stored column-major
         :param plantsim: Plantsim instance (with loaded model) that is queried
         :param table_name: The object name within Plantsim relative to the current path context
+        :param bulk: if False, every cell is fetched with its own GetValue call (legacy behaviour)
+        """
+        self._header = []
+        self._column_arrays = []
+        self._rows = None
+        self._rows_coldict = None
+        self._columns = None
+        self._columns_body = None
+        self._header_index = None
+
+        if bulk:
+            cells = self._fetch_bulk(plantsim, table_name)
+            to_array = _typed_column
+        else:
+            cells = self._fetch_cellwise(plantsim, table_name)
+            to_array = _native_column
+
+        if cells:
+            self._header = cells[0]
+            body_columns = zip(*cells[1:]) if len(cells) > 1 else [[] for _ in self._header]
+            self._column_arrays = [to_array(list(column)) for column in body_columns]
+
+    @staticmethod
+    def _fetch_bulk(plantsim, table_name) -> List[List]:
         """
-        self._rows = []
-        self._rows_coldict = []
+        Serializes the complete table (including row 0 and column 0) inside Plant Simulation
+        :return: 2-dim list of cell strings, row-first indexed
+        """
+        table = f'{plantsim.path_context}.{table_name}'
+        source = '\n'.join([
+            '->string',
+            'var s: string := ""',
+            f'if {table}.YDim < 1 or {table}.XDim < 1',
+            '    return s',
+            'end',
+            f'for var row := 0 to {table}.YDim',
+            f'    for var col := 0 to {table}.XDim',
+            '        if col > 0',
+            '            s := s + chr(31)',
+            '        end',
+            f'        s := s + to_str({table}[col, row])',
+            '    next',
+            '    s := s + chr(30)',
+            'next',
+            'return s',
+        ])
+        payload = plantsim.run_simtalk(source, read_only=True, label='table')
+        return [row.split(CELL_SEP) for row in payload.split(ROW_SEP) if row]
 
+    @staticmethod
+    def _fetch_cellwise(plantsim, table_name) -> List[List]:
+        rows = []
         row_count = plantsim.get_value(f'{table_name}.YDim')
         col_count = plantsim.get_value(f'{table_name}.XDim')
         if row_count > 0 and col_count > 0:
             for row_idx in range(row_count + 1):
-                row = []
-                row_coldict = {}
-                for col_idx in range(col_count + 1):
-                    cell_value = plantsim.get_value(f'{table_name}[{col_idx}, {row_idx}]')
-                    row.append(cell_value)
-                    if row_idx > 0:
-                        col_header = self.rows[0][col_idx]
-                        row_coldict[col_header] = cell_value
-                self._rows.append(row)
-                if row_idx > 0:
-                    self._rows_coldict.append(row_coldict)
+                rows.append([plantsim.get_value(f'{table_name}[{col_idx}, {row_idx}]')
+                             for col_idx in range(col_count + 1)])
+        return rows
+
+    @property
+    def column_arrays(self) -> List[np.ndarray]:
+        """
+        Returns the typed column storage without header (no copy)
+        :return: list of 1-dim NumPy arrays, one per column
+        """
+        return self._column_arrays
+
+    def get_column_array(self, col_header) -> np.ndarray:
+        """
+        Returns the typed column storage of a single column without header (no copy)
+        :param col_header: header of the column
+        :return: 1-dim NumPy array
+        """
+        return self._column_arrays[self._column_index(col_header)]
+
+    def _column_index(self, col_header) -> int:
+        if self._header_index is None:
+            self._header_index = {header: idx for idx, header in reversed(list(enumerate(self._header)))}
+        if col_header not in self._header_index:
+            raise IndexError(f'Column header "{col_header}" is not valid')
+        return self._header_index[col_header]
+
+    def to_dataframe(self):
+        """
+        Returns the table body as pandas DataFrame with the header as column names
+        """
+        import pandas as pd
+        return pd.DataFrame({header: column for header, column in zip(self._header, self._column_arrays)})
 
     @property
     def rows(self) -> List[List]:
@@ -40,6 +150,12 @@ class Table:
         Returns table data row-first indexed
         :return: 2-dim list containing table data row-first indexed
         """
+        if self._rows is None:
+            if self._header:
+                body = list(map(list, zip(*(column.tolist() for column in self._column_arrays))))
+                self._rows = [list(self._header)] + body
+            else:
+                self._rows = []
         return self._rows
 
     @property
@@ -48,7 +164,7 @@ class Table:
         Returns header (first table row)
         :return: list containing header elements
         """
-        return self.rows[0]
+        return self._header
 
     @property
     def rows_body(self) -> List[List]:
@@ -64,6 +180,8 @@ class Table:
         Returns table data row-first indexed. Each column is a Dict with header as key
         :return: list of dictionaries
         """
+        if self._rows_coldict is None:
+            self._rows_coldict = [dict(zip(self._header, row)) for row in self.rows_body]
         return self._rows_coldict
 
     @property
@@ -78,17 +196,25 @@ class Table:
     def columns(self) -> List[List]:
         """
         Returns table data column-first indexed.
-        :return: 2-dim list containing table data column-first indexed
+        :return: 2-dim list containing table data column-first indexed (fresh lists)
         """
-        return list(map(list, zip(*self.rows)))
+        if self._columns is None:
+            self._columns = [(header,) + column for header, column in zip(self._header, self._body_columns())]
+        return [list(column) for column in self._columns]
 
     @property
     def columns_body(self) -> List[List]:
         """
         Returns table data column-first indexed without header
-        :return: 2-dim list containing table data column-first indexed without header
+        :return: 2-dim list containing table data column-first indexed without header (fresh lists)
         """
-        return list(map(list, zip(*self.rows_body)))
+        return [list(column) for column in self._body_columns()]
+
+    def _body_columns(self) -> List[tuple]:
+        """Cached column-first body as tuples (callers get copies)"""
+        if self._columns_body is None:
+            self._columns_body = [tuple(column.tolist()) for column in self._column_arrays]
+        return self._columns_body
 
     def get_columns_by_idx(self, col_idxs: Union[int, List[int]], clip_header=False) -> Union[List, List[List]]:
         """
@@ -126,16 +252,14 @@ class Table:
         if not isinstance(col_headers, list):
             col_headers = [col_headers]
 
-        columns_input = self.columns
+        if include_header:
+            columns_input = self.columns
+        else:
+            columns_input = self.columns_body
 
         columns_output = []
         for col_header in col_headers:
-            if col_header not in self.header:
-                raise IndexError(f'Column header "{col_header}" is not valid')
-            column = columns_input[self.header.index(col_header)]
-            if not include_header:
-                column = column[1:]
-            columns_output.append(column)
+            columns_output.append(columns_input[self._column_index(col_header)])
 
         if len(columns_output) == 1:
             return columns_output[0]
@@ -0,0 +1,36 @@
+"""
+백그라운드 학습 스레드 (agent/async_learner.py)와 학습 루프의 종료 처리
+"""
+
+import os
+import threading
+
+import pytest
+
+import train
+from env.simulation_env import SimulationEnvironment
+
+ORDER_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "order_table.csv")
+
+
+def _learner_threads():
+    return [thread for thread in threading.enumerate() if thread.name == "AsyncLearner" and thread.is_alive()]
+
+
+def test_serial_loop_stops_learner_when_an_episode_fails(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = {"count": 0}
+    run = SimulationEnvironment.run_simulation_for_T
+
+    def failing_run(self, T):
+        calls["count"] += 1
+        if calls["count"] == 20:
+            raise RuntimeError("simulator lost")
+        return run(self, T)
+
+    monkeypatch.setattr(SimulationEnvironment, "run_simulation_for_T", failing_run)
+    params = {"Episode": 1, "Backend": "des", "Seed": 0, "AsyncLearner": 1, "CheckpointInterval": 0,
+              "MemoryCapacity": 1000, "BatchSize": 8}
+    with pytest.raises(RuntimeError, match="simulator lost"):
+        train.run_training(params, csv_path=ORDER_CSV)
+    assert _learner_threads() == []
@@ -0,0 +1,78 @@
+"""
+replay memory 체크포인트: ReplayBuffer / PrioritizedReplayBuffer dump / restore
+"""
+
+import numpy as np
+import pytest
+
+from buffer.prioritized_replay_buffer import PrioritizedReplayBuffer
+from buffer.replay_buffer import MEMORY_ARRAYS, ReplayBuffer
+
+STATE_DIM = 3
+
+
+def _fill(memory, start, count):
+    for i in range(start, start + count):
+        memory.push(np.full(STATE_DIM, i, dtype=np.float32), i, float(i), np.full(STATE_DIM, -i, dtype=np.float32))
+
+
+def _assert_same(a, b):
+    for name in MEMORY_ARRAYS:
+        np.testing.assert_array_equal(getattr(a, name)[:len(a)], getattr(b, name)[:len(b)])
+
+
+def test_dump_restore_round_trip(tmp_path):
+    memory = ReplayBuffer(8, STATE_DIM, seed=0)
+    _fill(memory, 0, 5)
+    meta = memory.dump(tmp_path / "memory")
+
+    restored = ReplayBuffer(8, STATE_DIM, seed=1)
+    restored.restore(tmp_path / "memory", meta)
+    assert len(restored) == 5
+    _assert_same(memory, restored)
+    for a, b in zip(memory.sample(3), restored.sample(3)):
+        np.testing.assert_array_equal(a, b)
+
+
+def test_incremental_dump_after_wrap(tmp_path):
+    memory = ReplayBuffer(8, STATE_DIM, seed=0)
+    _fill(memory, 0, 6)
+    memory.dump(tmp_path / "memory")
+    _fill(memory, 6, 5)  # ring buffer가 한 바퀴 돌아 앞쪽 행을 덮어씀
+    meta = memory.dump(tmp_path / "memory")  # 바뀐 행만 다시 기록
+
+    restored = ReplayBuffer(8, STATE_DIM)
+    restored.restore(tmp_path / "memory", meta)
+    _assert_same(memory, restored)
+    assert restored.actions.tolist() == [8, 9, 10, 3, 4, 5, 6, 7]
+
+    # 재개 후에도 같은 위치부터 이어서 저장
+    _fill(restored, 11, 2)
+    _fill(memory, 11, 2)
+    meta = restored.dump(tmp_path / "memory")
+    again = ReplayBuffer(8, STATE_DIM)
+    again.restore(tmp_path / "memory", meta)
+    _assert_same(memory, again)
+
+
+def test_restore_rejects_other_shape(tmp_path):
+    memory = ReplayBuffer(8, STATE_DIM)
+    _fill(memory, 0, 2)
+    meta = memory.dump(tmp_path / "memory")
+    with pytest.raises(ValueError):
+        ReplayBuffer(16, STATE_DIM).restore(tmp_path / "memory", meta)
+
+
+def test_prioritized_dump_restore(tmp_path):
+    memory = PrioritizedReplayBuffer(16, STATE_DIM, seed=0)
+    _fill(memory, 0, 10)
+    memory.update_priorities([1, 2], [5.0, 7.0])
+    memory.sample(4)
+    meta = memory.dump(tmp_path / "memory")
+
+    restored = PrioritizedReplayBuffer(16, STATE_DIM, seed=1)
+    restored.restore(tmp_path / "memory", meta)
+    _assert_same(memory, restored)
+    np.testing.assert_array_equal(restored.tree.tree, memory.tree.tree)
+    assert restored.beta == memory.beta
+    np.testing.assert_array_equal(restored.sample(4)[4], memory.sample(4)[4])
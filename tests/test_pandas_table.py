@@ -0,0 +1,76 @@
+"""
+변경 감지 / 추가 전용 파싱 PandasTable (plantsim/pandas_table.py)
+"""
+
+import pandas as pd
+import pytest
+
+from plantsim import pandas_table
+from plantsim.pandas_table import PandasTable
+
+HEADER = b"order_id\tleadtime\n"
+
+
+class FakePlantsim:
+    """schreibeDatei 호출 시 content를 버퍼 파일로 내보내는 테스트용 모델"""
+    def __init__(self, content):
+        self.content = content
+
+    def execute_simtalk(self, command):
+        path = command[command.index('("') + 2:command.rindex('")')]
+        with open(path, "wb") as f:
+            f.write(self.content)
+
+
+@pytest.fixture
+def parsed_sizes(monkeypatch):
+    """read_csv에 전달된 바이트 수 기록"""
+    sizes = []
+    read_csv = pd.read_csv
+
+    def spy(buffer, **kwargs):
+        sizes.append(len(buffer.getbuffer()))
+        return read_csv(buffer, **kwargs)
+
+    monkeypatch.setattr(pandas_table.pd, "read_csv", spy)
+    return sizes
+
+
+def test_unchanged_export_is_not_reparsed(tmp_path, parsed_sizes):
+    plantsim = FakePlantsim(HEADER + b"A1\t10\n")
+    table = PandasTable(plantsim, "Result_tbl", table_buffer_path=str(tmp_path))
+    assert table.table.to_dict("list") == {"order_id": ["A1"], "leadtime": [10]}
+
+    assert not table.update()  # 같은 내용으로 다시 기록 (해시 비교)
+    assert len(parsed_sizes) == 1
+
+
+def test_append_only_parses_new_rows(tmp_path, parsed_sizes):
+    plantsim = FakePlantsim(HEADER + b"A1\t10\n")
+    table = PandasTable(plantsim, "Result_tbl", table_buffer_path=str(tmp_path), append_only=True)
+
+    new_rows = b"B2\t20\nC3\t30\n"
+    plantsim.content += new_rows
+    assert table.update()
+    assert parsed_sizes[-1] == len(new_rows)
+    assert table.table.to_dict("list") == {"order_id": ["A1", "B2", "C3"], "leadtime": [10, 20, 30]}
+
+
+def test_append_only_reparses_when_prefix_changes(tmp_path, parsed_sizes):
+    plantsim = FakePlantsim(HEADER + b"A1\t10\n")
+    table = PandasTable(plantsim, "Result_tbl", table_buffer_path=str(tmp_path), append_only=True)
+
+    plantsim.content = HEADER + b"A1\t11\nB2\t20\n"
+    assert table.update()
+    assert parsed_sizes[-1] == len(plantsim.content)
+    assert table.table.to_dict("list") == {"order_id": ["A1", "B2"], "leadtime": [11, 20]}
+
+
+def test_without_append_only_every_change_is_reparsed(tmp_path, parsed_sizes):
+    plantsim = FakePlantsim(HEADER + b"A1\t10\n")
+    table = PandasTable(plantsim, "Result_tbl", table_buffer_path=str(tmp_path))
+
+    plantsim.content += b"B2\t20\n"
+    assert table.update()
+    assert parsed_sizes[-1] == len(plantsim.content)
+    assert len(table.table) == 2
@@ -0,0 +1,89 @@
+"""
+일괄 읽기/쓰기 (Plantsim.get_values / set_values): 생성되는 SimTalk 소스와 캐시
+"""
+
+import pytest
+
+pytest.importorskip("pythoncom")
+pytest.importorskip("win32com.client")
+
+from plantsim.plantsim import VALUE_SEP, Plantsim
+
+
+class FakeRemoteControl:
+    """ExecuteSimTalk 호출을 기록하고 정해진 결과를 돌려주는 테스트용 COM 객체"""
+    def __init__(self, result=None):
+        self.result = result
+        self.calls = []
+
+    def ExecuteSimTalk(self, *args):
+        self.calls.append(args)
+        return self.result
+
+
+def _plantsim(result=None, path_context=".Models.Model"):
+    plantsim = Plantsim.__new__(Plantsim)
+    plantsim.plantsim = FakeRemoteControl(result)
+    plantsim.path_context = path_context
+    plantsim._get_values_sources = {}
+    plantsim._set_values_sources = {}
+    plantsim._generation = 0
+    return plantsim
+
+
+def test_get_values_reads_all_names_in_one_call():
+    plantsim = _plantsim(VALUE_SEP.join(["true", "3", "2.5", "rack1"]))
+    assert plantsim.get_values(["Flag", "AGVPool.Amount", ".Models.Other.Ratio", "Name"]) == [True, 3, 2.5, "rack1"]
+    (source,), = plantsim.plantsim.calls
+    assert source == ("->string\nreturn to_str(.Models.Model.Flag) + chr(31) + to_str(.Models.Model.AGVPool.Amount)"
+                      " + chr(31) + to_str(.Models.Other.Ratio) + chr(31) + to_str(.Models.Model.Name)")
+    assert plantsim._generation == 0  # 읽기 전용 호출은 캐시를 무효화하지 않음
+
+
+def test_get_values_source_is_cached_per_names_and_path_context():
+    plantsim = _plantsim("1" + VALUE_SEP + "2")
+    plantsim.get_values(["A", "B"])
+    plantsim.get_values(("A", "B"))
+    assert len(plantsim._get_values_sources) == 1
+    plantsim.path_context = ".Models.Copy"
+    plantsim.get_values(["A", "B"])
+    assert len(plantsim._get_values_sources) == 2
+    assert plantsim.plantsim.calls[-1][0] == "->string\nreturn to_str(.Models.Copy.A) + chr(31) + to_str(.Models.Copy.B)"
+
+
+def test_set_values_generates_typed_assignments():
+    plantsim = _plantsim()
+    plantsim.set_values({"Flag": True, "Count": 3, "Ratio": 0.5, "Name": "rack1"}, call="Dispatch")
+    (source, payload), = plantsim.plantsim.calls
+    step = "\nrest := copy(rest, i + 1, strLen(rest) - i)\ni := pos(chr(31), rest)\n"
+    assert source == (
+        "param s: string\nvar rest: string := s\nvar i: integer\ni := pos(chr(31), rest)\n"
+        ".Models.Model.Flag := str_to_bool(copy(rest, 1, i - 1))" + step
+        + ".Models.Model.Count := str_to_num(copy(rest, 1, i - 1))" + step
+        + ".Models.Model.Ratio := str_to_num(copy(rest, 1, i - 1))" + step
+        + ".Models.Model.Name := copy(rest, 1, i - 1)"
+        + "\nrest := copy(rest, i + 1, strLen(rest) - i)\n.Models.Model.Dispatch")
+    assert payload == VALUE_SEP.join(["true", "3", "0.5", "rack1"]) + VALUE_SEP
+    assert plantsim._generation == 1  # 쓰기는 값 캐시를 무효화
+
+
+def test_set_values_reuses_source_for_new_values_of_the_same_types():
+    plantsim = _plantsim()
+    plantsim.set_values({"Count": 1, "Flag": False})
+    plantsim.set_values({"Count": 7, "Flag": True})
+    assert len(plantsim._set_values_sources) == 1
+    first, second = plantsim.plantsim.calls
+    assert first[0] == second[0]
+    assert second[1] == "7" + VALUE_SEP + "true" + VALUE_SEP
+
+    plantsim.set_values({"Count": 1.5, "Flag": False})  # 타입이 바뀌면 변환식이 달라지므로 새 소스
+    assert len(plantsim._set_values_sources) == 2
+
+
+def test_set_values_rejects_unsupported_types_and_separator():
+    plantsim = _plantsim()
+    with pytest.raises(TypeError):
+        plantsim.set_values({"Items": [1, 2]})
+    with pytest.raises(ValueError):
+        plantsim.set_values({"Name": "a" + VALUE_SEP + "b"})
+    assert plantsim.plantsim.calls == []
@@ -0,0 +1,45 @@
+"""
+SumTree / 우선순위 경험 재생 (buffer/prioritized_replay_buffer.py)
+"""
+
+import numpy as np
+import pytest
+
+from buffer.prioritized_replay_buffer import PrioritizedReplayBuffer, SumTree
+
+STATE_DIM = 3
+
+
+def _fill(memory, start, count):
+    for i in range(start, start + count):
+        memory.push(np.full(STATE_DIM, i, dtype=np.float32), i, float(i), np.full(STATE_DIM, -i, dtype=np.float32))
+
+
+def test_sum_tree_total_and_find():
+    tree = SumTree(5)
+    tree.update([0, 1, 2, 3, 4], [1.0, 2.0, 3.0, 4.0, 0.0])
+    assert tree.total() == 10.0
+    np.testing.assert_array_equal(tree.find([0.5, 1.5, 2.9, 3.5, 6.5, 9.99]), [0, 1, 1, 2, 3, 3])
+
+    tree.update([3], [0.0])
+    assert tree.total() == 6.0
+    np.testing.assert_array_equal(tree.get([0, 3]), [1.0, 0.0])
+
+
+def test_new_transitions_get_max_priority():
+    memory = PrioritizedReplayBuffer(8, STATE_DIM, alpha=1.0)
+    _fill(memory, 0, 2)
+    memory.update_priorities([0], [3.0])
+    _fill(memory, 2, 1)
+    assert memory.tree.get([2])[0] == pytest.approx(3.0 + memory.eps)
+
+
+def test_prioritized_sampling_follows_priorities():
+    memory = PrioritizedReplayBuffer(8, STATE_DIM, alpha=1.0, seed=0)
+    _fill(memory, 0, 8)
+    memory.update_priorities(np.arange(8), np.where(np.arange(8) == 5, 1000.0, 0.0))
+
+    _, actions, _, _, indices, weights = memory.sample(64)
+    assert np.mean(actions == 5) > 0.9
+    np.testing.assert_array_equal(actions, indices)
+    assert weights.max() == pytest.approx(1.0)
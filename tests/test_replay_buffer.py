@@ -0,0 +1,49 @@
+"""
+NumPy ring buffer (buffer/replay_buffer.py)
+"""
+
+import numpy as np
+import pytest
+
+from buffer.replay_buffer import ReplayBuffer
+
+STATE_DIM = 3
+
+
+def _fill(memory, start, count):
+    for i in range(start, start + count):
+        memory.push(np.full(STATE_DIM, i, dtype=np.float32), i, float(i), np.full(STATE_DIM, -i, dtype=np.float32))
+
+
+def test_push_overwrites_oldest_when_full():
+    memory = ReplayBuffer(4, STATE_DIM)
+    _fill(memory, 0, 6)
+    assert len(memory) == 4
+    assert memory.actions.tolist() == [4, 5, 2, 3]
+    np.testing.assert_array_equal(memory.next_states[1], np.full(STATE_DIM, -5))
+
+
+def test_sample_returns_typed_batches_without_duplicates():
+    memory = ReplayBuffer(16, STATE_DIM, seed=0)
+    _fill(memory, 0, 10)
+    states, actions, rewards, next_states = memory.sample(10)
+    assert (states.dtype, actions.dtype, rewards.dtype, next_states.dtype) == \
+        (np.float32, np.int64, np.float32, np.float32)
+    assert states.shape == (10, STATE_DIM)
+    assert sorted(actions.tolist()) == list(range(10))
+    np.testing.assert_array_equal(states[:, 0], actions)
+    np.testing.assert_array_equal(next_states[:, 0], -actions)
+
+
+def test_seeded_sampling_is_reproducible():
+    a, b = ReplayBuffer(16, STATE_DIM, seed=3), ReplayBuffer(16, STATE_DIM, seed=3)
+    _fill(a, 0, 12)
+    _fill(b, 0, 12)
+    np.testing.assert_array_equal(a.sample(5)[1], b.sample(5)[1])
+
+
+def test_sample_larger_than_buffer_fails():
+    memory = ReplayBuffer(8, STATE_DIM)
+    _fill(memory, 0, 2)
+    with pytest.raises(ValueError):
+        memory.sample(3)
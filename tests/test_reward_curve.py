@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from utils.reward_curve import RewardCurve
+
+
+def test_curve_keeps_exact_points_until_full():
+    curve = RewardCurve(max_buckets=4)
+    for value in (1.0, -2.0, 3.0):
+        curve.add(value)
+    steps, means, mins, maxs = curve.snapshot()
+    np.testing.assert_array_equal(steps, [0, 1, 2])
+    np.testing.assert_array_equal(means, [1.0, -2.0, 3.0])
+    np.testing.assert_array_equal(mins, means)
+    np.testing.assert_array_equal(maxs, means)
+
+
+def test_curve_halves_resolution_and_keeps_aggregates():
+    curve = RewardCurve(max_buckets=4)
+    values = np.arange(10, dtype=float)
+    for value in values:
+        curve.add(value)
+    assert curve.width == 4
+    steps, means, mins, maxs = curve.snapshot()
+    assert len(steps) == 3
+    np.testing.assert_array_equal(mins, [0, 4, 8])
+    np.testing.assert_array_equal(maxs, [3, 7, 9])
+    np.testing.assert_array_equal(means, [1.5, 5.5, 8.5])
+    np.testing.assert_array_equal(steps, [1.5, 5.5, 8.5])
+
+
+def test_curve_state_round_trip():
+    curve = RewardCurve(max_buckets=4)
+    for value in range(7):
+        curve.add(float(value))
+    restored = RewardCurve(max_buckets=4)
+    restored.set_state(curve.get_state())
+    for a, b in zip(curve.snapshot(), restored.snapshot()):
+        np.testing.assert_array_equal(a, b)
+
+    with pytest.raises(ValueError):
+        RewardCurve(max_buckets=8).set_state(curve.get_state())
+    with pytest.raises(ValueError):
+        RewardCurve(max_buckets=3)
@@ -0,0 +1,49 @@
+import math
+import os
+
+import pytest
+
+from env.layout import CELL_TRAVEL_TIME
+from env.routing import GridRouter
+
+GRID = [
+    ["rack1_0", "rack1_1", None],
+    ["via_0", "via_1", "via_2"],
+    ["home1", None, "out"],
+]
+
+
+def test_shortest_paths_do_not_pass_through_racks(tmp_path):
+    router = GridRouter(node_grid=GRID, extra_links=[], cache_dir=None)
+    assert router.distance("home1", "out") == 4
+    assert router.path("home1", "out") == ["via_0", "via_1", "via_2", "out"]
+    # rack1_0 → rack1_1은 인접하지만 rack끼리는 연결되지 않으므로 via를 거침
+    assert router.distance("rack1_0", "rack1_1") == 3
+    assert router.path("rack1_0", "rack1_1") == ["via_0", "via_1", "rack1_1"]
+    assert router.eta("home1", "rack1_1") == pytest.approx(3 * CELL_TRAVEL_TIME)
+
+
+def test_extra_links_and_unreachable_nodes():
+    grid = [["home1", None, "out"], [None, None, "via_9"]]
+    router = GridRouter(node_grid=grid, extra_links=[("home1", "out")], cache_dir=None)
+    assert router.distance("home1", "via_9") == 3
+    assert router.path("home1", "via_9") == ["out", "via_9"]
+
+    isolated = GridRouter(node_grid=grid, extra_links=[], cache_dir=None)
+    assert math.isinf(isolated.distance("home1", "out"))
+    with pytest.raises(ValueError):
+        isolated.path("home1", "out")
+
+
+def test_distance_matrix_is_cached_by_layout(tmp_path):
+    cache_dir = str(tmp_path / "routing")
+    router = GridRouter(node_grid=GRID, extra_links=[], cache_dir=cache_dir)
+    assert os.listdir(cache_dir) == [f"routing_{router.layout_hash}.npz"]
+
+    cached = GridRouter(node_grid=GRID, extra_links=[], cache_dir=cache_dir)
+    assert (cached.dist == router.dist).all()
+    assert (cached.next_hop == router.next_hop).all()
+
+    other = GridRouter(node_grid=GRID, extra_links=[("home1", "out")], cache_dir=cache_dir)
+    assert other.layout_hash != router.layout_hash
+    assert other.distance("home1", "out") == 2
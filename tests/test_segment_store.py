@@ -0,0 +1,66 @@
+"""
+디스크 기반 추가 전용 replay 저장소 (buffer/segment_store.py)
+"""
+
+import numpy as np
+import pytest
+
+from buffer.segment_store import SegmentReplayStore
+
+STATE_DIM = 3
+
+
+def _fill(memory, start, count):
+    for i in range(start, start + count):
+        memory.push(np.full(STATE_DIM, i, dtype=np.float32), i, float(i), np.full(STATE_DIM, -i, dtype=np.float32))
+
+
+def test_segment_store_spans_segments_and_persists(tmp_path):
+    root = str(tmp_path / "store")
+    store = SegmentReplayStore(root, STATE_DIM, segment_rows=4, flush_every=3, seed=0)
+    _fill(store, 0, 10)
+    assert len(store) == 10
+
+    records = store.read([9, 0, 5, 4])
+    assert records["action"].tolist() == [0, 4, 5, 9]
+    np.testing.assert_array_equal(records["next_state"][-1], np.full(STATE_DIM, -9))
+
+    states, actions, rewards, next_states = store.sample(10)
+    assert sorted(actions.tolist()) == list(range(10))
+    np.testing.assert_array_equal(states[:, 0], actions)
+    np.testing.assert_array_equal(rewards, actions)
+    assert states.flags["C_CONTIGUOUS"]
+
+    # 다른 프로세스(read_only)는 인덱스에 반영된 레코드까지만 봄
+    reader = SegmentReplayStore(root, STATE_DIM, read_only=True)
+    assert len(reader) == 9
+    store.flush()
+    reader.refresh()
+    assert len(reader) == 10
+    with pytest.raises(RuntimeError):
+        reader.push(np.zeros(STATE_DIM), 0, 0.0, np.zeros(STATE_DIM))
+
+    # 다음 실행은 기존 저장소에 이어서 기록 (segment_rows는 저장된 값 사용)
+    reopened = SegmentReplayStore(root, STATE_DIM, segment_rows=1024)
+    assert (len(reopened), reopened.segment_rows) == (10, 4)
+    _fill(reopened, 10, 1)
+    assert reopened.read([10])["action"].tolist() == [10]
+
+
+def test_segment_store_checks_state_dim(tmp_path):
+    root = str(tmp_path / "store")
+    SegmentReplayStore(root, STATE_DIM)
+    with pytest.raises(ValueError):
+        SegmentReplayStore(root, STATE_DIM + 1)
+    with pytest.raises(FileNotFoundError):
+        SegmentReplayStore(str(tmp_path / "missing"), STATE_DIM, read_only=True)
+
+
+def test_segment_store_restores_sampling_state(tmp_path):
+    store = SegmentReplayStore(str(tmp_path / "store"), STATE_DIM, segment_rows=4, seed=0)
+    _fill(store, 0, 10)
+    meta = store.dump(tmp_path / "checkpoint")
+    expected = store.sample(5)[1]
+
+    store.restore(tmp_path / "checkpoint", meta)
+    np.testing.assert_array_equal(store.sample(5)[1], expected)
@@ -0,0 +1,21 @@
+from interface.snapshot import AMSRecord, AMSSnapshot, decode_completions
+
+
+def test_decode_snapshot():
+    snapshot = AMSSnapshot.decode("125.5#via_12|rack1_3|7;home2||0;|out|2.0;")
+    assert snapshot.sim_time == 125.5
+    assert snapshot.records == (AMSRecord("via_12", "rack1_3", 7), AMSRecord("home2", None, 0),
+                                AMSRecord(None, "out", 2))
+    assert snapshot.idle_mask() == [False, True, False]
+    assert snapshot.has_idle()
+
+
+def test_decode_empty_snapshot():
+    snapshot = AMSSnapshot.decode("0#")
+    assert snapshot.records == ()
+    assert not snapshot.has_idle()
+
+
+def test_decode_completions():
+    assert decode_completions("A1|12.5;B2|3;") == [("A1", 12.5), ("B2", 3.0)]
+    assert decode_completions("") == []
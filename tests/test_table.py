@@ -0,0 +1,91 @@
+"""
+Plant Simulation 테이블 매핑 (plantsim/table.py): 한 번의 SimTalk 호출로 읽은 셀 문자열의 열 타입 변환
+"""
+
+import numpy as np
+import pytest
+
+from plantsim.table import CELL_SEP, ROW_SEP, Table, _native_column, _typed_column
+
+ROWS = [
+    ["", "id", "count", "ratio", "done", "label"],
+    ["1", "007", "3", "0.5", "true", "nan"],
+    ["2", "012", "-4", "2", "false", "1e5"],
+]
+
+
+class FakePlantsim:
+    """Table이 쓰는 run_simtalk / get_value만 제공하는 테스트용 모델"""
+    path_context = ".Models.Model"
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    def run_simtalk(self, source, read_only=False, label=None):
+        self.calls += 1
+        return "".join(CELL_SEP.join(row) + ROW_SEP for row in self.rows)
+
+    def get_value(self, name):
+        self.calls += 1
+        if name.endswith(".YDim"):
+            return len(self.rows) - 1
+        if name.endswith(".XDim"):
+            return len(self.rows[0]) - 1
+        col, row = name[name.index("[") + 1:-1].split(", ")
+        return self.rows[int(row)][int(col)]
+
+
+@pytest.mark.parametrize("values, dtype, expected", [
+    (["1", "-2", "0"], np.int64, [1, -2, 0]),
+    (["1", "2.5", "-0.25"], np.float64, [1.0, 2.5, -0.25]),
+    (["true", "false"], np.bool_, [True, False]),
+    (["007", "12"], object, ["007", "12"]),
+    (["nan", "1"], object, ["nan", "1"]),
+    (["inf", "-inf"], object, ["inf", "-inf"]),
+    (["1e5", "2"], object, ["1e5", "2"]),
+    (["1.", ".5"], object, ["1.", ".5"]),
+    (["99999999999999999999"], object, ["99999999999999999999"]),
+    (["rack1", "3"], object, ["rack1", "3"]),
+])
+def test_typed_column(values, dtype, expected):
+    column = _typed_column(values)
+    assert column.dtype == dtype
+    assert column.tolist() == expected
+
+
+def test_native_column_keeps_mixed_types():
+    assert _native_column([1, 2]).dtype == np.int64
+    assert _native_column([1.5, 2.0]).dtype == np.float64
+    assert _native_column([1, "a"]).tolist() == [1, "a"]
+    assert _native_column([True, 1]).dtype == object
+    assert _native_column(["a", "b"]).dtype == object
+
+
+def test_bulk_table_is_read_in_one_call():
+    plantsim = FakePlantsim(ROWS)
+    table = Table(plantsim, "Orders")
+    assert plantsim.calls == 1
+    assert table.header == ROWS[0]
+    assert table.get_columns_by_header("id") == ["007", "012"]
+    assert table.get_columns_by_header("count") == [3, -4]
+    assert table.get_columns_by_header("ratio") == [0.5, 2.0]
+    assert table.get_columns_by_header(["done", "label"]) == [[True, False], ["nan", "1e5"]]
+    assert table.rows_coldict[0]["id"] == "007"
+    assert table.get_column_array("count").dtype == np.int64
+
+
+def test_cellwise_table_matches_get_value():
+    rows = [["", "a", "b"], [1, 2, "x"], [2, 3.5, 4]]
+    table = Table(FakePlantsim(rows), "T", bulk=False)
+    assert table.rows == rows
+    assert table.columns_body == [[1, 2], [2, 3.5], ["x", 4]]
+
+
+def test_column_views_are_copies():
+    table = Table(FakePlantsim(ROWS), "Orders")
+    table.columns[1].append("changed")
+    table.columns_body[1].clear()
+    table.get_columns_by_idx(1, clip_header=True).append("changed")
+    assert table.columns[1] == ["id", "007", "012"]
+    assert table.columns_body[1] == ["007", "012"]
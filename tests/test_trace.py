@@ -0,0 +1,112 @@
+"""
+시뮬레이터 호출 기록 / 재생 (interface/trace.py)
+DES 백엔드로 기록한 학습을 replay 백엔드로 다시 실행해 같은 결과가 나오는지 확인 (Windows / Plant Simulation 불필요)
+"""
+
+import glob
+import os
+import shutil
+
+import pytest
+
+import train
+from interface.des_interface import DESInterface
+from interface.trace import RecordingInterface, ReplayInterface, TraceMismatchError, read_trace
+
+ORDER_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "order_table.csv")
+
+
+def _run(params, name):
+    """results/<timestamp>에 기록된 실행 결과를 name 폴더로 옮겨 반환 (연속 실행의 폴더 이름 충돌 방지)"""
+    train.run_training(params, csv_path=ORDER_CSV)
+    (save_dir,) = glob.glob(os.path.join("results", "*"))
+    shutil.move(save_dir, name)
+    return name
+
+
+def _log_rows(save_dir):
+    with open(os.path.join(save_dir, "log.txt")) as f:
+        return f.read().splitlines()
+
+
+# ─── ReplayInterface ───
+
+def test_replay_returns_recorded_results_and_errors(tmp_path):
+    path = str(tmp_path / "trace.pkl")
+    recorder = RecordingInterface(DESInterface(), path)
+    recorder.initialize_model()
+    recorder.reset_to_ready(T=50)
+    recorded_dim = recorder.get_action_dimension()
+    recorded_mask = recorder.get_idle_mask()
+    with pytest.raises(Exception):
+        recorder.assign_order(None, 0)
+    recorder.quit()
+
+    assert [record[0] for record in read_trace(path)][-1] == "quit"
+
+    replay = ReplayInterface(path)
+    replay.initialize_model("ignored.spp")
+    replay.reset_to_ready(T=50)
+    assert replay.get_action_dimension() == recorded_dim
+    assert replay.get_idle_mask() == recorded_mask
+    assert replay.get_idle_mask() == recorded_mask  # 기록보다 많이 폴링한 조회는 직전 결과 재사용
+    with pytest.raises(Exception):
+        replay.assign_order(None, 0)
+
+
+def test_replay_detects_out_of_order_calls(tmp_path):
+    path = str(tmp_path / "trace.pkl")
+    recorder = RecordingInterface(DESInterface(), path)
+    recorder.reset_to_ready(T=50)
+    recorder.run_simulation_for_T(T=50)
+    recorder.quit()
+
+    replay = ReplayInterface(path)
+    with pytest.raises(TraceMismatchError):
+        replay.run_simulation_for_T(T=50)
+
+    strict = ReplayInterface(path, strict=True)
+    with pytest.raises(TraceMismatchError):
+        strict.reset_to_ready(T=100)
+
+
+def test_recording_starts_a_fresh_trace(tmp_path):
+    path = str(tmp_path / "trace.pkl")
+    for _ in range(2):
+        recorder = RecordingInterface(DESInterface(), path)
+        recorder.reset_to_ready(T=50)
+        recorder.quit()
+    assert [record[0] for record in read_trace(path)] == ["reset_to_ready", "quit"]
+
+
+# ─── Record → replay ───
+
+def test_record_then_replay_reproduces_training(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    params = {"Episode": 1, "OrderInterval": 200, "Backend": "des", "Seed": 0, "RecordTrace": 1,
+              "CheckpointInterval": 0, "MemoryCapacity": 1000, "BatchSize": 8}
+    recorded = _run(params, "recorded")
+    trace_path = os.path.join(recorded, train.TRACE_FILE)
+    assert os.path.exists(trace_path)
+
+    replayed = _run({**params, "Backend": "replay", "ReplayTrace": trace_path, "RecordTrace": 0}, "replayed")
+
+    rows = _log_rows(recorded)
+    assert len(rows) > 1
+    assert _log_rows(replayed) == rows
+
+
+def test_resumed_recording_uses_its_own_trace(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    params = {"Episode": 1, "OrderInterval": 200, "Backend": "des", "Seed": 0, "RecordTrace": 1,
+              "CheckpointInterval": 1, "MemoryCapacity": 1000, "BatchSize": 8}
+    save_dir = _run(params, "run")
+    first_trace = read_trace(os.path.join(save_dir, train.TRACE_FILE))
+
+    train.run_training({**params, "Episode": 2, "Resume": save_dir}, csv_path=ORDER_CSV)
+
+    # 원래 트레이스는 그대로 두고, 재개한 실행은 별도 파일에 기록하여 각각 재생 가능
+    assert read_trace(os.path.join(save_dir, train.TRACE_FILE)) == first_trace
+    resumed_trace = os.path.join(save_dir, train._trace_file({"episode": 1}))
+    assert [record[0] for record in read_trace(resumed_trace)][-1] == "quit"
+    ReplayInterface(resumed_trace)
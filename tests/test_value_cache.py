@@ -0,0 +1,105 @@
+"""
+읽기 캐시 (Plantsim.get_value): 세대 카운터에 의한 무효화, 고정 값, 적중률
+"""
+
+import pytest
+
+pytest.importorskip("pythoncom")
+pytest.importorskip("win32com.client")
+
+from plantsim.plantsim import Plantsim
+
+
+class FakeRemoteControl:
+    """GetValue 호출 횟수를 세는 테스트용 COM 객체"""
+    def __init__(self, values):
+        self.values = dict(values)
+        self.reads = 0
+
+    def GetValue(self, name):
+        self.reads += 1
+        return self.values[name]
+
+    def SetValue(self, name, value):
+        self.values[name] = value
+
+    def ExecuteSimTalk(self, *args):
+        return None
+
+    def StartSimulation(self, event_controller):
+        pass
+
+    def ResetSimulation(self, event_controller):
+        pass
+
+    def LoadModel(self, filepath):
+        pass
+
+
+@pytest.fixture
+def plantsim():
+    plantsim = Plantsim.__new__(Plantsim)
+    plantsim.plantsim = FakeRemoteControl({"Count": 1, "AGVPool.Amount": 4})
+    plantsim.path_context = ".Models.Model"
+    plantsim.event_controller = ".Models.Model.Eventcontroller"
+    plantsim.events = None
+    plantsim.license_type = "Educational"
+    plantsim.clock_running = False
+    plantsim.cache_hits = 0
+    plantsim.cache_misses = 0
+    plantsim._generation = 0
+    plantsim._value_cache = {}
+    plantsim._static_names = set()
+    plantsim._static_values = {}
+    return plantsim
+
+
+def test_repeated_reads_hit_the_cache(plantsim):
+    assert [plantsim.get_value("Count") for _ in range(3)] == [1, 1, 1]
+    assert plantsim.plantsim.reads == 1
+    assert plantsim.cache_stats() == {"hits": 2, "misses": 1, "hit_rate": 2 / 3}
+
+    assert plantsim.get_value("Count", cached=False) == 1
+    assert plantsim.plantsim.reads == 2
+
+
+@pytest.mark.parametrize("change", [
+    lambda plantsim: plantsim.set_value("Count", 2),
+    lambda plantsim: plantsim.execute_simtalk("Init"),
+    lambda plantsim: plantsim.run_simtalk("->integer\nreturn 1"),
+    lambda plantsim: plantsim.reset_simulation(),
+    lambda plantsim: plantsim.invalidate_cache(),
+])
+def test_changes_advance_the_generation(plantsim, change):
+    plantsim.get_value("Count")
+    change(plantsim)
+    plantsim.get_value("Count")
+    assert plantsim.plantsim.reads == 2
+
+
+def test_read_only_programs_keep_the_cache(plantsim):
+    plantsim.get_value("Count")
+    plantsim.run_simtalk("->integer\nreturn 1", read_only=True)
+    plantsim.get_value("Count")
+    assert plantsim.plantsim.reads == 1
+
+
+def test_nothing_is_cached_while_the_clock_runs(plantsim):
+    plantsim.start_simulation()
+    plantsim.get_value("Count")
+    plantsim.get_value("Count")
+    assert plantsim.plantsim.reads == 2
+    assert plantsim._value_cache == {}
+
+
+def test_static_values_survive_invalidation_until_the_next_model(plantsim):
+    plantsim.pin_static("AGVPool.Amount")
+    plantsim.get_value("AGVPool.Amount")
+    plantsim.start_simulation()
+    plantsim.set_value("Count", 2)
+    assert plantsim.get_value("AGVPool.Amount") == 4
+    assert plantsim.plantsim.reads == 1
+
+    plantsim.load_model("other.spp")
+    plantsim.get_value("AGVPool.Amount")
+    assert plantsim.plantsim.reads == 2
@@ -0,0 +1,28 @@
+"""
+워커 프로세스 기반 벡터화 환경 (env/vec_env.py), DES 백엔드 사용
+"""
+
+import pytest
+
+from env.vec_env import VecSimulationEnvironment
+
+ORDER = {"order_id": "A1", "order_rack": "rack1", "order_pos": 3}
+
+
+@pytest.fixture
+def vec_env():
+    env = VecSimulationEnvironment(2, backend="des")
+    yield env
+    env.close()
+
+
+def test_worker_error_does_not_leave_stale_replies(vec_env):
+    vec_env.reset_all(T=50)
+    # 워커 0은 register_order 없이 get_state(None) → 실패, 워커 1은 정상 응답
+    with pytest.raises(RuntimeError, match="worker 0"):
+        vec_env._call("get_state", [(None,), (ORDER,)])
+
+    # 다음 호출은 이번 호출의 응답만 받아야 함 (이전 get_state 응답이 남아 있으면 상태 벡터가 섞임)
+    assert vec_env.is_terminal().tolist() == [False, False]
+    states = vec_env.get_states([ORDER, ORDER])
+    assert states.shape == (2, vec_env.state_dim)
@@ -0,0 +1,79 @@
+"""
+공용 대기 함수 (utils/wait.py)와 환경의 대기 timeout
+"""
+
+import pytest
+
+from env.simulation_env import SimulationEnvironment
+from interface.des_interface import DESInterface
+from utils import wait
+from utils.wait import DEFAULT_WAIT_TIMEOUT, get_wait_stats, reset_wait_stats, wait_until
+
+
+class FakeClock:
+    """perf_counter / sleep 대체: sleep한 만큼만 시간이 흐름"""
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(wait, "time", fake)
+    reset_wait_stats()
+    yield fake
+    reset_wait_stats()
+
+
+def _true_after(calls):
+    state = {"calls": 0}
+
+    def predicate():
+        state["calls"] += 1
+        return state["calls"] > calls
+    return predicate
+
+
+def test_satisfied_predicate_returns_without_sleeping(clock):
+    assert wait_until(lambda: True, timeout=1.0, name="ready")
+    assert clock.sleeps == []
+    assert get_wait_stats()["ready"]["count"] == 1
+
+
+def test_backoff_doubles_up_to_max_interval(clock):
+    assert wait_until(_true_after(6), initial_interval=0.001, max_interval=0.01, backoff=2.0, name="poll")
+    assert clock.sleeps == pytest.approx([0.001, 0.002, 0.004, 0.008, 0.01, 0.01])
+    assert get_wait_stats()["poll"]["timeouts"] == 0
+
+
+def test_timeout_stops_at_deadline(clock):
+    assert not wait_until(lambda: False, timeout=0.1, initial_interval=0.03, backoff=2.0, name="stuck")
+    # 마지막 sleep은 남은 시간만큼으로 줄어 deadline을 넘지 않음
+    assert clock.sleeps == pytest.approx([0.03, 0.06, 0.01])
+    assert clock.now == pytest.approx(0.1)
+    stats = get_wait_stats()["stuck"]
+    assert (stats["count"], stats["timeouts"]) == (1, 1)
+
+
+def test_pump_runs_before_every_check(clock):
+    events = []
+    predicate = _true_after(2)
+    assert wait_until(lambda: events.append("check") or predicate(), pump=lambda: events.append("pump"))
+    assert events == ["pump", "check"] * 3
+
+
+def test_environment_waits_have_a_deadline(clock):
+    env = SimulationEnvironment(DESInterface())
+    assert env.wait_timeout == DEFAULT_WAIT_TIMEOUT
+    env.wait_timeout = 0.5
+    with pytest.raises(TimeoutError):
+        env._wait(lambda: False, "idle_ams")
+    assert clock.now == pytest.approx(0.5)
@@ -2,110 +2,476 @@
 
 import os
 import time
-import pythoncom
+import random
+import argparse
+import warnings
+from contextlib import contextmanager, nullcontext
+
+import numpy as np
+import torch
 
 from agent.dqn_agent import DQNAgent
+from agent.async_learner import AsyncLearner
 from env.simulation_env import SimulationEnvironment
+from env.vec_env import VecSimulationEnvironment
 from buffer.pending_buffer import PendingBuffer
-from utils.order_generator import OrderGenerator
-from interface.plantsim_interface import PlantsimInterface
+from utils.order_generator import OrderGenerator, ARRIVAL_PROCESSES
+from interface.backend import BACKENDS, create_interface
+from interface.trace import RecordingInterface
 from utils.logger import Logger
+from utils.checkpoint import load_checkpoint, restore_checkpoint, resume_params, save_checkpoint
+from utils.wait import reset_wait_stats, format_wait_stats
+from utils import profiler
 from config import DEFAULT_HYPERPARAMS, DEFAULT_SIM_PARAMS
 
 
-def run_training(params, log_callback=None, csv_path=None):
+TRACE_FILE = "sim_trace.pkl"
+
+
+def _build_agent(full_params, state_dim, action_dim):
+    """DQN 에이전트 초기화"""
+    return DQNAgent(
+        state_dim=state_dim,
+        action_dim=action_dim,
+        gamma=full_params["Gamma"],
+        epsilon=full_params["Epsilon"],
+        lr=full_params["LearningRate"],
+        memory_capacity=full_params["MemoryCapacity"],
+        batch_size=full_params["BatchSize"],
+        prioritized=bool(full_params["PrioritizedReplay"]),
+        seed=full_params["Seed"],
+        replay_store=full_params["ReplayStore"]
+    )
+
+
+def _build_trainer(full_params, agent):
+    """
+    학습 주체 선택: AsyncLearner 사용 시 백그라운드 학습 스레드, 아니면 에이전트 자체
+    (둘 다 remember / update / update_target 제공)
+    """
+    if full_params["AsyncLearner"]:
+        return AsyncLearner(agent, update_to_data_ratio=full_params["UpdateToDataRatio"])
+    return agent
+
+
+def _build_order_generator(full_params, csv_path, index=0):
+    """
+    오더 생성기 초기화
+    - ArrivalProcess가 지정되면 오더마다 도착 시각 부여 (CSV가 없으면 합성 오더북 사용)
+    - Seed가 지정되면 워커 index별로 다른 고정 시드 사용
+    """
+    arrival = full_params["ArrivalProcess"]
+    seed = None if full_params["Seed"] is None else full_params["Seed"] + index
+    if csv_path:
+        return OrderGenerator(csv_path=csv_path, seed=seed, arrival_process=arrival,
+                              mean_interval=full_params["OrderInterval"])
+    if arrival:
+        return OrderGenerator(csv_path=None, seed=seed, arrival_process=arrival,
+                              mean_interval=full_params["OrderInterval"])
+    return OrderGenerator(seed=seed)
+
+
+def _seed_everything(seed):
+    """탐험 행동 / 네트워크 초기화 난수 고정 (트레이스 재생 등 재현 실행용)"""
+    random.seed(seed)
+    np.random.seed(seed)
+    torch.manual_seed(seed)
+
+
+def _order_interval(current_order, next_order, T):
+    """도착 시각이 있으면 다음 오더까지의 간격, 없으면 고정 주기 T"""
+    if "arrival_time" in current_order and "arrival_time" in next_order:
+        return max(next_order["arrival_time"] - current_order["arrival_time"], 0.0)
+    return T
+
+
+def _connect_interface(full_params):
+    """
+    시뮬레이터 인터페이스 준비
+    - SimServer가 지정되면 상주 시뮬레이터 서버에 접속 (모델 로드 / 기동 비용 없음)
+    - 아니면 이 프로세스에서 백엔드를 직접 생성
+    """
+    if full_params["SimServer"]:
+        from interface.sim_server import RemoteInterface
+        return RemoteInterface(full_params["SimServer"])
+
+    backend = full_params["Backend"]
+    if backend == "plantsim":
+        import pythoncom
+        pythoncom.CoInitialize()  # COM 객체 초기화 (GUI 쓰레드에서 필수)
+    return create_interface(backend, **_interface_kwargs(full_params))
+
+
+def _interface_kwargs(full_params):
+    """백엔드별 인터페이스 생성 인자"""
+    if full_params["Backend"] == "plantsim":
+        return {"warm_start": bool(full_params["WarmStart"]), "headless": bool(full_params["Headless"]),
+                "realtime_scale": full_params["RealtimeScale"]}
+    if full_params["Backend"] == "replay":
+        return {"trace_path": full_params["ReplayTrace"]}
+    return {}
+
+
+def _trace_file(resume_state):
+    """
+    트레이스 파일 이름: 재개한 실행은 재개 지점 이름의 새 파일에 기록
+    (원래 실행의 sim_trace.pkl에 이어 쓰면 두 실행이 섞여 재생할 수 없음)
+    """
+    if resume_state is None:
+        return TRACE_FILE
+    stem, ext = os.path.splitext(TRACE_FILE)
+    return f"{stem}-resume{resume_state['episode']}{ext}"
+
+
+def _log_reset(logger, resets):
+    """에피소드 초기화 시간 보고 (warm-start 효과 확인용)"""
+    times = [elapsed for elapsed, _ in resets]
+    warm = sum(mode == "warm" for _, mode in resets)
+    logger.log_text(f"  reset: {max(times) * 1000:.1f} ms ({warm}/{len(resets)} warm)")
+
+
+def _report_episode(logger, metric_callback, episode, elapsed):
+    """에피소드 종료 로그와 (GUI용) 지표 전달"""
+    logger.log_text(f"  Episode {episode} completed ({logger.episode_summary(episode)})\n")
+    if metric_callback is None:
+        return
+    metric_callback("episode", episode)
+    stats = logger.episode_stats.get(episode)
+    if stats is not None:
+        metric_callback("mean_reward", stats.mean)
+        metric_callback("orders/s", stats.count / elapsed if elapsed > 0 else 0.0)
+
+
+def _restore(resume_state, logger, agent, order_gens):
+    """체크포인트 상태 복원 후 이어서 시작할 에피소드 인덱스 반환"""
+    restore_checkpoint(resume_state, logger.get_save_dir(), agent, order_gens, logger)
+    episode = resume_state["episode"]
+    logger.log_text(f"↻ 체크포인트에서 재개: episode {episode + 1}부터 (replay memory {len(agent.memory)}개)")
+    return episode
+
+
+def _checkpoint(full_params, logger, agent, trainer, episode, order_gens):
+    """CheckpointInterval 에피소드마다 (그리고 마지막 에피소드에서) 전체 학습 상태 저장"""
+    interval = full_params["CheckpointInterval"]
+    if not interval or (episode % interval and episode != full_params["Episode"]):
+        return
+    start = time.perf_counter()
+    # AsyncLearner는 학습 스레드를 멈춘 상태에서 저장
+    with trainer.paused() if trainer is not agent else nullcontext():
+        save_checkpoint(logger.get_save_dir(), agent, episode, full_params, order_gens, logger)
+    logger.log_text(f"  💾 checkpoint: episode {episode}, replay memory {len(agent.memory)} "
+                    f"({time.perf_counter() - start:.2f}s)")
+
+
+@contextmanager
+def _warnings_to_log(logger):
+    """학습 중 발생한 경고(warm-start / headless 설정 실패 등)를 로그(GUI 포함)로 전달"""
+    with warnings.catch_warnings():
+        warnings.showwarning = lambda message, category, *args, **kwargs: \
+            logger.log_text(f"⚠ {category.__name__}: {message}")
+        yield
+
+
+def _save_results(agent, logger):
+    """모델, 보상 그래프, 대기 시간 통계, (계측 시) 프로파일 저장"""
+    model_path = os.path.join(logger.get_save_dir(), "model.pth")
+    agent.close()
+    agent.save_model(model_path)
+    logger.save_graph()
+    logger.log_text(f"📁 결과 저장 완료 → {logger.get_save_dir()}")
+    wait_summary = format_wait_stats()
+    if wait_summary:
+        logger.log_text(f"⏱ 대기 시간 통계\n{wait_summary}")
+    profile_summary = profiler.export(logger.get_save_dir())
+    if profile_summary:
+        logger.log_text(f"🔍 hot spot (profile.json 참고)\n{profile_summary}")
+
+
+def run_training(params, log_callback=None, csv_path=None, reward_curve=None, progress_callback=None,
+                 metric_callback=None):
     """
     학습 실행 함수
     :param params: dict 형태의 하이퍼파라미터 설정
     :param log_callback: 로그 출력 함수 (GUI용)
+    :param reward_curve: (선택적) 보상을 누적할 RewardCurve (GUI 실시간 그래프용)
+    :param progress_callback: (선택적) 전체 진행률(0.0 ~ 1.0)을 받는 함수
+    :param metric_callback: (선택적) (지표 이름, 값)을 받는 함수. 에피소드마다 호출
     """
-    pythoncom.CoInitialize()  # COM 객체 초기화 (GUI 쓰레드에서 필수)
-    
     # 기본값 초기화
     full_params = {**DEFAULT_HYPERPARAMS, **DEFAULT_SIM_PARAMS}
     if params:
         full_params.update(params)
 
-    logger = Logger(gui_callback=log_callback)
+    # 재개 시 체크포인트의 파라미터를 사용하고 같은 결과 폴더에 이어서 기록
+    resume_state = None
+    if full_params["Resume"]:
+        resume_state = load_checkpoint(full_params["Resume"])
+        full_params = resume_params(resume_state, full_params)
 
-    # 인터페이스 및 환경 초기화
-    plsim = PlantsimInterface()
+    logger = Logger(gui_callback=log_callback, reward_curve=reward_curve, save_dir=full_params["Resume"])
+    reset_wait_stats()
+    profiler.reset()
+    profiler.enable(bool(full_params["Profile"]))
+    if full_params["Seed"] is not None:
+        _seed_everything(full_params["Seed"])
+
+    with _warnings_to_log(logger):
+        _train(full_params, logger, csv_path, progress_callback, metric_callback, resume_state)
+
+
+def _train(full_params, logger, csv_path, progress_callback, metric_callback, resume_state):
+    """run_training 본체: 직렬 학습 루프 (NumEnvs > 1이면 _run_vec_training)"""
     model_file = "tp_v11.spp"
     model_path = os.path.abspath(model_file)
-    plsim.initialize_model(model_path)
 
-    env = SimulationEnvironment(plsim)
+    if full_params["NumEnvs"] > 1:
+        if full_params["SimServer"]:
+            raise ValueError("SimServer serves a single client; use NumEnvs=1 when attaching to a server.")
+        if full_params["RecordTrace"] or full_params["Backend"] == "replay":
+            raise ValueError("Trace recording / replay covers a single simulator; use NumEnvs=1.")
+        # 여러 시뮬레이터를 별도 프로세스에서 병렬 실행
+        agent = _run_vec_training(full_params, logger, model_path, csv_path, progress_callback, metric_callback,
+                                  resume_state)
+        _save_results(agent, logger)
+        return
+
+    # 인터페이스 및 환경 초기화
+    plsim = _connect_interface(full_params)
+    if full_params["RecordTrace"]:
+        # 모든 시뮬레이터 호출과 결과를 결과 폴더에 기록 (Backend "replay"로 재생)
+        plsim = RecordingInterface(plsim, os.path.join(logger.get_save_dir(), _trace_file(resume_state)))
+    plsim.initialize_model(model_path)  # 서버에 같은 모델이 이미 로드되어 있으면 생략됨
+
+    env = SimulationEnvironment(plsim, distance_features=bool(full_params["DistanceFeatures"]))
     state_dim = env.get_state_dim()
     action_dim = env.get_action_dim()
 
     # DQN 에이전트 초기화
-    agent = DQNAgent(
-        state_dim=state_dim,
-        action_dim=action_dim,
-        gamma=full_params["Gamma"],
-        epsilon=full_params["Epsilon"],
-        lr=full_params["LearningRate"],
-        batch_size=full_params["BatchSize"]
-    )
+    agent = _build_agent(full_params, state_dim, action_dim)
 
-    order_gen = OrderGenerator(csv_path=csv_path) if csv_path else OrderGenerator()
+    order_gen = _build_order_generator(full_params, csv_path)
     buffer = PendingBuffer()
 
     num_episodes = full_params["Episode"]
     T = full_params["OrderInterval"]
 
-    current_order = order_gen.generate_order()
-    next_order = order_gen.generate_order()
+    start_episode = 0
+    if resume_state:
+        start_episode = _restore(resume_state, logger, agent, [order_gen])
+    # 복원으로 합성 오더북이 바뀔 수 있으므로 복원 후에 인코딩
+    env.preencode_orders(*order_gen.pickup_columns())
+    trainer = _build_trainer(full_params, agent)
 
-    for episode in range(num_episodes):
-        logger.log_text(f"[Episode {episode + 1}]")
+    try:
+        for episode in range(start_episode, num_episodes):
+            logger.log_text(f"[Episode {episode + 1}]")
+            episode_start = time.perf_counter()
 
-        env.reset_and_initialize(T)
-        buffer.clear()
-        order_gen.reset()
+            _log_reset(logger, [env.reset_and_initialize(T)])
+            buffer.clear()
+            order_gen.reset()
+            # 첫 두 오더는 reset 이후에 뽑아 새 순서 / 도착 시각과 일치시킴
+            current_order = order_gen.generate_order()
+            next_order = order_gen.generate_order()
 
-        while not env.is_terminal() and order_gen.has_next():
-            env.register_order(current_order)
+            while not env.is_terminal() and order_gen.has_next():
+                env.register_order(current_order)
 
-            if not env.has_idle_ams():
-                env.start_simulation()
-                while not env.has_idle_ams() and not env.is_terminal():
-                    time.sleep(1)
-                env.stop_simulation()
+                if not env.has_idle_ams():
+                    env.wait_for_idle_ams()
 
-            if env.has_idle_ams():
-                state = env.get_state(current_order)
-                next_state = env.get_state(next_order)
+                if env.has_idle_ams():
+                    state, next_state = env.get_states([current_order, next_order])
 
-                action = agent.select_action(state)
-                ams_index = action + 1
-                env.assign_order(ams_index)
+                    action = agent.select_action(state)
+                    ams_index = action + 1
+                    env.assign_order(ams_index)
 
-                buffer.add(current_order["order_id"], state, action, next_state)
+                    buffer.add(current_order["order_id"], state, action, next_state)
 
-            env.run_simulation_for_T(T)
+                env.run_simulation_for_T(_order_interval(current_order, next_order, T))
 
-            for order_id, reward in env.get_completed_rewards(buffer.keys()):
-                item = buffer.pop(order_id)
-                if item:
-                    agent.remember(item["state"], item["action"], reward, item["next_state"])
-                    agent.update()
-                    logger.log(episode + 1, order_id, reward)
+                completed = env.get_completed_rewards(buffer.keys())
+                sim_time = env.get_sim_time() if completed else float("nan")
+                for order_id, reward in completed:
+                    item = buffer.pop(order_id)
+                    if item:
+                        trainer.remember(item["state"], item["action"], reward, item["next_state"])
+                        trainer.update()
+                        # 보상 = -leadtime
+                        logger.log(episode + 1, order_id, reward, action=item["action"], leadtime=-reward,
+                                   sim_time=sim_time)
 
-            current_order = next_order
-            if order_gen.has_next():
-                next_order = order_gen.generate_order()
-            else:
-                break  # 다음 오더가 없으면 루프 종료
+                if progress_callback:
+                    progress_callback((episode + order_gen.progress()) / num_episodes)
 
-        agent.update_target()
-        logger.log_text(f"  Episode {episode + 1} completed\n")
+                current_order = next_order
+                if order_gen.has_next():
+                    next_order = order_gen.generate_order()
+                else:
+                    break  # 다음 오더가 없으면 루프 종료
 
-    # 결과 저장
-    model_path = os.path.join(logger.get_save_dir(), "model.pth")
-    agent.save_model(model_path)
-    logger.save_graph()
-    logger.log_text(f"📁 결과 저장 완료 → {logger.get_save_dir()}")
+            trainer.update_target()
+            _report_episode(logger, metric_callback, episode + 1, time.perf_counter() - episode_start)
+            _checkpoint(full_params, logger, agent, trainer, episode + 1, [order_gen])
+            if progress_callback:
+                progress_callback((episode + 1) / num_episodes)
+    finally:
+        if trainer is not agent:
+            trainer.stop()
+    _save_results(agent, logger)
 
-    # 시뮬레이터 종료
+    cache_stats = plsim.get_cache_stats()
+    if cache_stats:
+        logger.log_text(f"🗂 COM 값 캐시: hits={cache_stats['hits']}, misses={cache_stats['misses']}, "
+                        f"hit_rate={cache_stats['hit_rate']:.1%}")
+
+    # 시뮬레이터 종료 (서버 접속이면 연결만 해제)
     plsim.quit()
+
+
+def _run_vec_training(full_params, logger, model_path, csv_path, progress_callback=None, metric_callback=None,
+                      resume_state=None):
+    """
+    VecSimulationEnvironment 기반 병렬 학습 루프
+    - 워커마다 독립된 OrderGenerator / PendingBuffer 사용
+    - 결정이 필요한 워커들의 상태를 모아 한 번의 forward pass로 행동 선택
+    :param resume_state: (선택적) 이어서 학습할 체크포인트 상태
+    :return: 학습된 에이전트
+    """
+    num_envs = full_params["NumEnvs"]
+    T = full_params["OrderInterval"]
+
+    vec_env = VecSimulationEnvironment(num_envs, backend=full_params["Backend"], model_path=model_path,
+                                       interface_kwargs=_interface_kwargs(full_params), profile=profiler.enabled,
+                                       distance_features=bool(full_params["DistanceFeatures"]))
+    agent = _build_agent(full_params, vec_env.state_dim, vec_env.action_dim)
+    order_gens = [_build_order_generator(full_params, csv_path, i) for i in range(num_envs)]
+    buffers = [PendingBuffer() for _ in range(num_envs)]
+    start_episode = _restore(resume_state, logger, agent, order_gens) if resume_state else 0
+    vec_env.preencode_orders([order_gen.pickup_columns() for order_gen in order_gens])
+    trainer = _build_trainer(full_params, agent)
+
+    try:
+        num_episodes = full_params["Episode"]
+        for episode in range(start_episode, num_episodes):
+            logger.log_text(f"[Episode {episode + 1}] ({num_envs} envs)")
+            episode_start = time.perf_counter()
+
+            _log_reset(logger, vec_env.reset_all(T))
+            for buffer, order_gen in zip(buffers, order_gens):
+                buffer.clear()
+                order_gen.reset()
+            current_orders = [order_gen.generate_order() for order_gen in order_gens]
+            next_orders = [order_gen.generate_order() for order_gen in order_gens]
+
+            active = np.ones(num_envs, dtype=bool)
+            while active.any():
+                vec_env.register_orders(current_orders, active)
+
+                busy = active & ~vec_env.has_idle_ams(active)
+                if busy.any():
+                    vec_env.wait_for_idle_ams(busy)
+
+                ready = active & vec_env.has_idle_ams(active)
+                if ready.any():
+                    states, next_states = vec_env.get_state_pairs(current_orders, next_orders, ready)
+
+                    actions = np.zeros(num_envs, dtype=np.int64)
+                    actions[ready] = agent.select_action(states[ready])
+                    vec_env.assign_orders(actions, ready)
+
+                    for i in np.flatnonzero(ready):
+                        buffers[i].add(current_orders[i]["order_id"], states[i].tolist(), int(actions[i]),
+                                       next_states[i].tolist())
+
+                intervals = [_order_interval(current, following, T)
+                             for current, following in zip(current_orders, next_orders)]
+                vec_env.run_simulation_for_T(intervals, active)
+
+                completed = vec_env.get_completed_rewards([buffer.keys() for buffer in buffers], active)
+                for buffer, rewards in zip(buffers, completed):
+                    for order_id, reward in rewards:
+                        item = buffer.pop(order_id)
+                        if item:
+                            trainer.remember(item["state"], item["action"], reward, item["next_state"])
+                            trainer.update()
+                            logger.log(episode + 1, order_id, reward, action=item["action"], leadtime=-reward)
+
+                terminal = vec_env.is_terminal(active)
+                for i in np.flatnonzero(active):
+                    current_orders[i] = next_orders[i]
+                    if terminal[i] or not order_gens[i].has_next():
+                        active[i] = False  # 다음 오더가 없거나 종료된 워커는 이번 에피소드에서 제외
+                    else:
+                        next_orders[i] = order_gens[i].generate_order()
+
+                if progress_callback:
+                    progress_callback((episode + min(gen.progress() for gen in order_gens)) / num_episodes)
+
+            trainer.update_target()
+            _report_episode(logger, metric_callback, episode + 1, time.perf_counter() - episode_start)
+            _checkpoint(full_params, logger, agent, trainer, episode + 1, order_gens)
+            if progress_callback:
+                progress_callback((episode + 1) / num_episodes)
+
+        if profiler.enabled:
+            for stats in vec_env.collect_profiles():
+                profiler.merge(stats)
+    finally:
+        if trainer is not agent:
+            trainer.stop()
+        vec_env.close()
+
+    return agent
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DQN 학습 실행")
+    parser.add_argument("--episodes", type=int, default=DEFAULT_HYPERPARAMS["Episode"])
+    parser.add_argument("--interval", type=int, default=DEFAULT_SIM_PARAMS["OrderInterval"])
+    parser.add_argument("--backend", choices=BACKENDS, default=DEFAULT_SIM_PARAMS["Backend"])
+    parser.add_argument("--num-envs", type=int, default=DEFAULT_SIM_PARAMS["NumEnvs"],
+                        help="병렬로 실행할 시뮬레이터 개수")
+    parser.add_argument("--distance-features", action="store_true", default=bool(DEFAULT_SIM_PARAMS["DistanceFeatures"]),
+                        help="AMS별 픽업 / out까지의 ETA를 상태에 추가")
+    parser.add_argument("--arrival", choices=ARRIVAL_PROCESSES, default=DEFAULT_SIM_PARAMS["ArrivalProcess"],
+                        help="오더 도착 과정 (지정하지 않으면 고정 주기 OrderInterval)")
+    parser.add_argument("--prioritized", action="store_true", default=bool(DEFAULT_HYPERPARAMS["PrioritizedReplay"]),
+                        help="우선순위 경험 재생(PER) 사용")
+    parser.add_argument("--async-learner", action="store_true", default=bool(DEFAULT_HYPERPARAMS["AsyncLearner"]),
+                        help="백그라운드 학습 스레드 사용")
+    parser.add_argument("--server", default=DEFAULT_SIM_PARAMS["SimServer"], metavar="HOST:PORT",
+                        help="상주 시뮬레이터 서버에 접속 (python -m interface.sim_server)")
+    parser.add_argument("--no-warm-start", dest="warm_start", action="store_false",
+                        default=bool(DEFAULT_SIM_PARAMS["WarmStart"]),
+                        help="에피소드 시작 상태 스냅샷을 사용하지 않음 (plantsim)")
+    parser.add_argument("--headless", action="store_true", default=bool(DEFAULT_SIM_PARAMS["Headless"]),
+                        help="창 / 애니메이션 / 실시간 연동 없이 최대 속도로 실행 (plantsim)")
+    parser.add_argument("--profile", action="store_true", default=bool(DEFAULT_SIM_PARAMS["Profile"]),
+                        help="COM 호출 / 단계별 지연 시간을 계측하여 결과 폴더에 저장")
+    parser.add_argument("--record", action="store_true", default=bool(DEFAULT_SIM_PARAMS["RecordTrace"]),
+                        help=f"시뮬레이터 호출 / 결과를 결과 폴더의 {TRACE_FILE}에 기록")
+    parser.add_argument("--trace", default=DEFAULT_SIM_PARAMS["ReplayTrace"],
+                        help="--backend replay로 재생할 트레이스 파일")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SIM_PARAMS["Seed"], help="난수 시드 (재현 실행용)")
+    parser.add_argument("--checkpoint-interval", type=int, default=DEFAULT_SIM_PARAMS["CheckpointInterval"],
+                        help="N 에피소드마다 전체 학습 상태 저장 (0이면 저장 안 함)")
+    parser.add_argument("--resume", default=DEFAULT_SIM_PARAMS["Resume"], metavar="RESULTS_DIR",
+                        help="결과 폴더의 체크포인트에서 이어서 학습 (--episodes는 전체 목표 에피소드 수)")
+    parser.add_argument("--replay-store", default=DEFAULT_SIM_PARAMS["ReplayStore"], metavar="DIR",
+                        help="모든 transition을 디스크 저장소에 누적하여 실행 간 공유 (MemoryCapacity 무시)")
+    parser.add_argument("--csv", default=None, help="오더 테이블 CSV 경로")
+    args = parser.parse_args()
+
+    run_training(
+        {"Episode": args.episodes, "OrderInterval": args.interval, "Backend": args.backend,
+         "NumEnvs": args.num_envs, "DistanceFeatures": int(args.distance_features),
+         "ArrivalProcess": args.arrival, "PrioritizedReplay": int(args.prioritized),
+         "AsyncLearner": int(args.async_learner), "SimServer": args.server,
+         "WarmStart": int(args.warm_start), "Headless": int(args.headless),
+         "Profile": int(args.profile), "RecordTrace": int(args.record), "ReplayTrace": args.trace,
+         "Seed": args.seed, "CheckpointInterval": args.checkpoint_interval, "Resume": args.resume,
+         "ReplayStore": args.replay_store},
+        csv_path=args.csv
+    )
@@ -0,0 +1,101 @@
+"""
+학습 체크포인트 저장 / 재개
+결과 폴더의 checkpoint/ 아래에 저장
+- state.pt: 네트워크 / 옵티마이저 / 학습 카운터 / epsilon, 오더 생성기 위치와 난수 상태, 전역 난수 상태,
+  보상 곡선, 로그 기록 위치, 실행 파라미터
+- memory-0/, memory-1/: replay memory 배열 (ReplayBuffer.dump)
+  두 폴더를 번갈아 사용: 현재 state.pt가 가리키지 않는 폴더에만 쓰고 (그 폴더의 직전 dump 이후 바뀐 행만 덮어씀),
+  다 쓴 뒤 state.pt를 임시 파일 → os.replace로 교체하여 전환
+  → 저장 도중 중단되어도 이전 state.pt와 그 memory 폴더는 손대지 않은 상태로 남음
+"""
+
+import os
+import random
+
+import numpy as np
+import torch
+
+CHECKPOINT_DIR = "checkpoint"
+STATE_FILE = "state.pt"
+MEMORY_DIRS = ("memory-0", "memory-1")
+
+# 재개 시 체크포인트에 저장된 값 대신 새로 전달한 값을 쓰는 파라미터 (목표 에피소드 수와 실행 환경)
+RESUME_OVERRIDES = ("Episode", "SimServer", "WarmStart", "Headless", "RealtimeScale", "Profile", "CheckpointInterval",
+                    "RecordTrace")
+
+
+def checkpoint_dir(save_dir):
+    return os.path.join(save_dir, CHECKPOINT_DIR)
+
+
+def _next_memory_dir(directory, memory):
+    """현재 체크포인트가 쓰는 memory 폴더가 아닌 쪽"""
+    active = os.path.join(directory, MEMORY_DIRS[0])
+    if memory.last_dump_dir == os.path.abspath(active):
+        return MEMORY_DIRS[1]
+    if memory.last_dump_dir is None and os.path.exists(active):
+        return MEMORY_DIRS[1]  # 이 실행에서 처음 저장할 때 기존 체크포인트의 memory-0을 보존
+    return MEMORY_DIRS[0]
+
+
+def save_checkpoint(save_dir, agent, episode, params, order_gens, logger):
+    """
+    :param save_dir: 결과 폴더
+    :param agent: DQNAgent (AsyncLearner 사용 시 paused() 구간 안에서 호출)
+    :param episode: 완료한 에피소드 수 (재개하면 다음 에피소드부터 시작)
+    :param params: 실행 파라미터 (재개 시 그대로 사용)
+    :param order_gens: 워커별 OrderGenerator 리스트
+    :param logger: Logger (기록을 파일에 맞춘 위치와 보상 곡선 저장)
+    """
+    directory = checkpoint_dir(save_dir)
+    os.makedirs(directory, exist_ok=True)
+    memory_dir = _next_memory_dir(directory, agent.memory)
+    memory = agent.memory.dump(os.path.join(directory, memory_dir))
+    state = {
+        "episode": episode,
+        "params": {**params, "Resume": None},
+        "agent": agent.state_dict(),
+        "memory": memory,
+        "memory_dir": memory_dir,
+        "order_gens": [order_gen.get_state() for order_gen in order_gens],
+        "reward_curve": logger.reward_curve.get_state(),
+        "log_position": logger.sync(),
+        "rng": {"random": random.getstate(), "numpy": np.random.get_state(), "torch": torch.get_rng_state()},
+    }
+    path = os.path.join(directory, STATE_FILE)
+    torch.save(state, path + ".tmp")
+    os.replace(path + ".tmp", path)
+
+
+def load_checkpoint(save_dir):
+    """결과 폴더의 마지막 체크포인트 상태 dict 반환"""
+    path = os.path.join(checkpoint_dir(save_dir), STATE_FILE)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No checkpoint in '{save_dir}' ({path} is missing).")
+    return torch.load(path, weights_only=False)
+
+
+def resume_params(state, params):
+    """
+    체크포인트의 실행 파라미터에 RESUME_OVERRIDES 항목만 새 값으로 덮어씀
+    (체크포인트 이후에 추가된 파라미터는 전달한 값 사용)
+    """
+    return {**params, **state["params"], **{key: params[key] for key in RESUME_OVERRIDES}, "Resume": params["Resume"]}
+
+
+def restore_checkpoint(state, save_dir, agent, order_gens, logger):
+    """
+    load_checkpoint로 읽은 상태를 에이전트 / replay memory / 오더 생성기 / 로거 / 전역 난수에 복원
+    (AsyncLearner는 가중치를 복사해 두므로 이 함수 호출 뒤에 생성)
+    """
+    if len(order_gens) != len(state["order_gens"]):
+        raise ValueError(f"Checkpoint has {len(state['order_gens'])} order generators; got {len(order_gens)}.")
+    agent.load_state_dict(state["agent"])
+    agent.memory.restore(os.path.join(checkpoint_dir(save_dir), state["memory_dir"]), state["memory"])
+    for order_gen, order_state in zip(order_gens, state["order_gens"]):
+        order_gen.set_state(order_state)
+    logger.reward_curve.set_state(state["reward_curve"])
+    logger.rewind(state["log_position"])
+    random.setstate(state["rng"]["random"])
+    np.random.set_state(state["rng"]["numpy"])
+    torch.set_rng_state(state["rng"]["torch"])
@@ -1,26 +1,217 @@
 import os
+import glob
+import queue
+import threading
+import time
 from datetime import datetime
-import matplotlib.pyplot as plt
+
+import numpy as np
+
+from utils.reward_curve import RewardCurve
+
+# 완료 오더 기록 열 (이름, dtype)
+LOG_COLUMNS = (
+    ("episode", np.int32),
+    ("order_id", object),
+    ("action", np.int16),
+    ("reward", np.float64),
+    ("leadtime", np.float64),
+    ("wall_time", np.float64),   # 학습 시작 후 경과 시간 (초)
+    ("sim_time", np.float64),    # 시뮬레이션 시각 (모르면 nan)
+)
+
+_STOP = object()
+
+
+class RunningStats:
+    """개수 / 합 / 최소 / 최대만 유지하는 누적 통계"""
+    __slots__ = ("count", "total", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def update(self, value):
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else float("nan")
+
 
 class Logger:
-    def __init__(self, gui_callback=None):
-        self.rewards = []
-        self.logs = []
+    """
+    학습 로거
+    - 완료 오더 기록은 미리 할당한 열 버퍼에 쌓고, flush_rows개가 차거나 flush_interval초가 지나면
+      백그라운드 스레드가 log_columns/part-*.npz (열 단위)와 log.txt (CSV)에 한 번에 기록
+    - 보상은 전체 목록 대신 누적 통계(전체 / 에피소드별)와 다중 해상도 곡선(RewardCurve)으로 유지
+    """
+    def __init__(self, gui_callback=None, flush_rows=4096, flush_interval=5.0, reward_curve=None, save_dir=None):
+        """
+        :param gui_callback: 텍스트 로그를 전달할 함수 (GUI용)
+        :param reward_curve: (선택적) 보상을 누적할 RewardCurve (GUI가 실시간 그래프용으로 전달)
+        :param flush_rows: 버퍼 행 수 (가득 차면 기록)
+        :param flush_interval: 버퍼가 덜 찼어도 기록하는 최대 간격 (초)
+        :param save_dir: (선택적) 기존 결과 폴더. 지정하면 그 폴더의 기록 뒤에 이어서 씀 (체크포인트 재개용)
+        """
         self.gui_callback = gui_callback
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.stats = RunningStats()
+        self.episode_stats = {}
+        self.reward_curve = reward_curve if reward_curve is not None else RewardCurve()
 
-        now = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.save_dir = os.path.join("results", now)
-        os.makedirs(self.save_dir, exist_ok=True)
+        if save_dir is None:
+            now = datetime.now().strftime("%Y%m%d_%H%M%S")
+            save_dir = os.path.join("results", now)
+        self.save_dir = save_dir
+        self.columns_dir = os.path.join(self.save_dir, "log_columns")
+        os.makedirs(self.columns_dir, exist_ok=True)
 
         self.log_path = os.path.join(self.save_dir, "log.txt")
-        with open(self.log_path, "w") as f:
-            f.write("Episode,OrderID,Reward\n")
+        if not os.path.exists(self.log_path):
+            with open(self.log_path, "w") as f:
+                f.write("Episode,OrderID,Reward\n")
+
+        self._start_time = time.perf_counter()
+        self._lock = threading.Lock()
+        self._buffer = self._new_buffer()
+        self._size = 0
+        self._chunk_index = len(glob.glob(os.path.join(self.columns_dir, "part-*.npz")))
+        self._error = None      # 백그라운드 기록 중 처음 발생한 오류 (sync / close에서 다시 발생시킴)
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._flush_loop, name="logger-flush", daemon=True)
+        self._thread.start()
+
+    # ─── Records ───
+
+    def _new_buffer(self):
+        return {name: np.empty(self.flush_rows, dtype=dtype) for name, dtype in LOG_COLUMNS}
 
-    def log(self, episode, order_id, reward):
-        self.rewards.append(reward)
+    def _swap(self):
+        """채워진 버퍼를 떼어내고 새 버퍼로 교체 (lock을 잡은 상태에서 호출)"""
+        if self._size == 0:
+            return None
+        chunk = (self._buffer, self._size)
+        self._buffer = self._new_buffer()
+        self._size = 0
+        return chunk
+
+    def log(self, episode, order_id, reward, action=-1, leadtime=float("nan"), sim_time=float("nan")):
+        """
+        완료 오더 한 건 기록
+        :param action: 할당한 행동 인덱스 (모르면 -1)
+        :param leadtime: 리드타임 (초)
+        :param sim_time: 완료를 확인한 시뮬레이션 시각
+        """
+        self.stats.update(reward)
+        episode_stats = self.episode_stats.get(episode)
+        if episode_stats is None:
+            episode_stats = self.episode_stats[episode] = RunningStats()
+        episode_stats.update(reward)
+        self.reward_curve.add(reward)
+
+        with self._lock:
+            buf, i = self._buffer, self._size
+            buf["episode"][i] = episode
+            buf["order_id"][i] = order_id
+            buf["action"][i] = action
+            buf["reward"][i] = reward
+            buf["leadtime"][i] = leadtime
+            buf["wall_time"][i] = time.perf_counter() - self._start_time
+            buf["sim_time"][i] = sim_time
+            self._size += 1
+            if self._size == self.flush_rows:
+                self._queue.put(self._swap())
+
+    def _flush_loop(self):
+        while True:
+            try:
+                chunk = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self.flush()  # 시간 기준 기록: 덜 찬 버퍼도 내보냄
+                continue
+            if chunk is not _STOP:
+                try:
+                    self._write_chunk(*chunk)
+                except Exception as e:
+                    # 디스크 부족 / 파일 잠금 등: 스레드는 유지하고 (대기 중인 sync가 멈추지 않도록) 오류를 보관
+                    if self._error is None:
+                        self._error = e
+                    self.log_text(f"⚠ 로그 기록 실패 ({chunk[1]}행 유실): {e!r}")
+            self._queue.task_done()
+            if chunk is _STOP:
+                break
+
+    def _write_chunk(self, buf, n):
+        columns = {name: buf[name][:n] for name, _ in LOG_COLUMNS}
+        columns["order_id"] = columns["order_id"].astype(str)
+        path = os.path.join(self.columns_dir, f"part-{self._chunk_index:05d}.npz")
+        np.savez(path, **columns)
+        self._chunk_index += 1
 
         with open(self.log_path, "a") as f:
-            f.write(f"{episode},{order_id},{reward}\n")
+            f.writelines(f"{episode},{order_id},{reward}\n"
+                         for episode, order_id, reward in zip(columns["episode"], columns["order_id"],
+                                                              buf["reward"][:n].tolist()))
+
+    def flush(self):
+        """버퍼에 남은 기록을 기록 대기열에 넣음 (교체와 대기열 추가를 lock 안에서 함께 수행해 순서 보장)"""
+        with self._lock:
+            chunk = self._swap()
+            if chunk is not None:
+                self._queue.put(chunk)
+
+    def sync(self):
+        """
+        지금까지의 기록을 모두 파일에 쓴 뒤 기록 위치 반환 (체크포인트용)
+        :return: rewind에 넘길 위치 dict
+        """
+        self.flush()
+        self._queue.join()
+        self._raise_write_error()
+        return {"log_bytes": os.path.getsize(self.log_path), "chunks": self._chunk_index}
+
+    def rewind(self, position):
+        """
+        sync 이후에 쓴 기록을 지움 (체크포인트 재개 시 마지막 체크포인트 뒤의 중복 기록 제거)
+        :param position: sync가 반환한 위치
+        """
+        with open(self.log_path, "r+") as f:
+            f.truncate(position["log_bytes"])
+        for part in glob.glob(os.path.join(self.columns_dir, "part-*.npz")):
+            if int(os.path.basename(part)[5:-4]) >= position["chunks"]:
+                os.remove(part)
+        self._chunk_index = position["chunks"]
+
+    def close(self):
+        """남은 기록을 모두 쓰고 백그라운드 스레드 종료"""
+        if not self._thread.is_alive():
+            return
+        self.flush()
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._raise_write_error()
+
+    def _raise_write_error(self):
+        if self._error is not None:
+            raise RuntimeError(f"Writing log records to {self.save_dir} failed.") from self._error
+
+    def episode_summary(self, episode):
+        """에피소드 보상 누적 통계 요약 문자열"""
+        stats = self.episode_stats.get(episode)
+        if stats is None:
+            return "no completed orders"
+        return f"orders={stats.count}, mean reward={stats.mean:.2f}, min={stats.min:.2f}, max={stats.max:.2f}"
+
+    # ─── Text & Graph ───
 
     def log_text(self, message: str):
         print(message)
@@ -28,19 +219,10 @@ class Logger:
             self.gui_callback(message)
 
     def save_graph(self):
-        if not self.rewards:
+        self.close()
+        if self.reward_curve.count == 0:
             return
-
-        filepath = os.path.join(self.save_dir, "reward_graph.png")
-        plt.figure(figsize=(6, 3))
-        plt.plot(self.rewards)
-        plt.xlabel("Step")
-        plt.ylabel("Reward")
-        plt.title("Training Reward")
-        plt.grid(True)
-        plt.tight_layout()
-        plt.savefig(filepath)
-        plt.close()
+        self.reward_curve.save_png(os.path.join(self.save_dir, "reward_graph.png"))
 
     def get_save_dir(self):
         return self.save_dir
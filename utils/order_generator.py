@@ -1,32 +1,159 @@
+import numpy as np
 import pandas as pd
-import random
+
+ARRIVAL_PROCESSES = ("poisson", "bursty")
+
 
 class OrderGenerator:
-    def __init__(self, csv_path="data/order_table.csv", seed=None):
-        self.order_table = pd.read_csv(csv_path)
-        self.available_indices = list(self.order_table.index)
+    """
+    오더 생성기
+    - CSV는 열 단위 청크로 읽어 wip_id / order_rack / order_pos를 압축 배열로 보관
+      (order_rack은 범주 코드 + 이름 목록)
+    - 순서 섞기와 합성 오더 생성은 전역 random이 아닌 전용 numpy.random.Generator 사용
+    - arrival_process를 지정하면 오더마다 도착 시각(arrival_time)을 부여하며, CSV 없이 합성 오더북도 생성
+    """
+    def __init__(self, csv_path="data/order_table.csv", seed=None, chunksize=100000,
+                 arrival_process=None, num_orders=100, mean_interval=200.0, burst_factor=5.0,
+                 burst_switch_prob=0.1, racks=("rack1", "rack2", "rack3", "rack4"), num_positions=160):
+        """
+        :param csv_path: 오더 테이블 CSV 경로 (None이면 합성 오더북, arrival_process 필요)
+        :param seed: 전용 난수 생성기 시드
+        :param chunksize: CSV를 읽을 때의 청크 행 수
+        :param arrival_process: None, "poisson" 또는 "bursty"
+        :param num_orders: 합성 오더북 크기
+        :param mean_interval: 평균 도착 간격 (초)
+        :param burst_factor: bursty 모드에서 burst 구간의 도착률 배수
+        :param burst_switch_prob: bursty 모드에서 도착마다 평상 / burst 상태가 바뀔 확률
+        :param racks: 합성 오더의 rack 후보
+        :param num_positions: 합성 오더의 order_pos 범위 (0 ~ num_positions-1)
+        """
+        if arrival_process is not None and arrival_process not in ARRIVAL_PROCESSES:
+            raise ValueError(f"Unknown arrival process '{arrival_process}'. Choose one of {ARRIVAL_PROCESSES}.")
+        if csv_path is None and arrival_process is None:
+            raise ValueError("csv_path or arrival_process is required.")
+
+        self._rng = np.random.default_rng(seed)
+        self.arrival_process = arrival_process
+        self.mean_interval = mean_interval
+        self.burst_factor = burst_factor
+        self.burst_switch_prob = burst_switch_prob
+
+        self._synthetic = csv_path is None
+        if csv_path is not None:
+            self._load_csv(csv_path, chunksize)
+        else:
+            self._generate_book(num_orders, racks, num_positions)
+
+        self.reset()
+
+    # ─── Order Book ───
+
+    def _load_csv(self, csv_path, chunksize):
+        ids, rack_codes, positions = [], [], []
+        self.rack_names = []
+        rack_lookup = {}
+        reader = pd.read_csv(csv_path, usecols=["wip_id", "order_rack", "order_pos"],
+                             dtype={"wip_id": str, "order_rack": str, "order_pos": np.int32},
+                             chunksize=chunksize)
+        for chunk in reader:
+            ids.append(chunk["wip_id"].to_numpy(dtype=str))
+            names, inverse = np.unique(chunk["order_rack"].to_numpy(dtype=str), return_inverse=True)
+            for name in names:
+                if name not in rack_lookup:
+                    rack_lookup[name] = len(self.rack_names)
+                    self.rack_names.append(str(name))
+            mapping = np.array([rack_lookup[name] for name in names], dtype=np.int16)
+            rack_codes.append(mapping[inverse])
+            positions.append(chunk["order_pos"].to_numpy(dtype=np.int32))
+
+        self.order_ids = np.concatenate(ids) if ids else np.array([], dtype=str)
+        self.rack_codes = np.concatenate(rack_codes) if rack_codes else np.array([], dtype=np.int16)
+        self.order_pos = np.concatenate(positions) if positions else np.array([], dtype=np.int32)
+
+    def _generate_book(self, num_orders, racks, num_positions):
+        width = len(str(num_orders))
+        self.order_ids = np.array([f"S{i:0{width}d}" for i in range(1, num_orders + 1)])
+        self.rack_names = list(racks)
+        self.rack_codes = self._rng.integers(0, len(racks), num_orders).astype(np.int16)
+        self.order_pos = self._rng.integers(0, num_positions, num_orders).astype(np.int32)
 
-        if seed is not None:
-            random.seed(seed)
+    def _draw_arrivals(self, n):
+        """오더 n개의 누적 도착 시각 생성"""
+        if self.arrival_process == "poisson":
+            intervals = self._rng.exponential(self.mean_interval, n)
+        else:
+            # 2-상태 Markov-modulated Poisson: 도착마다 일정 확률로 평상 / burst 상태 전환
+            switches = self._rng.random(n) < self.burst_switch_prob
+            bursting = np.cumsum(switches) % 2 == 1
+            scale = np.where(bursting, self.mean_interval / self.burst_factor, self.mean_interval)
+            intervals = self._rng.exponential(scale)
+        return np.cumsum(intervals)
 
-        random.shuffle(self.available_indices)
+    # ─── Serving ───
+
+    def _make_order(self, idx):
+        order = {
+            "order_id": str(self.order_ids[idx]),
+            "order_rack": self.rack_names[self.rack_codes[idx]],
+            "order_pos": int(self.order_pos[idx]),
+            "row": int(idx)     # 오더 테이블 행 번호 (StateEncoder의 미리 인코딩된 픽업 위치 조회용)
+        }
+        if self._arrivals is not None:
+            order["arrival_time"] = float(self._arrivals[self._cursor])
+        return order
 
     def generate_order(self):
-        if not self.available_indices:
+        if not self.has_next():
             raise Exception("All orders have been used.")
 
-        idx = self.available_indices.pop()
-        row = self.order_table.loc[idx]
+        order = self._make_order(self._sequence[self._cursor])
+        self._cursor += 1
+        return order
 
-        return {
-            "order_id": row["wip_id"],
-            "order_rack": row["order_rack"],       # 문자열 그대로 사용
-            "order_pos": row["order_pos"]     # 정수 그대로 사용
-        }
+    def generate_batch(self, n):
+        """
+        최대 n개의 오더를 한 번에 반환
+        :return: 오더 dict 리스트 (남은 오더가 n개보다 적으면 남은 만큼)
+        """
+        if not self.has_next():
+            raise Exception("All orders have been used.")
+        return [self.generate_order() for _ in range(min(n, len(self._sequence) - self._cursor))]
+
+    def pickup_columns(self):
+        """오더 테이블 전체의 (rack 이름 목록, 행별 rack 코드, 행별 order_pos) 반환 (상태 인코더 사전 변환용)"""
+        return self.rack_names, self.rack_codes, self.order_pos
 
     def reset(self):
-        self.available_indices = list(self.order_table.index)
-        random.shuffle(self.available_indices)
+        """오더 순서를 새로 섞고, 도착 과정이 있으면 도착 시각도 새로 생성"""
+        self._sequence = self._rng.permutation(len(self.order_ids))
+        self._cursor = 0
+        self._arrivals = self._draw_arrivals(len(self.order_ids)) if self.arrival_process else None
 
     def has_next(self):
-        return bool(self.available_indices)
\ No newline at end of file
+        return self._cursor < len(self._sequence)
+
+    def get_state(self):
+        """
+        체크포인트용 진행 상태 (순서, 위치, 도착 시각, 난수 생성기 상태)
+        합성 오더북은 시드 없이 다시 만들 수 없으므로 오더북도 포함
+        """
+        state = {"sequence": self._sequence, "cursor": self._cursor, "arrivals": self._arrivals,
+                 "rng": self._rng.bit_generator.state}
+        if self._synthetic:
+            state["book"] = (self.order_ids, self.rack_names, self.rack_codes, self.order_pos)
+        return state
+
+    def set_state(self, state):
+        if "book" in state:
+            self.order_ids, self.rack_names, self.rack_codes, self.order_pos = state["book"]
+        if len(state["sequence"]) != len(self.order_ids):
+            raise ValueError(f"Checkpoint covers {len(state['sequence'])} orders but the order table has "
+                             f"{len(self.order_ids)}.")
+        self._sequence = state["sequence"]
+        self._cursor = state["cursor"]
+        self._arrivals = state["arrivals"]
+        self._rng.bit_generator.state = state["rng"]
+
+    def progress(self):
+        """이번 순서에서 사용한 오더 비율 (0.0 ~ 1.0)"""
+        return self._cursor / len(self._sequence) if len(self._sequence) else 1.0
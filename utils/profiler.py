@@ -0,0 +1,129 @@
+import os
+import json
+import math
+import time
+import functools
+
+# 지연 시간 히스토그램: 1µs 단위 log2 구간 (0: <2µs, 1: <4µs, ..., 마지막: 약 67초 이상)
+NUM_BUCKETS = 27
+
+enabled = False
+
+# 키별 누적 통계: key → [count, total, max, histogram]
+_stats = {}
+
+
+def enable(flag=True):
+    """계측 활성화 (비활성 상태에서는 각 계측 지점이 플래그 확인 한 번만 수행)"""
+    global enabled
+    enabled = flag
+
+
+def reset():
+    _stats.clear()
+
+
+def record(key, elapsed):
+    """
+    :param key: 계측 이름 (예: "com.get_value:isDone", "env.get_states", "agent.update")
+    :param elapsed: 소요 시간 (초)
+    """
+    stats = _stats.get(key)
+    if stats is None:
+        stats = _stats[key] = [0, 0.0, 0.0, [0] * NUM_BUCKETS]
+    stats[0] += 1
+    stats[1] += elapsed
+    if elapsed > stats[2]:
+        stats[2] = elapsed
+    bucket = math.frexp(elapsed * 1e6)[1] - 1 if elapsed >= 1e-6 else 0
+    stats[3][min(max(bucket, 0), NUM_BUCKETS - 1)] += 1
+
+
+class span:
+    """with span(key): ... 구간의 소요 시간 기록 (enabled일 때만 사용)"""
+    __slots__ = ("key", "start")
+
+    def __init__(self, key):
+        self.key = key
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.key, time.perf_counter() - self.start)
+        return False
+
+
+def profiled(key):
+    """메서드 / 함수 데코레이터: 호출마다 key로 소요 시간 기록"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(key, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+# ─── Aggregation & Export ───
+
+def get_stats():
+    """키별 통계 사본 {key: {"count", "total", "max", "histogram"}}"""
+    return {key: {"count": c, "total": t, "max": m, "histogram": list(h)} for key, (c, t, m, h) in _stats.items()}
+
+
+def merge(stats):
+    """다른 프로세스(벡터 환경 워커 등)에서 수집한 get_stats() 결과를 합산"""
+    for key, other in stats.items():
+        mine = _stats.get(key)
+        if mine is None:
+            mine = _stats[key] = [0, 0.0, 0.0, [0] * NUM_BUCKETS]
+        mine[0] += other["count"]
+        mine[1] += other["total"]
+        mine[2] = max(mine[2], other["max"])
+        mine[3] = [a + b for a, b in zip(mine[3], other["histogram"])]
+
+
+def _percentile(histogram, count, q):
+    """히스토그램 구간 상한으로 근사한 분위수 (초)"""
+    target = q * count
+    seen = 0
+    for bucket, n in enumerate(histogram):
+        seen += n
+        if seen >= target:
+            return 2.0 ** (bucket + 1) * 1e-6
+    return 2.0 ** NUM_BUCKETS * 1e-6
+
+
+def summarize(top=15):
+    """총 소요 시간 기준 상위 계측 지점 요약 문자열"""
+    rows = sorted(_stats.items(), key=lambda item: item[1][1], reverse=True)[:top]
+    if not rows:
+        return ""
+    lines = [f"{'key':<44} {'count':>8} {'total(s)':>10} {'mean(ms)':>10} {'p50(ms)':>9} {'p99(ms)':>9} {'max(ms)':>9}"]
+    for key, (count, total, max_, histogram) in rows:
+        lines.append(f"{key:<44} {count:>8} {total:>10.3f} {total / count * 1e3:>10.3f} "
+                     f"{_percentile(histogram, count, 0.5) * 1e3:>9.3f} "
+                     f"{_percentile(histogram, count, 0.99) * 1e3:>9.3f} {max_ * 1e3:>9.3f}")
+    return "\n".join(lines)
+
+
+def export(save_dir, top=15):
+    """
+    결과 폴더에 profile.json (전체 통계 + 히스토그램)과 profile_summary.txt (상위 hot spot) 저장
+    :return: 요약 문자열 (계측 결과가 없으면 빈 문자열)
+    """
+    if not _stats:
+        return ""
+    with open(os.path.join(save_dir, "profile.json"), "w") as f:
+        json.dump({"bucket_unit_us": 1, "buckets": "log2", "stats": get_stats()}, f, indent=1)
+    summary = summarize(top)
+    with open(os.path.join(save_dir, "profile_summary.txt"), "w", encoding="utf-8") as f:
+        f.write(summary + "\n")
+    return summary
@@ -0,0 +1,105 @@
+import threading
+
+import numpy as np
+from matplotlib.figure import Figure
+
+
+class RewardCurve:
+    """
+    보상 곡선의 다중 해상도 집계
+    - 최대 max_buckets개의 구간에 min / max / 합 / 개수만 유지
+    - 구간이 모두 차면 인접한 두 구간을 합쳐 해상도를 절반으로 낮춤 (구간 폭 2배)
+      → 점 하나당 분할 상환 O(1), 메모리와 그리기 비용은 실행 길이와 무관하게 고정
+    - 학습 스레드의 add와 GUI 스레드의 snapshot이 동시에 호출될 수 있어 lock으로 보호
+    """
+    def __init__(self, max_buckets=1024):
+        """
+        :param max_buckets: 유지할 최대 구간 수 (짝수)
+        """
+        if max_buckets < 2 or max_buckets % 2:
+            raise ValueError("max_buckets must be an even number >= 2.")
+        self.max_buckets = max_buckets
+        self.width = 1          # 구간 하나에 들어가는 점 수
+        self.count = 0
+        self.version = 0        # 값이 추가될 때마다 증가 (GUI 재그리기 판단용)
+        self._mins = np.full(max_buckets, np.inf)
+        self._maxs = np.full(max_buckets, -np.inf)
+        self._sums = np.zeros(max_buckets)
+        self._counts = np.zeros(max_buckets, dtype=np.int64)
+        self._lock = threading.Lock()
+
+    def add(self, value):
+        with self._lock:
+            bucket = self.count // self.width
+            if bucket == self.max_buckets:
+                self._halve()
+                bucket = self.count // self.width
+            if value < self._mins[bucket]:
+                self._mins[bucket] = value
+            if value > self._maxs[bucket]:
+                self._maxs[bucket] = value
+            self._sums[bucket] += value
+            self._counts[bucket] += 1
+            self.count += 1
+            self.version += 1
+
+    def _halve(self):
+        """인접한 두 구간을 하나로 합쳐 앞쪽 절반에 저장"""
+        half = self.max_buckets // 2
+        self._mins[:half] = np.minimum(self._mins[0::2], self._mins[1::2])
+        self._maxs[:half] = np.maximum(self._maxs[0::2], self._maxs[1::2])
+        self._sums[:half] = self._sums[0::2] + self._sums[1::2]
+        self._counts[:half] = self._counts[0::2] + self._counts[1::2]
+        self._mins[half:] = np.inf
+        self._maxs[half:] = -np.inf
+        self._sums[half:] = 0
+        self._counts[half:] = 0
+        self.width *= 2
+
+    def snapshot(self):
+        """
+        :return: (step, mean, min, max) 배열 튜플. step은 각 구간의 중심 스텝 번호
+        """
+        with self._lock:
+            n = -(-self.count // self.width)  # 채워진(일부 포함) 구간 수
+            counts = self._counts[:n]
+            steps = np.arange(n) * self.width + (counts - 1) / 2
+            return steps, self._sums[:n] / counts, self._mins[:n].copy(), self._maxs[:n].copy()
+
+    def get_state(self):
+        """체크포인트용 집계 상태"""
+        with self._lock:
+            return {"width": self.width, "count": self.count, "mins": self._mins.copy(), "maxs": self._maxs.copy(),
+                    "sums": self._sums.copy(), "counts": self._counts.copy()}
+
+    def set_state(self, state):
+        if len(state["sums"]) != self.max_buckets:
+            raise ValueError(f"Checkpoint curve has {len(state['sums'])} buckets; expected {self.max_buckets}.")
+        with self._lock:
+            self.width = state["width"]
+            self.count = state["count"]
+            self._mins[:] = state["mins"]
+            self._maxs[:] = state["maxs"]
+            self._sums[:] = state["sums"]
+            self._counts[:] = state["counts"]
+            self.version += 1
+
+    def plot(self, ax):
+        """구간 평균 선과 min~max 범위를 ax에 그림"""
+        steps, means, mins, maxs = self.snapshot()
+        ax.clear()
+        if len(steps):
+            if self.width > 1:
+                ax.fill_between(steps, mins, maxs, alpha=0.25, linewidth=0)
+            ax.plot(steps, means, linewidth=1)
+        ax.set_xlabel("Step")
+        ax.set_ylabel("Reward")
+        ax.set_title("Training Reward")
+        ax.grid(True)
+
+    def save_png(self, filepath):
+        """집계값으로 그래프 이미지 저장 (원본 보상 목록 불필요)"""
+        fig = Figure(figsize=(6, 3))
+        self.plot(fig.add_subplot())
+        fig.tight_layout()
+        fig.savefig(filepath)
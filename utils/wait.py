@@ -0,0 +1,79 @@
+import time
+
+from utils import profiler
+
+# 시뮬레이터 대기의 기본 최대 시간 (초)
+DEFAULT_WAIT_TIMEOUT = 600.0
+
+# 대기 이름별 누적 통계: name → {"count", "total", "max", "timeouts"}
+_wait_stats = {}
+
+
+def wait_until(predicate, timeout=None, name="wait", initial_interval=0.0005, max_interval=0.25,
+               backoff=2.0, pump=None):
+    """
+    조건이 참이 될 때까지 지수 백오프로 대기하는 공용 대기 함수
+    - 첫 확인은 즉시, 이후 initial_interval부터 max_interval까지 간격을 늘려가며 재확인
+    - pump가 주어지면 매 확인 전에 호출 (COM 이벤트 메시지 처리 등)
+    :param predicate: 인자 없는 조건 함수
+    :param timeout: 최대 대기 시간 (초, None이면 무제한)
+    :param name: 통계 집계용 대기 이름
+    :param initial_interval: 첫 재확인 간격 (초)
+    :param max_interval: 재확인 간격 상한 (초)
+    :param backoff: 간격 증가 배율
+    :param pump: (선택적) 매 확인 전에 호출할 함수
+    :return: 조건이 충족되면 True, timeout이 지나면 False
+    """
+    start = time.perf_counter()
+    deadline = None if timeout is None else start + timeout
+    interval = initial_interval
+    satisfied = False
+    slept = 0.0
+    while True:
+        if pump is not None:
+            pump()
+        if predicate():
+            satisfied = True
+            break
+        now = time.perf_counter()
+        if deadline is not None and now >= deadline:
+            break
+        sleep_for = interval if deadline is None else min(interval, deadline - now)
+        time.sleep(sleep_for)
+        slept += sleep_for
+        interval = min(interval * backoff, max_interval)
+
+    elapsed = time.perf_counter() - start
+    _record(name, elapsed, timed_out=not satisfied)
+    if profiler.enabled:
+        profiler.record(f"wait.{name}", elapsed)
+        profiler.record(f"sleep.{name}", slept)
+    return satisfied
+
+
+def _record(name, elapsed, timed_out=False):
+    stats = _wait_stats.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+    stats["count"] += 1
+    stats["total"] += elapsed
+    stats["max"] = max(stats["max"], elapsed)
+    if timed_out:
+        stats["timeouts"] += 1
+
+
+def get_wait_stats():
+    """대기 이름별 누적 통계 사본 반환"""
+    return {name: dict(stats) for name, stats in _wait_stats.items()}
+
+
+def reset_wait_stats():
+    _wait_stats.clear()
+
+
+def format_wait_stats():
+    """대기 시간 통계를 로그용 문자열로 변환 (총 대기 시간 내림차순)"""
+    lines = []
+    for name, s in sorted(_wait_stats.items(), key=lambda item: item[1]["total"], reverse=True):
+        mean = s["total"] / s["count"] if s["count"] else 0.0
+        lines.append(f"  {name}: count={s['count']}, total={s['total']:.3f}s, "
+                     f"mean={mean * 1000:.1f}ms, max={s['max'] * 1000:.1f}ms, timeouts={s['timeouts']}")
+    return "\n".join(lines)